@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import pkgutil
 from collections import defaultdict
-from pathlib import Path
+from operator import itemgetter
 
 import yaml
 
@@ -16,10 +16,37 @@ from prospector.message import Message
 
 __all__ = (
     "BLEND_COMBOS",
+    "BLEND_INDEX",
+    "BlendIndex",
     "blend",
 )
 
 
+class BlendIndex:
+    """
+    The combinations of messages to blend, indexed by message: for each (tool, code)
+    pair, the combinations it is part of, along with its priority in each of them, the
+    lowest first. Blending then only needs one lookup per message.
+    """
+
+    def __init__(self, blend_combos: list[list[tuple[str, str]]]) -> None:
+        self.blend_combos = blend_combos
+        self.positions: dict[tuple[str, str], list[tuple[int, int]]] = {}
+        for blend_combo_idx, blend_combo in enumerate(blend_combos):
+            # a pair listed twice in a combination has the priority of its first listing
+            priorities: dict[tuple[str, str], int] = {}
+            for priority, key in enumerate(blend_combo):
+                priorities.setdefault(key, priority)
+            for key, priority in priorities.items():
+                self.positions.setdefault(key, []).append((blend_combo_idx, priority))
+
+
+def _get_index(blend_combos: list[list[tuple[str, str]]] | None) -> BlendIndex:
+    if not blend_combos or blend_combos is BLEND_COMBOS:
+        return BLEND_INDEX
+    return BlendIndex(blend_combos)
+
+
 def blend_line(messages: list[Message], blend_combos: list[list[tuple[str, str]]] | None = None) -> list[Message]:
     """
     Given a list of messages on the same line, blend them together so that we
@@ -27,69 +54,65 @@ def blend_line(messages: list[Message], blend_combos: list[list[tuple[str, str]]
     more than one message here if there are two or more different errors for
     the line.
     """
-    blend_combos = blend_combos or BLEND_COMBOS
-    blend_lists: list[list[Message]] = [[] for _ in range(len(blend_combos))]
+    return _blend_line(messages, _get_index(blend_combos))
+
+
+def _blend_line(messages: list[Message], index: BlendIndex) -> list[Message]:
+    # the messages which can be blended together, with their priority, by combination
+    blend_lists: dict[int, list[tuple[int, Message]]] = {}
     blended: list[Message] = []
 
     # first we split messages into each of the possible blendable categories
     # so that we have a list of lists of messages which can be blended together
     for message in messages:
-        key = (message.source, message.code)
-        found = False
-        for blend_combo_idx, blend_combo in enumerate(blend_combos):
-            if key in blend_combo:
-                found = True
-                blend_lists[blend_combo_idx].append(message)
-
-        # note: we use 'found=True' here rather than a simple break/for-else
-        # because this allows the same message to be put into more than one
-        # 'bucket'. This means that the same message from pycodestyle can 'subsume'
-        # two from pylint, for example.
-
-        if not found:
+        positions = index.positions.get((message.source, message.code))
+        if positions is None:
             # if we get here, then this is not a message which can be blended,
             # so by definition is already blended
             blended.append(message)
+            continue
+
+        # note: the same message can be put into more than one 'bucket'. This
+        # means that the same message from pycodestyle can 'subsume' two from
+        # pylint, for example.
+        for blend_combo_idx, priority in positions:
+            blend_lists.setdefault(blend_combo_idx, []).append((priority, message))
 
     # we should now have a list of messages which all represent the same
-    # problem on the same line, so we will sort them according to the priority
-    # in BLEND and pick the first one
-    for blend_combo_idx, blend_list in enumerate(blend_lists):
-        if len(blend_list) == 0:
-            continue
-        # pylint:disable=cell-var-from-loop
-        blend_list.sort(
-            key=lambda msg: blend_combos[blend_combo_idx].index(
-                (msg.source, msg.code),
-            ),
-        )
-        if blend_list[0] not in blended:
+    # problem on the same line, so we pick the one with the highest priority
+    # in BLEND, the first one listed if several have the same
+    added = {(message.location, message.code) for message in blended}
+    used: set[int] = set()
+    for blend_combo_idx in sorted(blend_lists):
+        blend_list = blend_lists[blend_combo_idx]
+        chosen = min(blend_list, key=itemgetter(0))[1]
+        if (chosen.location, chosen.code) not in added:
             # We may have already added this message if it represents
             # several messages in other tools which are not being run -
             # for example, pylint missing-docstring is blended with pydocstyle
             # D100, D101 and D102, but should not appear 3 times!
-            blended.append(blend_list[0])
+            added.add((chosen.location, chosen.code))
+            blended.append(chosen)
 
         # Some messages from a tool point out an error that in another tool is handled by two
         # different errors or more. For example, pylint emits the same warning (multiple-statements)
         # for "two statements on a line" separated by a colon and a semi-colon, while pycodestyle has E701
         # and E702 for those cases respectively. In this case, the pylint error will not be 'blended' as
-        # it will appear in two blend_lists. Therefore we mark anything not taken from the blend list
+        # it will appear in two blend_lists. Therefore we note anything not taken from the blend list
         # as "consumed" and then filter later, to avoid such cases.
-        for now_used in blend_list[1:]:
-            now_used.used = True  # type: ignore[attr-defined]
+        used.update(id(message) for _, message in blend_list if message is not chosen)
 
-    return [m for m in blended if not getattr(m, "used", False)]
+    return [m for m in blended if id(m) not in used]
 
 
 def blend(messages: list[Message], blend_combos: list[list[tuple[str, str]]] | None = None) -> list[Message]:
-    blend_combos = blend_combos or BLEND_COMBOS
+    index = _get_index(blend_combos)
 
     # group messages by file and then line number
-    msgs_grouped: dict[Path | None, dict[int | None, list[Message]]] = defaultdict(lambda: defaultdict(list))
+    msgs_grouped: dict[int | None, dict[int | None, list[Message]]] = defaultdict(lambda: defaultdict(list))
 
     for message in messages:
-        msgs_grouped[message.location.path][message.location.line].append(
+        msgs_grouped[message.location.path_id][message.location.line].append(
             message,
         )
 
@@ -97,7 +120,7 @@ def blend(messages: list[Message], blend_combos: list[list[tuple[str, str]]] | N
     out = []
     for by_line in msgs_grouped.values():
         for messages_on_line in by_line.values():
-            out += blend_line(messages_on_line, blend_combos)
+            out += _blend_line(messages_on_line, index)
 
     return out
 
@@ -119,3 +142,4 @@ def get_default_blend_combinations() -> list[list[tuple[str, str]]]:
 
 
 BLEND_COMBOS = get_default_blend_combinations()
+BLEND_INDEX = BlendIndex(BLEND_COMBOS)
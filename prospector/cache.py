@@ -0,0 +1,286 @@
+"""
+A persistent, on-disk cache of the messages found by tools which check files one at a
+time (see ``ToolBase.file_scope``).
+
+For every tool there is a store of ``path -> (content hash, messages)`` entries. The
+store belongs to a fingerprint of everything else which can change what the tool
+finds: its version, the resolved profile and any external configuration files. When
+the fingerprint changes, a new store is started; when a file changes, its content
+hash no longer matches and it is checked again. Only the files whose entries are
+missing or stale are handed to the tool.
+
+Pylint, which looks at the modules a module imports, keeps a store of its own (see
+``prospector.tools.pylint.module_cache``), whose entries are only valid as long as the
+module and the modules it depends on are unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import platform
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from prospector.dependencies import ImportGraph
+from prospector.exceptions import PermissionMissing
+from prospector.message import Location, Message, in_file_order
+
+if TYPE_CHECKING:
+    from prospector.config import ProspectorConfig
+    from prospector.finder import FileFinder
+    from prospector.tools.base import ToolBase
+
+__all__ = ("CACHE_DIRECTORY_NAME", "CacheLookup", "ResultCache", "dependency_digests")
+
+CACHE_DIRECTORY_NAME = ".prospector_cache"
+
+# Bump this whenever the layout of the stored entries changes
+_CACHE_FORMAT = 1
+
+# The distributions providing each tool, whose versions are part of the tool fingerprint
+_TOOL_PACKAGES = {
+    "bandit": ("bandit",),
+    "dodgy": ("dodgy",),
+    "mccabe": ("mccabe",),
+    "pycodestyle": ("pycodestyle", "pep8-naming"),
+    "pydocstyle": ("pydocstyle",),
+    "pyflakes": ("pyflakes",),
+    "pylint": ("pylint", "astroid", "pylint-celery", "pylint-django", "pylint-plugin-utils"),
+}
+
+# Configuration files the tools may read on their own, outside of the prospector profile
+_EXTERNAL_CONFIG_FILES = (
+    ".bandit",
+    ".pylintrc",
+    ".flake8",
+    ".pep8",
+    ".pycodestyle",
+    ".pydocstyle",
+    ".pydocstylerc",
+    "pylintrc",
+    "pyproject.toml",
+    "setup.cfg",
+    "tox.ini",
+)
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _source_digest(found_files: FileFinder, path: Path) -> str | None:
+    try:
+        return found_files.sources.digest(path)
+    except (OSError, PermissionMissing):
+        return None
+
+
+def dependency_digests(found_files: FileFinder) -> dict[Path, str]:
+    """
+    A hash of each python module combined with the hashes of every module of the project
+    it imports, directly or not, for the tools whose findings about a module depend on
+    the modules it imports. Modules which cannot be read are left out.
+    """
+    modules = found_files.python_modules
+    digests = {path: digest for path in modules if (digest := _source_digest(found_files, path)) is not None}
+    graph = ImportGraph(modules, read=found_files.sources.read)
+
+    combined = {}
+    for path, digest in digests.items():
+        dependencies = sorted(graph.dependencies([path]) - {path})
+        if any(dependency not in digests for dependency in dependencies):
+            continue
+        hasher = hashlib.sha256(digest.encode())
+        for dependency in dependencies:
+            hasher.update(f"\0{dependency}\0{digests[dependency]}".encode())
+        combined[path] = hasher.hexdigest()
+    return combined
+
+
+def _canonical(value: Any) -> Any:
+    # profiles build some of their lists out of sets, so their order is meaningless
+    # and can change from one run to the next
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_canonical(item) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True, default=str))
+    return value
+
+
+def _message_to_dict(message: Message) -> dict[str, Any]:
+    location = message.location
+    return {
+        "source": message.source,
+        "code": message.code,
+        "message": message.message,
+        "doc_url": message.doc_url,
+        "is_fixable": message.is_fixable,
+        "module": location.module,
+        "function": location.function,
+        "line": location.line,
+        "character": location.character,
+        "line_end": location.line_end,
+        "character_end": location.character_end,
+    }
+
+
+def _message_from_dict(path: Path, data: dict[str, Any]) -> Message:
+    location = Location(
+        path,
+        data["module"],
+        data["function"],
+        data["line"],
+        data["character"],
+        line_end=data["line_end"],
+        character_end=data["character_end"],
+    )
+    return Message(
+        data["source"],
+        data["code"],
+        location,
+        data["message"],
+        doc_url=data["doc_url"],
+        is_fixable=data["is_fixable"],
+    )
+
+
+class CacheLookup:
+    """
+    What the cache knows about the files of one tool, between looking them up and
+    storing the messages of the files which needed checking again.
+    """
+
+    def __init__(self, store_path: Path, entries: dict[str, Any], targets: list[Path]) -> None:
+        self.store_path = store_path
+        self.entries = entries
+        self.targets = targets
+        # the stored messages of the files which did not change
+        self.cached: list[Message] = []
+        # the content hash of the files which need checking again
+        self.digests: dict[Path, str | None] = {}
+
+    @property
+    def misses(self) -> list[Path]:
+        return list(self.digests)
+
+    @property
+    def hits(self) -> int:
+        return len(self.targets) - len(self.digests)
+
+
+class ResultCache:
+    def __init__(self, cache_dir: Path, prospector_config: ProspectorConfig) -> None:
+        self.cache_dir = cache_dir
+        self._config = prospector_config
+
+    def fingerprint(self, toolname: str) -> str:
+        """
+        Describe everything apart from the checked file itself which can change what
+        the tool finds in it.
+        """
+        workdir = self._config.workdir
+        configured_by = self._config.configured_by.get(toolname)
+        data = {
+            "format": _CACHE_FORMAT,
+            "prospector": _package_version("prospector"),
+            "python": platform.python_version(),
+            "tool": toolname,
+            "packages": {name: _package_version(name) for name in _TOOL_PACKAGES.get(toolname, ())},
+            "profile": self._config.profile.as_dict(),
+            "max_line_length": self._config.max_line_length,
+            "external_config": self._config.use_external_config(toolname),
+            "configured_by": str(configured_by),
+            "configured_by_digest": _file_digest(Path(configured_by)) if configured_by is not None else None,
+            "config_files": {name: _file_digest(workdir / name) for name in _EXTERNAL_CONFIG_FILES},
+        }
+        encoded = json.dumps(_canonical(data), sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def store_path(self, toolname: str) -> Path:
+        """
+        The file of the store of the tool for its current fingerprint.
+        """
+        return self.cache_dir / f"{toolname}-{self.fingerprint(toolname)}.json"
+
+    def load(self, store_path: Path) -> dict[str, Any]:
+        try:
+            with store_path.open(encoding="utf-8") as store_file:
+                entries = json.load(store_file)
+        except (OSError, ValueError):
+            # a missing or corrupted store just means everything needs checking again
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self, store_path: Path, entries: dict[str, Any]) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            gitignore = self.cache_dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text("# Automatically created by prospector.\n*\n", encoding="utf-8")
+            # write then rename, so that concurrent runs never see half a store
+            handle, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(handle, "w", encoding="utf-8") as tmp_file:
+                json.dump(entries, tmp_file)
+            os.replace(tmp_path, store_path)
+        except OSError:
+            # the cache is only an optimisation, failing to write it is not an error
+            pass
+
+    def lookup(self, toolname: str, tool: ToolBase, found_files: FileFinder) -> CacheLookup:
+        """
+        Find the stored messages of the files the tool would check, and which of the
+        files need checking again.
+        """
+        assert tool.file_scope is not None
+        targets: list[Path] = sorted(getattr(found_files, tool.file_scope))
+
+        store_path = self.store_path(toolname)
+        lookup = CacheLookup(store_path, self.load(store_path), targets)
+        for path in targets:
+            digest = _source_digest(found_files, path)
+            entry = lookup.entries.get(str(path))
+            if digest is not None and entry is not None and entry["hash"] == digest:
+                lookup.cached += [_message_from_dict(path, data) for data in entry["messages"]]
+            else:
+                lookup.digests[path] = digest
+        return lookup
+
+    def store(self, lookup: CacheLookup, messages: list[Message]) -> list[Message]:
+        """
+        Record the messages the tool found in the files which needed checking again.
+
+        :return: All the messages about the files of the lookup, the stored ones and the
+                 new ones, file by file so that the order is the same whether they come
+                 from the cache or not.
+        """
+        if lookup.digests:
+            by_path: dict[Path | None, list[Message]] = defaultdict(list)
+            for message in messages:
+                by_path[message.location.path].append(message)
+
+            for path, digest in lookup.digests.items():
+                if digest is None:
+                    continue
+                lookup.entries[str(path)] = {
+                    "hash": digest,
+                    "messages": [_message_to_dict(message) for message in by_path.get(path, [])],
+                }
+            self.save(lookup.store_path, lookup.entries)
+
+        return in_file_order(lookup.targets, lookup.cached + messages)
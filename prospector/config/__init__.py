@@ -17,13 +17,15 @@ except ImportError:
 
 import contextlib
 
-from prospector import tools
+from prospector import daemon, tools, tracing
 from prospector.autodetect import autodetect_libraries
-from prospector.compat import is_relative_to
+from prospector.cache import CACHE_DIRECTORY_NAME
 from prospector.config import configuration as cfg
+from prospector.exclusion import ExclusionFilter
 from prospector.message import Message
 from prospector.profiles import AUTO_LOADED_PROFILES
 from prospector.profiles.profile import BUILTIN_PROFILE_PATH, CannotParseProfile, ProfileNotFound, ProspectorProfile
+from prospector.timing import Measurement, measure
 from prospector.tools import DEFAULT_TOOLS, DEPRECATED_TOOL_NAMES
 
 
@@ -36,44 +38,36 @@ class ProspectorConfig:
 
     def __init__(self, workdir: Path | None = None):
         self.config, self.arguments = self._configure_prospector()
+        if self.config.trace_out is not None:
+            # as soon as it is known to be wanted, so that loading the profile is part of the trace
+            tracing.start()
         self.paths = self._get_work_path(self.config, self.arguments)
         self.explicit_file_mode = all(p.is_file for p in self.paths)
         self.workdir = workdir or Path.cwd()
 
-        self.profile, self.strictness = self._get_profile(self.workdir, self.config)
+        with tracing.span("load profile", "config"):
+            self.profile, self.strictness = self._get_profile(self.workdir, self.config)
         self.libraries = self._find_used_libraries(self.config, self.profile)
         self.tools_to_run = self._determine_tool_runners(self.config, self.profile)
-        self.ignores = self._determine_ignores(self.config, self.profile, self.libraries)
+        self.ignore_patterns = self._determine_ignore_patterns(self.config, self.profile, self.libraries)
+        self.ignore_paths = self._determine_ignore_paths(self.config, self.profile)
+        self.ignores = self._determine_ignores(self.ignore_patterns, self.ignore_paths)
         self.configured_by: dict[str, str | Path | None] = {}
+        self.configure_timings: dict[str, Measurement] = {}
         self.messages: list[Message] = []
 
     def make_exclusion_filter(self) -> Callable[[Path], bool]:
-        # Only close over the attributes required by the filter, rather
-        # than the entire self, because ProspectorConfig can't be pickled
-        # because of the config attribute, which would break parallel
-        # pylint.
-        ignores, workdir = self.ignores, self.workdir
-
-        def _filter(path: Path) -> bool:
-            for ignore in ignores:
-                # first figure out where the path is, relative to the workdir
-                # ignore-paths/patterns will usually be relative to a repository
-                # root or the CWD, but the path passed to prospector may not be
-                path = path.resolve().absolute()
-                if is_relative_to(path, workdir):
-                    path = path.relative_to(workdir)
-                if ignore.match(str(path)):
-                    return True
-            return False
-
-        return _filter
+        return ExclusionFilter(self.workdir, self.ignore_patterns, self.ignore_paths)
 
     def get_tools(self, found_files: FileFinder) -> list[tools.ToolBase]:
         self.configured_by = {}
+        self.configure_timings = {}
         runners = []
         for tool_name in self.tools_to_run:
             tool = tools.TOOLS[tool_name]()
-            config_result = tool.configure(self, found_files)
+            with measure() as timing, tracing.span(f"{tool_name} configure", "tool"):
+                config_result = tool.configure(self, found_files)
+            self.configure_timings[tool_name] = timing
             messages: list[Message] = []
             configured_by = None
             if config_result is not None:
@@ -270,7 +264,7 @@ Search path: {search_path}, or in module 'prospector_profile_{module_name}'
 
         return sorted(to_run)
 
-    def _determine_ignores(
+    def _determine_ignore_patterns(
         self, config: setoptconf.config.Configuration, profile: ProspectorProfile, libraries: list[str]
     ) -> list[re.Pattern[str]]:
         # Grab ignore patterns from the options
@@ -285,20 +279,28 @@ Search path: {search_path}, or in module 'prospector_profile_{module_name}'
             with contextlib.suppress(sre_constants.error):
                 ignores.append(re.compile(pattern))
 
-        # Convert ignore paths into patterns
-        boundary = r"(^|/|\\)%s(/|\\|$)"
-        for ignore_path in config.ignore_paths + profile.ignore_paths:
-            ignore_path = str(ignore_path)
-            if ignore_path.endswith(("/", "\\")):
-                ignore_path = ignore_path[:-1]
-            ignores.append(re.compile(boundary % re.escape(ignore_path)))
-
         # some libraries have further automatic ignores
         if "django" in libraries:
             ignores += [re.compile("(^|/)(south_)?migrations(/|$)")]
 
         return ignores
 
+    def _determine_ignore_paths(self, config: setoptconf.config.Configuration, profile: ProspectorProfile) -> list[str]:
+        ignore_paths = []
+        for ignore_path in config.ignore_paths + profile.ignore_paths:
+            ignore_path = str(ignore_path)
+            if ignore_path.endswith(("/", "\\")):
+                ignore_path = ignore_path[:-1]
+            ignore_paths.append(ignore_path)
+        return ignore_paths
+
+    def _determine_ignores(
+        self, ignore_patterns: list[re.Pattern[str]], ignore_paths: list[str]
+    ) -> list[re.Pattern[str]]:
+        # Convert ignore paths into patterns
+        boundary = r"(^|/|\\)%s(/|\\|$)"
+        return ignore_patterns + [re.compile(boundary % re.escape(ignore_path)) for ignore_path in ignore_paths]
+
     def get_summary_information(self) -> dict[str, Any]:
         return {
             "libraries": self.libraries,
@@ -330,6 +332,46 @@ Search path: {search_path}, or in module 'prospector_profile_{module_name}'
     def external_config_location(self, tool_name: str) -> Path | None:
         return getattr(self.config, f"{tool_name}_config_file", None)
 
+    @property
+    def jobs(self) -> int:
+        return self.config.jobs
+
+    @property
+    def changed_since(self) -> str | None:
+        return self.config.changed_since
+
+    @property
+    def watch(self) -> bool:
+        return self.config.watch
+
+    @property
+    def daemon(self) -> bool:
+        return self.config.daemon
+
+    @property
+    def daemon_socket(self) -> Path:
+        return Path(self.config.daemon_socket or daemon.default_socket_path())
+
+    @property
+    def cache_dir(self) -> Path | None:
+        """
+        Where to keep the result cache, or None if caching is disabled.
+        """
+        if self.config.cache_dir is not None:
+            return Path(self.config.cache_dir).absolute()
+        if self.config.cache:
+            return self.workdir / CACHE_DIRECTORY_NAME
+        return None
+
+    @property
+    def trace_out(self) -> Path | None:
+        """
+        Where to write a trace of the check, or None if it is not traced.
+        """
+        if self.config.trace_out is None:
+            return None
+        return Path(self.config.trace_out).absolute()
+
     @property
     def die_on_tool_error(self) -> bool:
         return self.config.die_on_tool_error
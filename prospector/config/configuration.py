@@ -68,9 +68,21 @@ def build_manager() -> soc.ConfigurationManager:
 
     manager.add(soc.StringSetting("path", default=None))
 
+    manager.add(soc.StringSetting("changed_since", default=None))
+
     manager.add(soc.ListSetting("ignore_patterns", soc.String, default=[]))
     manager.add(soc.ListSetting("ignore_paths", soc.String, default=[]))
 
+    manager.add(soc.IntegerSetting("jobs", default=1))
+    manager.add(soc.BooleanSetting("cache", default=False))
+    manager.add(soc.StringSetting("cache_dir", default=None))
+
+    manager.add(soc.BooleanSetting("watch", default=False))
+    manager.add(soc.BooleanSetting("daemon", default=False))
+    manager.add(soc.StringSetting("daemon_socket", default=None))
+
+    manager.add(soc.StringSetting("trace_out", default=None))
+
     manager.add(soc.BooleanSetting("die_on_tool_error", default=False))
     manager.add(soc.BooleanSetting("include_tool_stdout", default=False))
     manager.add(soc.BooleanSetting("direct_tool_stdout", default=False))
@@ -265,6 +277,14 @@ def build_command_line_source(
             " .pylintrc files in the root of the project, but you can use this option to "
             "specify manually where it is.",
         },
+        "changed_since": {
+            "flags": ["--changed-since"],
+            "help": "Only check the files which changed since the given git reference (a branch,"
+            " tag or commit), counting from where the current branch forked from it, and including"
+            " uncommitted and untracked files. Tools which look at the whole project, such as"
+            " pylint and vulture, also check the modules which import the changed ones, so that"
+            " messages depending on several modules stay correct.",
+        },
         "ignore_patterns": {
             "flags": ["-I", "--ignore-patterns"],
             "help": "A list of paths to ignore, as a list of regular"
@@ -278,6 +298,54 @@ def build_command_line_source(
             " file or directory (and all subdirectories) will be"
             " ignored.",
         },
+        "jobs": {
+            "flags": ["-j", "--jobs"],
+            "help": "The number of tools to run at the same time, each in its own process."
+            " The messages of every tool are collected and merged as usual, so the run"
+            " takes about as long as the slowest tool instead of the sum of all of them."
+            " The files of the tools which check one file at a time (pyflakes, pycodestyle,"
+            " mccabe, pydocstyle, dodgy and bandit) are also split between the processes."
+            " Use 0 to run as many as there are CPUs. Defaults to 1, running the tools"
+            " one after the other.",
+        },
+        "cache": {
+            "flags": ["--cache"],
+            "help": "Keep the messages of tools which check one file at a time (pyflakes, pycodestyle,"
+            " mccabe, pydocstyle, dodgy and bandit) in an on-disk cache, so that only files which"
+            " changed since the previous run are checked again. The cache is invalidated when the"
+            " tool version, the profile or the tool configuration changes.",
+        },
+        "cache_dir": {
+            "flags": ["--cache-dir"],
+            "help": "The directory to keep the cache in. Implies --cache. Defaults to"
+            " .prospector_cache in the project directory.",
+        },
+        "watch": {
+            "flags": ["--watch"],
+            "help": "Keep running after checking the project, and check it again each time files"
+            " change, printing the updated messages. Only the changed files, and the modules"
+            " importing them, are checked again. Stop with Ctrl-C.",
+        },
+        "daemon": {
+            "flags": ["--daemon"],
+            "help": "Do not check anything, but start a long-running server which the"
+            " prospector-client command sends its checks to. The server keeps the tools"
+            " loaded and their analysis of unchanged modules in memory, so checks sent"
+            " to it run much faster.",
+        },
+        "daemon_socket": {
+            "flags": ["--daemon-socket"],
+            "help": "The Unix socket the daemon listens on and prospector-client connects to."
+            " Can also be set with the PROSPECTOR_DAEMON_SOCKET environment variable."
+            " Defaults to a socket in the temporary directory, shared by every project.",
+        },
+        "trace_out": {
+            "flags": ["--trace-out"],
+            "help": "Write a trace of the check to the given file, in the Chrome trace-event format"
+            " which trace viewers such as Perfetto load. It shows how long finding the files,"
+            " loading the profile, configuring and running each tool, checking each file,"
+            " and handling and rendering the messages took, and which of them ran at the same time.",
+        },
         "die_on_tool_error": {
             "flags": ["-X", "--die-on-tool-error"],
             "help": "If a tool fails to run, prospector will try to carry on."
@@ -0,0 +1,363 @@
+"""
+A long-running prospector server, and the thin client which sends checks to it.
+
+When only a few files are checked, most of the time of a prospector run goes into
+importing the tools, and into pylint (through astroid) analysing every module the
+checked code imports, including the standard library and third party packages. The
+daemon pays for both once: it keeps the tools imported and keeps astroid's analysis
+of every module which has not changed since it was analysed. Profiles are only parsed
+again when their files change, and the tools are configured for every check, so that
+changes to the configuration are always picked up.
+
+The client only depends on the standard library, so that it starts quickly. It sends
+the command line arguments, working directory and the environment variables the check
+can depend on to the daemon over a Unix socket, as one JSON document on a single line, and the daemon
+sends back what the check writes to stdout and stderr as it is written, followed by
+its exit code, one JSON document per line too. When no daemon is running, or the
+socket belongs to another user, the client runs the check itself.
+
+Only the user running the daemon may send checks to it: the socket is only open to
+them, and, unless it is somewhere else, kept in a directory only open to them too.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+import time
+import traceback
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from prospector.exceptions import FatalProspectorException
+
+if TYPE_CHECKING:
+    from prospector.tools.pylint.astroid_cache import AstroidCache
+
+__all__ = (
+    "client_main",
+    "default_socket_path",
+    "is_serving",
+    "serve",
+)
+
+_serving = False
+
+# The environment variables a check can depend on, through prospector itself or the
+# tools and programs it runs; the rest of the environment of the client is not sent
+_ENVIRON_NAMES = frozenset(
+    (
+        "FORCE_COLOR",
+        "GITHUB_ACTIONS",
+        "HOME",
+        "LANG",
+        "MYPYPATH",
+        "NO_COLOR",
+        "PATH",
+        "PYLINTHOME",
+        "PYLINTRC",
+        "PYTHONPATH",
+        "TERM",
+        "VIRTUAL_ENV",
+        "XDG_CACHE_HOME",
+        "XDG_CONFIG_HOME",
+    )
+)
+_ENVIRON_PREFIXES = ("PROSPECTOR_", "LC_", "GIT_", "MYPY_")
+
+
+def _private_dir() -> Path:
+    return Path(tempfile.gettempdir()) / f"prospector-{os.getuid()}"
+
+
+def default_socket_path() -> Path:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        # only open to the user already
+        return Path(runtime_dir) / f"prospector-{os.getuid()}.sock"
+    # the temporary directory is shared with the other users, so not the socket itself
+    return _private_dir() / "daemon.sock"
+
+
+def _is_forwarded(name: str) -> bool:
+    return name in _ENVIRON_NAMES or name.startswith(_ENVIRON_PREFIXES)
+
+
+def _forwarded_environ(environ: dict[str, str]) -> dict[str, str]:
+    return {name: value for name, value in environ.items() if _is_forwarded(name)}
+
+
+def _owned_by_user(path: Path) -> bool:
+    try:
+        return path.stat().st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def _make_private_dir(directory: Path) -> None:
+    directory.mkdir(mode=0o700, exist_ok=True)
+    info = directory.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise FatalProspectorException(f"{directory} is not a directory of yours, so the daemon cannot listen in it")
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        directory.chmod(0o700)
+
+
+def _send(stream: BinaryIO, **frame: Any) -> None:
+    stream.write(json.dumps(frame).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+class _FrameWriter(io.TextIOBase):
+    """
+    Sends whatever a check writes to one of its output streams to the client.
+    """
+
+    def __init__(self, stream: BinaryIO, name: str) -> None:
+        super().__init__()
+        self._stream = stream
+        self._name = name
+        self._connected = True
+
+    encoding = "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text and self._connected:
+            try:
+                _send(self._stream, **{self._name: text})
+            except OSError:
+                # the client went away; the check carries on, but nobody is listening
+                self._connected = False
+        return len(text)
+
+
+def _exit_code(code: Any) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(f"{code}\n")
+    return 1
+
+
+def _request_problem(request: dict[str, Any]) -> str | None:
+    argv, cwd, env = request.get("argv"), request.get("cwd"), request.get("env")
+    if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+        return "its arguments are not a list of strings"
+    if not isinstance(cwd, str):
+        return "its working directory is not a string"
+    if not isinstance(env, dict) or not all(isinstance(value, str) for value in env.values()):
+        return "its environment does not map names to strings"
+    return None
+
+
+def _check(request: dict[str, Any], output: BinaryIO, astroid_cache: AstroidCache) -> int:
+    from prospector import run  # pylint: disable=import-outside-toplevel
+
+    saved_cwd, saved_environ = os.getcwd(), dict(os.environ)
+    saved_argv, saved_stdout, saved_stderr = sys.argv, sys.stdout, sys.stderr
+
+    try:
+        sys.stdout = _FrameWriter(output, "stdout")
+        sys.stderr = _FrameWriter(output, "stderr")
+        problem = _request_problem(request)
+        if problem is not None:
+            sys.stderr.write(f"The prospector daemon cannot run the check, as {problem}\n")
+            return 2
+        try:
+            os.chdir(request["cwd"])
+        except OSError as error:
+            sys.stderr.write(f"The prospector daemon cannot run the check in {request['cwd']}: {error.strerror}\n")
+            return 2
+        # the variables the client does not send are those of the daemon, whatever the client has
+        os.environ.clear()
+        os.environ.update({name: value for name, value in saved_environ.items() if not _is_forwarded(name)})
+        os.environ.update(request["env"])
+        sys.argv = ["prospector", *request["argv"]]
+
+        with warnings.catch_warnings():
+            astroid_cache.refresh()
+            started_ns = time.time_ns()
+            try:
+                run.main()
+                code = 0
+            except SystemExit as exit_request:
+                code = _exit_code(exit_request.code)
+            except Exception:  # noqa: BLE001 - a check going wrong must not take the daemon down with it
+                traceback.print_exc()
+                code = 2
+            astroid_cache.record(started_ns)
+    finally:
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_environ)
+        sys.argv, sys.stdout, sys.stderr = saved_argv, saved_stdout, saved_stderr
+
+    return code
+
+
+def _bind(server: socket.socket, socket_path: Path) -> None:
+    if socket_path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            # left behind by a daemon which did not stop cleanly
+            try:
+                socket_path.unlink()
+            except OSError as error:
+                raise FatalProspectorException(
+                    f"Could not remove {socket_path}, left behind by another daemon: {error.strerror}"
+                ) from error
+        else:
+            raise FatalProspectorException(f"A prospector daemon is already listening on {socket_path}")
+        finally:
+            probe.close()
+
+    if socket_path.parent == _private_dir():
+        _make_private_dir(socket_path.parent)
+    else:
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+    # only the user running the daemon may send checks to it
+    umask = os.umask(0o077)
+    try:
+        server.bind(str(socket_path))
+    finally:
+        os.umask(umask)
+
+
+def is_serving() -> bool:
+    """
+    Whether this process is a daemon, running the checks sent to it.
+    """
+    return _serving
+
+
+def serve(socket_path: Path) -> None:
+    """
+    Listen for checks on the given socket and run them one at a time, until asked to stop.
+    """
+    global _serving  # pylint: disable=global-statement
+
+    if _serving:
+        raise FatalProspectorException("This prospector daemon cannot start another one")
+    if not hasattr(socket, "AF_UNIX"):
+        raise FatalProspectorException("The prospector daemon needs Unix sockets, which this platform lacks")
+
+    # importing the tools is a good part of what the daemon saves, so do it before the first check
+    importlib.import_module("prospector.run")
+
+    from prospector.tools.pylint.astroid_cache import AstroidCache  # pylint: disable=import-outside-toplevel
+
+    astroid_cache = AstroidCache()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    _bind(server, socket_path)
+    server.listen()
+    _serving = True
+    sys.stderr.write(f"Prospector daemon listening on {socket_path}\n")
+
+    try:
+        while True:
+            connection, _ = server.accept()
+            with connection, connection.makefile("rb") as reader, connection.makefile("wb") as writer:
+                try:
+                    request = json.loads(reader.readline())
+                except (OSError, ValueError):
+                    continue
+                if not isinstance(request, dict):
+                    continue
+
+                if request.get("command") == "stop":
+                    with contextlib.suppress(OSError):
+                        _send(writer, exit=0)
+                    break
+
+                code = _check(request, writer, astroid_cache)
+                with contextlib.suppress(OSError):
+                    _send(writer, exit=code)
+    finally:
+        _serving = False
+        server.close()
+        with contextlib.suppress(OSError):
+            socket_path.unlink()
+
+
+def _client_socket_path(argv: list[str]) -> Path:
+    for idx, arg in enumerate(argv):
+        if arg == "--daemon-socket" and idx + 1 < len(argv):
+            return Path(argv[idx + 1])
+        if arg.startswith("--daemon-socket="):
+            return Path(arg.split("=", 1)[1])
+    if os.environ.get("PROSPECTOR_DAEMON_SOCKET"):
+        return Path(os.environ["PROSPECTOR_DAEMON_SOCKET"])
+    return default_socket_path()
+
+
+def _relay(connection: socket.socket, request: dict[str, Any]) -> int:
+    with connection.makefile("rb") as reader, connection.makefile("wb") as writer:
+        _send(writer, **request)
+        for line in reader:
+            frame = json.loads(line)
+            if "stdout" in frame:
+                sys.stdout.write(frame["stdout"])
+                sys.stdout.flush()
+            elif "stderr" in frame:
+                sys.stderr.write(frame["stderr"])
+                sys.stderr.flush()
+            elif "exit" in frame:
+                return int(frame["exit"])
+
+    sys.stderr.write("The prospector daemon stopped before finishing the check\n")
+    return 2
+
+
+def client_main() -> None:
+    """
+    The prospector-client command: takes the same arguments as prospector, plus
+    --stop-daemon to stop a running daemon.
+    """
+    argv = sys.argv[1:]
+    stop = "--stop-daemon" in argv
+    socket_path = _client_socket_path(argv)
+
+    connection = None
+    if socket_path.exists() and not _owned_by_user(socket_path):
+        # whoever listens on it would be sent the check, and its environment
+        sys.stderr.write(f"Not using {socket_path}, which belongs to another user\n")
+    elif hasattr(socket, "AF_UNIX"):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(str(socket_path))
+        except OSError:
+            connection.close()
+            connection = None
+
+    if connection is None:
+        if stop:
+            sys.stderr.write(f"No prospector daemon is listening on {socket_path}\n")
+            sys.exit(1)
+        # no daemon to send the check to, so run it in this process instead
+        from prospector.run import main  # pylint: disable=import-outside-toplevel
+
+        main()
+        return
+
+    request: dict[str, Any]
+    if stop:
+        request = {"command": "stop"}
+    else:
+        request = {"command": "check", "argv": argv, "cwd": os.getcwd(), "env": _forwarded_environ(dict(os.environ))}
+
+    with connection:
+        sys.exit(_relay(connection, request))
@@ -0,0 +1,151 @@
+"""
+A lightweight map of which modules import which, used to work out the other modules
+whose analysis can be affected by a change to a module.
+
+The imports are found with a textual scan rather than by parsing each module: it is
+much cheaper, and its mistakes (an import statement quoted in a docstring, say) only
+ever add dependencies, never lose them.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from collections.abc import Collection, Iterable
+from pathlib import Path
+from typing import Callable
+
+from prospector import encoding
+
+__all__ = ("ImportGraph", "find_imports", "module_name")
+
+_IMPORT_RE = re.compile(r"^[ \t]*import[ \t]+([^#;\n]+(?:\\\n[^#;\n]*)*)", re.MULTILINE)
+_FROM_IMPORT_RE = re.compile(
+    r"^[ \t]*from[ \t]+(\.*[\w.]*)[ \t]+import[ \t]*(\([^)]*\)|[^#;\n]+(?:\\\n[^#;\n]*)*)",
+    re.MULTILINE,
+)
+_NAME_RE = re.compile(r"[A-Za-z_][\w.]*")
+
+
+def module_name(path: Path, removed: Collection[Path] = ()) -> str:
+    """
+    The dotted name a module is imported by, found by walking up through the
+    directories which are packages (which have an ``__init__.py``, or had one of the
+    ``removed`` modules).
+    """
+    parts = [] if path.name == "__init__.py" else [path.stem]
+    directory = path.parent
+    while (directory / "__init__.py").exists() or directory / "__init__.py" in removed:
+        parts.insert(0, directory.name)
+        if directory.parent == directory:
+            break
+        directory = directory.parent
+    return ".".join(parts)
+
+
+def _with_parents(name: str) -> Iterable[str]:
+    # importing a.b.c also imports a and a.b
+    parts = name.split(".")
+    for idx in range(1, len(parts) + 1):
+        yield ".".join(parts[:idx])
+
+
+def find_imports(source: str, name: str, is_package: bool = False) -> set[str]:
+    """
+    Find every module name the source of the module called ``name`` may import.
+    Names which are not modules (``from a import some_function``) are included too,
+    as there is no telling them apart without importing anything.
+    """
+    imported: set[str] = set()
+
+    for match in _IMPORT_RE.finditer(source):
+        for clause in match.group(1).replace("\\\n", " ").split(","):
+            words = clause.split()
+            if words:
+                imported.update(_with_parents(words[0]))
+
+    package_parts = name.split(".") if is_package else name.split(".")[:-1]
+    for match in _FROM_IMPORT_RE.finditer(source):
+        base = match.group(1)
+        level = len(base) - len(base.lstrip("."))
+        base = base[level:]
+        if level:
+            if level - 1 > len(package_parts):
+                continue
+            parent = package_parts[: len(package_parts) - (level - 1)]
+            base = ".".join(parent + ([base] if base else []))
+        if not base:
+            continue
+        imported.update(_with_parents(base))
+        names = match.group(2).strip("()").replace("\\\n", " ")
+        for clause in names.split(","):
+            words = clause.split()
+            if words and _NAME_RE.fullmatch(words[0]):
+                imported.add(f"{base}.{words[0]}")
+
+    return imported
+
+
+class ImportGraph:
+    def __init__(
+        self,
+        modules: Iterable[Path],
+        read: Callable[[Path], str] = encoding.read_py_file,
+        removed: Collection[Path] = (),
+    ) -> None:
+        """
+        :param modules:
+            The paths of every module to include in the graph
+        :param read:
+            How to get the source of a module
+        :param removed:
+            The paths of modules which were deleted, so that the modules which imported
+            them are still found among their dependents
+        """
+        self._paths: dict[str, Path] = {}
+        self._imports: dict[Path, set[Path]] = {}
+        self._importers: dict[Path, set[Path]] = defaultdict(set)
+
+        names = {}
+        # a module which still exists takes the name of a removed one
+        for path in removed:
+            names[path] = name = module_name(path, removed)
+            self._paths[name] = path
+        for path in modules:
+            names[path] = name = module_name(path, removed)
+            self._paths[name] = path
+
+        for path, name in names.items():
+            try:
+                source = "" if path in removed else read(path)
+            except (encoding.CouldNotHandleEncoding, OSError):
+                # if we cannot read it, no tool can check it either
+                source = ""
+            imported = find_imports(source, name, is_package=path.name == "__init__.py")
+            self._imports[path] = {self._paths[other] for other in imported if other in self._paths} - {path}
+            for other in self._imports[path]:
+                self._importers[other].add(path)
+
+    def _closure(self, paths: Iterable[Path], edges: dict[Path, set[Path]]) -> set[Path]:
+        seen: set[Path] = set()
+        todo = list(paths)
+        while todo:
+            path = todo.pop()
+            for other in edges.get(path, ()):
+                if other not in seen:
+                    seen.add(other)
+                    todo.append(other)
+        return seen
+
+    def dependents(self, paths: Iterable[Path]) -> set[Path]:
+        """
+        Every module which imports one of the given modules, directly or not. The given
+        modules are only included if they depend on each other.
+        """
+        return self._closure(paths, self._importers)
+
+    def dependencies(self, paths: Iterable[Path]) -> set[Path]:
+        """
+        Every module imported by one of the given modules, directly or not.
+        """
+        return self._closure(paths, self._imports)
@@ -1,4 +1,10 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import io
 import tokenize
+from collections.abc import Iterable
 from pathlib import Path
 
 from prospector.exceptions import CouldNotHandleEncoding, PermissionMissing
@@ -7,15 +13,19 @@ from prospector.exceptions import CouldNotHandleEncoding, PermissionMissing
 #       mypy complains with 'Incompatible return value type (got "str", expected "bytes")'
 
 
-def read_py_file(filepath: Path) -> str:
-    # See https://docs.python.org/3/library/tokenize.html#tokenize.detect_encoding
-    # first just see if the file is properly encoded
+def _read_bytes(filepath: Path) -> bytes:
     try:
         with open(filepath, "rb") as bfile_:
-            tokenize.detect_encoding(bfile_.readline)
+            return bfile_.read()
     except PermissionError as err:
         raise PermissionMissing(filepath) from err
 
+
+def _decode(filepath: Path, data: bytes) -> str:
+    # See https://docs.python.org/3/library/tokenize.html#tokenize.detect_encoding
+    # first just see if the file is properly encoded
+    try:
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(data).readline)
     except SyntaxError as err:
         # this warning is issued:
         #   (1) in badly authored files (contains non-utf8 in a comment line)
@@ -27,10 +37,106 @@ def read_py_file(filepath: Path) -> str:
         raise CouldNotHandleEncoding(filepath) from err
 
     try:
-        with tokenize.open(filepath) as file_:
-            return file_.read()
+        text = data.decode(encoding)
         # this warning is issued:
         #   (1) if utf-8 is specified, but latin1 is used with something like \x0e9 appearing
         #       (see http://stackoverflow.com/a/5552623)
     except UnicodeDecodeError as err:
         raise CouldNotHandleEncoding(filepath) from err
+
+    # the same universal newlines translation as tokenize.open
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_py_file(filepath: Path) -> str:
+    return _decode(filepath, _read_bytes(filepath))
+
+
+class _Source:
+    def __init__(self, digest: str, text: str | None, error: Exception | None) -> None:
+        self.digest = digest
+        self.text = text
+        self.error = error
+        self.lines: list[str] | None = None
+        self.tree: ast.Module | None = None
+        self.syntax_error: SyntaxError | ValueError | None = None
+
+
+class SourceStore:
+    """
+    The source of the files checked in one run, so that each file is read, decoded and
+    parsed only once, however many tools look at it.
+
+    Reading a file which cannot be decoded raises CouldNotHandleEncoding every time,
+    just as read_py_file does, and parsing a file which is not valid python raises
+    the same SyntaxError every time.
+    """
+
+    def __init__(self) -> None:
+        self._sources: dict[Path, _Source] = {}
+
+    def _get(self, filepath: Path) -> _Source:
+        source = self._sources.get(filepath)
+        if source is None:
+            data = _read_bytes(filepath)
+            text: str | None = None
+            error: Exception | None = None
+            try:
+                text = _decode(filepath, data)
+            except CouldNotHandleEncoding as err:
+                error = err.__cause__ if isinstance(err.__cause__, Exception) else err
+            source = self._sources[filepath] = _Source(hashlib.sha256(data).hexdigest(), text, error)
+        return source
+
+    def read(self, filepath: Path) -> str:
+        """
+        The decoded content of a file, with its line endings translated to ``\\n``.
+        """
+        source = self._get(filepath)
+        if source.text is None:
+            raise CouldNotHandleEncoding(filepath) from source.error
+        return source.text
+
+    def lines(self, filepath: Path) -> list[str]:
+        """
+        The lines of a file, with their line endings, as ``readlines`` would return them.
+        """
+        source = self._get(filepath)
+        if source.lines is None:
+            source.lines = io.StringIO(self.read(filepath)).readlines()
+        return source.lines
+
+    def tree(self, filepath: Path) -> ast.Module:
+        """
+        The AST of a file, as ``ast.parse`` returns it. The same tree is given to every
+        tool, so tools must not change what ``ast.parse`` made. Some add attributes of
+        their own to its nodes, which they set again each time they look at them: the
+        pyflakes ``Checker`` adds ``_pyflakes_parent`` and ``_pyflakes_depth``, and
+        pep8-naming adds ``function_type`` and ``global_names``.
+
+        :raises SyntaxError: if the file is not valid python
+        :raises ValueError: if the file contains null bytes, on older python versions
+        """
+        source = self._get(filepath)
+        if source.tree is None and source.syntax_error is None:
+            try:
+                source.tree = ast.parse(self.read(filepath), filename=str(filepath))
+            except (SyntaxError, ValueError) as err:
+                source.syntax_error = err
+        if source.syntax_error is not None:
+            raise source.syntax_error
+        assert source.tree is not None
+        return source.tree
+
+    def digest(self, filepath: Path) -> str:
+        """
+        A hash of the content of the file, whether it can be decoded or not.
+        """
+        return self._get(filepath).digest
+
+    def forget(self, filepaths: Iterable[Path]) -> None:
+        """
+        Drop what is known of the given files, after they changed.
+        """
+        for filepath in filepaths:
+            self._sources.pop(filepath, None)
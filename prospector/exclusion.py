@@ -0,0 +1,96 @@
+"""
+Decides which paths the ``ignore-patterns`` and ``ignore-paths`` of the configuration
+exclude from being checked.
+
+Both are matched against the path relative to the working directory (or the absolute
+path for files outside of it), once symbolic links are resolved. Rather than trying
+every pattern in turn, the patterns are compiled into one regular expression, and the
+ignored paths are kept as a set of prefixes, so that the cost of checking a path
+hardly depends on how many of them there are.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+from prospector.compat import is_relative_to
+
+__all__ = ("ExclusionFilter",)
+
+_SEPARATORS = ("/", "\\")
+
+# Patterns referring to their own groups cannot be merged with others, as the group
+# numbers change once they are part of a larger expression
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def _combine(patterns: list[re.Pattern[str]]) -> re.Pattern[str] | None:
+    if not patterns or any(_GROUP_REFERENCE.search(pattern.pattern) for pattern in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+    except re.error:
+        # for example, flags which are only allowed at the start of a pattern, or the
+        # same group name used by two patterns
+        return None
+
+
+class ExclusionFilter:
+    """
+    An exclusion filter for the FileFinder, excluding the paths which match one of the
+    patterns, or which are one of the ignored paths or inside it.
+
+    The filter holds no reference to the configuration, so that it can be pickled.
+    """
+
+    def __init__(self, workdir: Path, patterns: Iterable[re.Pattern[str]], ignore_paths: Iterable[str]) -> None:
+        self._workdir = workdir
+        self._patterns = list(patterns)
+        self._combined = _combine(self._patterns)
+        self._ignore_paths = frozenset(ignore_paths)
+        self._resolved_directories: dict[Path, Path] = {}
+
+    def __call__(self, path: Path) -> bool:
+        if not self._patterns and not self._ignore_paths:
+            return False
+
+        # first figure out where the path is, relative to the workdir
+        # ignore-paths/patterns will usually be relative to a repository
+        # root or the CWD, but the path passed to prospector may not be
+        resolved = self._resolve(path)
+        if is_relative_to(resolved, self._workdir):
+            resolved = resolved.relative_to(self._workdir)
+        name = str(resolved)
+
+        return self._is_ignored_path(name) or self._matches_pattern(name)
+
+    def _resolve(self, path: Path) -> Path:
+        # resolving a path looks at each directory above it, so the directories are
+        # resolved once each, and the paths inside them only checked for being links
+        if not path.is_absolute() or path.name in ("", ".", "..") or path.is_symlink():
+            return path.resolve()
+        parent = self._resolved_directories.get(path.parent)
+        if parent is None:
+            parent = self._resolved_directories[path.parent] = path.parent.resolve()
+        return parent / path.name
+
+    def _matches_pattern(self, name: str) -> bool:
+        if self._combined is not None:
+            return self._combined.match(name) is not None
+        return any(pattern.match(name) for pattern in self._patterns)
+
+    def _is_ignored_path(self, name: str) -> bool:
+        if not self._ignore_paths:
+            return False
+        # an ignored path may also follow a leading separator, as in an absolute path
+        candidates = [name, name[1:]] if name.startswith(_SEPARATORS) else [name]
+        for candidate in candidates:
+            # every leading part of the path ending at a separator, and the path itself
+            for end, char in enumerate(candidate):
+                if char in _SEPARATORS and candidate[:end] in self._ignore_paths:
+                    return True
+            if candidate in self._ignore_paths:
+                return True
+        return False
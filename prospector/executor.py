@@ -0,0 +1,101 @@
+"""
+Runs independent pieces of work - typically one tool each - either one after the
+other in this process, or spread over a pool of worker processes.
+
+Worker processes are forked rather than spawned: configured tools hold state which
+cannot be pickled (pylint's linter, pycodestyle's style guide...), so instead of
+sending the work to the workers, the workers inherit it from the parent process when
+they are created. Only the results travel back, and so only they need to be picklable.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, TypeVar
+
+__all__ = (
+    "can_run_in_parallel",
+    "resolve_jobs",
+    "run_all",
+    "split",
+)
+
+T = TypeVar("T")
+
+# In a worker process, the tasks of the run_all call which started it
+_TASKS: Sequence[Callable[[], Any]] = ()
+
+
+def can_run_in_parallel() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def resolve_jobs(jobs: int | None) -> int:
+    """
+    Turn the --jobs setting into a number of worker processes: like pylint, 0 means
+    'one per CPU'.
+    """
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(jobs, 1)
+
+
+def split(items: Sequence[T], parts: int) -> list[list[T]]:
+    """
+    Deal the items out into at most ``parts`` lists of about the same size, keeping their
+    order within each list. There is always at least one list, even with no items.
+    """
+    parts = max(1, min(parts, len(items)))
+    return [list(items[index::parts]) for index in range(parts)]
+
+
+def _set_tasks(tasks: Sequence[Callable[[], Any]]) -> None:
+    # the workers are forked, so the tasks are inherited rather than pickled; setting
+    # them in each worker, rather than in the calling process, leaves the tasks of any
+    # run_all call the calling process is itself a worker of alone
+    global _TASKS  # pylint: disable=global-statement
+    _TASKS = tasks
+
+
+def _call_task(index: int) -> Any:
+    return _TASKS[index]()
+
+
+def run_all(
+    tasks: Sequence[Callable[[], T]], jobs: int = 1, on_done: Callable[[int, T], None] | None = None
+) -> list[T]:
+    """
+    Call every task and return their results, in the same order as the tasks.
+
+    With more than one job, the tasks run concurrently in forked worker processes. A task
+    raising an exception (including SystemExit) re-raises it here, in the calling process.
+
+    :param on_done: Called in the calling process with the index and the result of each
+                    task as soon as it is done, so in the order the tasks finish
+    """
+    workers = min(resolve_jobs(jobs), len(tasks))
+    if workers <= 1 or not can_run_in_parallel():
+        results = []
+        for index, task in enumerate(tasks):
+            results.append(task())
+            if on_done is not None:
+                on_done(index, results[-1])
+        return results
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_set_tasks,
+        initargs=(tasks,),
+    ) as pool:
+        futures = {pool.submit(_call_task, index): index for index in range(len(tasks))}
+        done: dict[int, T] = {}
+        for future in as_completed(futures):
+            index = futures[future]
+            done[index] = future.result()
+            if on_done is not None:
+                on_done(index, done[index])
+        return [done[index] for index in range(len(tasks))]
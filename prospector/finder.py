@@ -1,13 +1,60 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+import copy
+import os
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Callable
 
+from prospector import tracing
+from prospector.encoding import SourceStore
 from prospector.exceptions import PermissionMissing
-from prospector.pathutils import is_python_module, is_python_package, is_virtualenv
+from prospector.pathtable import PATHS
+from prospector.pathutils import is_python_module, is_python_package, is_virtualenv, is_virtualenv_listing
+
+_SKIP_DIRECTORIES = (
+    ".git",
+    ".tox",
+    ".mypy_cache",
+    ".prospector_cache",
+    ".pytest_cache",
+    ".venv",
+    "__pycache__",
+    "node_modules",
+)
+
+
+class _FileIndex:
+    """
+    Everything one walk of the provided paths found. It never changes once built: a
+    finder restricted to some of the files gets an index of its own, which shares what
+    does not depend on the files.
+    """
+
+    def __init__(self, files: frozenset[Path], directories: frozenset[Path]) -> None:
+        self.files = files
+        self.directories = directories
+        self._python_modules: tuple[Path, ...] | None = None
+        self._python_packages: tuple[Path, ...] | None = None
+
+    @property
+    def python_modules(self) -> tuple[Path, ...]:
+        if self._python_modules is None:
+            self._python_modules = tuple(f for f in self.files if is_python_module(f))
+        return self._python_modules
+
+    @property
+    def python_packages(self) -> tuple[Path, ...]:
+        if self._python_packages is None:
+            self._python_packages = tuple(d for d in self.directories if is_python_package(d))
+        return self._python_packages
 
-_SKIP_DIRECTORIES = (".git", ".tox", ".mypy_cache", ".pytest_cache", ".venv", "__pycache__", "node_modules")
+    def restricted_to(self, paths: Iterable[Path]) -> _FileIndex:
+        restricted = _FileIndex(self.files & set(paths), self.directories)
+        if self._python_modules is not None:
+            restricted._python_modules = tuple(f for f in self._python_modules if f in restricted.files)
+        restricted._python_packages = self._python_packages
+        return restricted
 
 
 class FileFinder:
@@ -30,11 +77,15 @@ class FileFinder:
         """
         self._provided_files = []
         self._provided_dirs = []
-        self._exclusion_filters = [
-            # we always want to ignore some things
-            lambda _path: _path.is_dir() and _path.name in _SKIP_DIRECTORIES,
-            is_virtualenv,
-        ] + list(exclusion_filters or [])
+        self._restricted_files: frozenset[Path] | None = None
+        # the finder this one was restricted from, if it was
+        self._unrestricted: FileFinder | None = None
+        # built by walking the provided paths the first time it is needed
+        self._index: _FileIndex | None = None
+        # shared by every tool, so that each file is only read once
+        self.sources = SourceStore()
+        # on top of these, some directories and virtualenvs are always ignored
+        self._exclusion_filters = list(exclusion_filters or [])
 
         for path in provided_paths:
             if not path.exists():
@@ -55,23 +106,78 @@ class FileFinder:
             paths.add(module.parent)
         return sorted(paths)
 
+    def restricted_to(self, paths: Iterable[Path]) -> FileFinder:
+        """
+        Return a FileFinder which only lists the given files, out of those this one lists.
+        Any other file counts as excluded. The directories and packages are unchanged.
+        """
+        restricted = copy.copy(self)
+        restricted._index = self._get_index().restricted_to(paths)
+        restricted._restricted_files = restricted._index.files
+        restricted._unrestricted = self.unrestricted
+        return restricted
+
+    @property
+    def unrestricted(self) -> FileFinder:
+        """
+        The finder listing every file of the project, which this one was restricted from
+        with ``restricted_to``, or this one if it was not, for the tools whose findings
+        about some files depend on the others.
+        """
+        return self._unrestricted if self._unrestricted is not None else self
+
     def is_excluded(self, path: Path) -> bool:
+        if self._restricted_files is not None and path not in self._restricted_files and not path.is_dir():
+            return True
+        if path.is_dir() and (path.name in _SKIP_DIRECTORIES or is_virtualenv(path)):
+            return True
+        return self._is_filtered(path)
+
+    def _is_filtered(self, path: Path) -> bool:
         return any(filt(path) for filt in self._exclusion_filters)
 
-    def _filter(self, paths: Iterable[Path]) -> set[Path]:
-        return {path for path in paths if not self.is_excluded(path)}
+    def _get_index(self) -> _FileIndex:
+        if self._index is None:
+            with tracing.span("find files", "discovery"):
+                self._index = self._build_index()
+        return self._index
 
-    def _walk(self, directory: Path) -> Iterator[Path]:
-        if not self.is_excluded(directory):
-            yield directory
+    def _build_index(self) -> _FileIndex:
+        files: set[Path] = set()
+        directories: set[Path] = set()
 
-        for path in directory.iterdir():
-            if self.is_excluded(path):
+        # the directories to list, and whether they were provided rather than found
+        to_walk: list[tuple[Path, bool]] = [(directory, True) for directory in self._provided_dirs]
+        while to_walk:
+            directory, provided = to_walk.pop()
+            try:
+                with os.scandir(directory) as scanned:
+                    entries = list(scanned)
+            except PermissionError as err:
+                raise PermissionMissing(directory) from err
+
+            # a virtualenv is recognised from the listing the walk needs anyway
+            contents = {entry.name: entry.is_dir() for entry in entries}
+            if provided:
+                excluded = directory.name in _SKIP_DIRECTORIES or self._is_filtered(directory)
+                if not excluded and not is_virtualenv_listing(contents):
+                    directories.add(directory)
+                # the contents of a provided directory are looked at even if it is excluded itself
+            elif is_virtualenv_listing(contents):
                 continue
-            if path.is_dir():
-                yield from self._walk(path)
             else:
-                yield path
+                directories.add(directory)
+
+            for entry in entries:
+                path = directory / entry.name
+                if contents[entry.name]:
+                    if entry.name not in _SKIP_DIRECTORIES and not self._is_filtered(path):
+                        to_walk.append((path, False))
+                elif entry.is_file() and not self._is_filtered(path):
+                    files.add(PATHS.interned(path))
+
+        files.update(PATHS.interned(path) for path in self._provided_files)
+        return _FileIndex(frozenset(files), frozenset(directories))
 
     @property
     def files(self) -> set[Path]:
@@ -80,19 +186,7 @@ class FileFinder:
 
         This method is useful for tools which require an explicit list of files to check.
         """
-        files = set()
-
-        for directory in self.directories:
-            for path in self._walk(directory):
-                if path.is_file():
-                    files.add(path)
-
-        files = self._filter(files)
-
-        for path in self._provided_files:
-            files.add(path)
-
-        return files
+        return set(self._get_index().files)
 
     @property
     def python_packages(self) -> list[Path]:
@@ -102,7 +196,7 @@ class FileFinder:
 
         This method is useful for passing to tools which will do their own discovery of python files.
         """
-        return [d for d in self.directories if is_python_package(d)]
+        return list(self._get_index().python_packages)
 
     @property
     def python_modules(self) -> list[Path]:
@@ -112,7 +206,7 @@ class FileFinder:
 
         This method is useful for passing to tools which will do their own discovery of python files.
         """
-        return [f for f in self.files if is_python_module(f)]
+        return list(self._get_index().python_modules)
 
     @property
     def directories(self) -> set[Path]:
@@ -121,14 +215,4 @@ class FileFinder:
 
         This method is useful for passing to tools which will do their own discovery of python files.
         """
-        dirs = set()
-        for directory in self._provided_dirs:
-            dirs.add(directory)
-            try:
-                for obj in self._walk(directory):
-                    if obj.is_dir():
-                        dirs.add(obj)
-            except PermissionError as err:
-                raise PermissionMissing(obj) from err
-
-        return self._filter(dirs)
+        return set(self._get_index().directories)
@@ -1,4 +1,4 @@
-from . import emacs, gitlab, grouped, json, pylint, pylint_parseable, sarif, text, vscode, xunit, yaml
+from . import emacs, gitlab, grouped, json, jsonl, pylint, pylint_parseable, sarif, text, vscode, xunit, yaml
 from .base import Formatter
 
 __all__ = ("FORMATTERS", "Formatter")
@@ -6,6 +6,7 @@ __all__ = ("FORMATTERS", "Formatter")
 
 FORMATTERS: dict[str, type[Formatter]] = {
     "json": json.JsonFormatter,
+    "jsonl": jsonl.JsonLinesFormatter,
     "text": text.TextFormatter,
     "gitlab": gitlab.GitlabFormatter,
     "grouped": grouped.GroupedFormatter,
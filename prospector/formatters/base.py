@@ -10,9 +10,14 @@ from pathlib import Path
 from typing import Any
 
 from prospector.message import Location, Message
+from prospector.pathtable import PATHS
 
 
 class Formatter(ABC):
+    # Whether each message can be written out on its own with render_message, ahead of
+    # the rest of the report, so that the messages come out while the tools still run
+    streams_messages = False
+
     def __init__(
         self,
         summary: dict[str, Any],
@@ -29,10 +34,18 @@ class Formatter(ABC):
     def render(self, summary: bool = True, messages: bool = True, profile: bool = False) -> str:
         raise NotImplementedError
 
+    def render_message(self, message: Message) -> str:
+        raise NotImplementedError
+
     def _make_path(self, location: Location) -> Path:
         path_ = location.relative_path(self.paths_relative_to)
         return Path() if path_ is None else path_
 
+    def _make_module_name(self, location: Location) -> str:
+        if location.path_id is None:
+            return str(Path())
+        return PATHS.module_name(location.path_id, self.paths_relative_to)
+
     def _message_to_dict(self, message: Message) -> dict[str, Any]:
         loc = {
             "path": str(self._make_path(message.location)),
@@ -23,6 +23,8 @@ class SummaryFormatter(Formatter):
         ("tools", "Tools Run", ", ".join),
         ("adaptors", "Adaptors", ", ".join),
         ("message_count", "Messages Found", None),
+        ("cache_hits", "Cache Hits", None),
+        ("cache_misses", "Cache Misses", None),
         ("external_config", "External Config", None),
     )
 
@@ -41,6 +43,30 @@ class SummaryFormatter(Formatter):
                     value = formatter(value)
                 output.append(f" {label.rjust(label_width)}: {value}")
 
+        if "timings" in self.summary:
+            output += ["", "", self.render_timings()]
+
+        return "\n".join(output)
+
+    def render_timings(self) -> str:
+        timings = self.summary["timings"]
+        rows = [
+            (f"{tool} {step}", timing) for tool, steps in timings["tools"].items() for step, timing in steps.items()
+        ]
+        rows += list(timings["phases"].items())
+
+        label_width = max([len(label) for label, _ in rows], default=0)
+        output = [
+            "Timings",
+            "=======",
+            f" {'':{label_width}}  {'Wall Time':>10} {'CPU Time':>10} {'Peak Memory':>12}",
+        ]
+        for label, timing in rows:
+            peak_rss = "-" if timing["peak_rss"] is None else f"{timing['peak_rss'] / 2**20:0.1f} MiB"
+            output.append(
+                f" {label.rjust(label_width)}: {timing['wall_time']:>9.2f}s {timing['cpu_time']:>9.2f}s {peak_rss:>12}"
+            )
+
         return "\n".join(output)
 
     def render_profile(self) -> str:
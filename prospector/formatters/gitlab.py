@@ -3,6 +3,7 @@ import json
 from typing import Any
 
 from prospector.formatters.base import Formatter
+from prospector.message import sort_messages
 
 __all__ = ("GitlabFormatter",)
 
@@ -18,7 +19,7 @@ class GitlabFormatter(Formatter):
         fingerprints = set()
 
         if messages:
-            for message in sorted(self.messages):
+            for message in sort_messages(self.messages):
                 # Make sure that we do not get a fingerprint that is already in use
                 # by adding in the previously generated one.
                 message_hash = ":".join([str(message.location.path), str(message.location.line), message.code])
@@ -12,16 +12,7 @@ class JsonFormatter(Formatter):
         output: dict[str, Any] = {}
 
         if summary:
-            # we need to slightly change the types and format
-            # of a few of the items in the summary to make
-            # them play nice with JSON formatting
-            munged = {}
-            for key, value in self.summary.items():
-                if isinstance(value, datetime):
-                    munged[key] = str(value)
-                else:
-                    munged[key] = value
-            output["summary"] = munged
+            output["summary"] = self._summary_to_dict()
 
         if profile:
             output["profile"] = self.profile.as_dict()
@@ -30,3 +21,15 @@ class JsonFormatter(Formatter):
             output["messages"] = [self._message_to_dict(m) for m in self.messages]
 
         return json.dumps(output, indent=2)
+
+    def _summary_to_dict(self) -> dict[str, Any]:
+        # we need to slightly change the types and format
+        # of a few of the items in the summary to make
+        # them play nice with JSON formatting
+        munged = {}
+        for key, value in self.summary.items():
+            if isinstance(value, datetime):
+                munged[key] = str(value)
+            else:
+                munged[key] = value
+        return munged
@@ -0,0 +1,33 @@
+import json
+
+from prospector.formatters.json import JsonFormatter
+from prospector.message import Message
+
+__all__ = ("JsonLinesFormatter",)
+
+
+class JsonLinesFormatter(JsonFormatter):
+    """
+    One JSON document per line: one for each message, followed by the summary and the
+    profile. As each line stands on its own, prospector writes the messages about each
+    file as soon as the tools are done with it, rather than once every tool has finished.
+    """
+
+    streams_messages = True
+
+    def render_message(self, message: Message) -> str:
+        return json.dumps(self._message_to_dict(message))
+
+    def render(self, summary: bool = True, messages: bool = True, profile: bool = False) -> str:
+        lines = []
+
+        if messages:
+            lines += [self.render_message(m) for m in self.messages]
+
+        if summary:
+            lines.append(json.dumps({"summary": self._summary_to_dict()}))
+
+        if profile:
+            lines.append(json.dumps({"profile": self.profile.as_dict()}))
+
+        return "\n".join(lines)
@@ -1,7 +1,5 @@
-import os
-import re
-
 from prospector.formatters.base_summary import SummaryFormatter
+from prospector.message import sort_messages
 
 
 class PylintFormatter(SummaryFormatter):
@@ -14,11 +12,10 @@ class PylintFormatter(SummaryFormatter):
     def render_messages(self) -> list[str]:
         cur_loc = None
         output = []
-        for message in sorted(self.messages):
-            if cur_loc != message.location.path:
-                cur_loc = message.location.path
-                module_name = str(self._make_path(message.location)).replace(os.path.sep, ".")
-                module_name = re.sub(r"(\.__init__)?\.py$", "", module_name)
+        for message in sort_messages(self.messages):
+            if cur_loc != message.location.path_id:
+                cur_loc = message.location.path_id
+                module_name = self._make_module_name(message.location)
 
                 header = f"************* Module {module_name}"
                 output.append(header)
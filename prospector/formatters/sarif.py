@@ -3,6 +3,7 @@ import json
 from typing import Any
 
 from prospector.formatters.base import Formatter
+from prospector.message import sort_messages
 
 __all__ = ("SarifFormatter",)
 
@@ -19,7 +20,7 @@ class SarifFormatter(Formatter):
         results: list[dict[str, Any]] = []
 
         if messages:
-            for message in sorted(self.messages):
+            for message in sort_messages(self.messages):
                 region: dict[str, int] = {}
                 if message.location.line:
                     region["startLine"] = message.location.line
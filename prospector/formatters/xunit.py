@@ -1,6 +1,7 @@
 from xml.dom.minidom import Document  # nosec
 
 from prospector.formatters.base import Formatter
+from prospector.message import sort_messages
 
 
 class XunitFormatter(Formatter):
@@ -32,7 +33,7 @@ class XunitFormatter(Formatter):
         syserr_el.appendChild(xml_doc.createCDATASection(""))
         testsuite_el.appendChild(syserr_el)
 
-        for message in sorted(self.messages):
+        for message in sort_messages(self.messages):
             testcase_el = xml_doc.createElement("testcase")
             testcase_el.setAttribute("name", f"{self._make_path(message.location)}-{message.location.line}")
 
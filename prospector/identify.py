@@ -46,7 +46,7 @@ def _parse_nix_shebang(
     return cmd
 
 
-def _parse_shebang(bytes_io: IO[bytes]) -> tuple[str, ...]:
+def parse_shebang(bytes_io: IO[bytes]) -> tuple[str, ...]:
     """Parse the shebang from a file opened for reading binary."""
     if bytes_io.read(2) != b"#!":
         return ()
@@ -82,7 +82,7 @@ def parse_shebang_from_file(path: Path) -> tuple[str, ...]:
 
     try:
         with path.open("rb") as f:
-            return _parse_shebang(f)
+            return parse_shebang(f)
     except OSError as e:
         if e.errno == errno.EINVAL:
             return ()
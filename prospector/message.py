@@ -1,10 +1,24 @@
 from __future__ import annotations
 
+import sys
+from collections import defaultdict
+from collections.abc import Iterable
+from operator import attrgetter
 from pathlib import Path
+from typing import Any
+
+from prospector.pathtable import PATHS
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if type(value) is str else value
 
 
 class Location:
-    _path: Path | None
+    __slots__ = ("_path_id", "character", "character_end", "function", "line", "line_end", "module")
+
+    # the id of the path in the table of paths
+    _path_id: int | None
 
     def __init__(
         self,
@@ -16,16 +30,14 @@ class Location:
         line_end: int | None = None,
         character_end: int | None = None,
     ):
-        if isinstance(path, Path):
-            self._path = path.absolute()
-        elif isinstance(path, str):
-            self._path = Path(path).absolute()
+        if isinstance(path, (Path, str)):
+            self._path_id = PATHS.intern(path)
         elif path is None:
-            self._path = None
+            self._path_id = None
         else:
             raise ValueError
-        self.module = module or None
-        self.function = function or None
+        self.module = _intern(module) or None
+        self.function = _intern(function) or None
         self.line = None if line == -1 else line
         self.character = None if character == -1 else character
         self.line_end = line_end
@@ -33,47 +45,60 @@ class Location:
 
     @property
     def path(self) -> Path | None:
-        return self._path
+        return None if self._path_id is None else PATHS[self._path_id]
+
+    @property
+    def path_id(self) -> int | None:
+        """
+        The id of the path in ``PATHS``, which is quicker to compare or look up than the path.
+        """
+        return self._path_id
+
+    @property
+    def sort_key(self) -> tuple[Any, ...]:
+        """
+        What locations are sorted by: locations without a path first, then by path,
+        line and character, with a missing line or character before any other.
+        """
+        if self._path_id is None:
+            return (False, (), self.line or -1, self.character or -1)
+        return (True, PATHS.sort_key(self._path_id), self.line or -1, self.character or -1)
 
     def absolute_path(self) -> Path | None:
-        return self._path
+        return self.path
 
     def relative_path(self, root: Path | None) -> Path | None:
-        if self._path is None:
+        if self._path_id is None:
             return None
-        if root is None:
-            return self._path
-        return self._path.relative_to(root) if self._path.is_relative_to(root) else self._path
+        return PATHS.relative(self._path_id, root)
 
     def __repr__(self) -> str:
-        return f"{self._path}:L{self.line}:{self.character}"
+        return f"{self.path}:L{self.line}:{self.character}"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # only the values, rather than a dictionary of the slots of each location
+        return (
+            Location,
+            (self.path, self.module, self.function, self.line, self.character, self.line_end, self.character_end),
+        )
 
     def __hash__(self) -> int:
-        return hash((self._path, self.line, self.character))
+        return hash((self._path_id, self.line, self.character))
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Location):
             return False
-        return self._path == other._path and self.line == other.line and self.character == other.character
+        return self._path_id == other._path_id and self.line == other.line and self.character == other.character
 
     def __lt__(self, other: Location) -> bool:
         if not isinstance(other, Location):
             raise TypeError
-
-        if self._path is None and other._path is None:
-            return False
-        if self._path is None:
-            return True
-        if other._path is None:
-            return False
-        if self._path == other._path:
-            if self.line == other.line:
-                return (self.character or -1) < (other.character or -1)
-            return (self.line or -1) < (other.line or -1)  # line can be None if it's a file-global warning
-        return self._path < other._path
+        return self.sort_key < other.sort_key
 
 
 class Message:
+    __slots__ = ("code", "doc_url", "is_fixable", "location", "message", "sort_key", "source")
+
     def __init__(
         self,
         source: str,
@@ -83,16 +108,22 @@ class Message:
         doc_url: str | None = None,
         is_fixable: bool = False,
     ):
-        self.source = source
-        self.code = code
+        self.source = sys.intern(source)
+        self.code = sys.intern(code)
         self.location = location
         self.message = message
         self.doc_url = doc_url
         self.is_fixable = is_fixable
+        # what messages are sorted by, worked out once so that sorting them with
+        # ``sort_messages`` compares tuples rather than calling ``__lt__``
+        self.sort_key: tuple[Any, ...] = (*location.sort_key, code)
 
     def __repr__(self) -> str:
         return f"{self.source}-{self.code}"
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Message, (self.source, self.code, self.location, self.message, self.doc_url, self.is_fixable))
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Message):
             return False
@@ -101,9 +132,15 @@ class Message:
         return False
 
     def __lt__(self, other: Message) -> bool:
-        if self.location == other.location:
-            return self.code < other.code
-        return self.location < other.location
+        return self.sort_key < other.sort_key
+
+
+def sort_messages(messages: Iterable[Message]) -> list[Message]:
+    """
+    The messages in order of location, then code - the same order as ``sorted`` gives,
+    only quicker.
+    """
+    return sorted(messages, key=attrgetter("sort_key"))
 
 
 def make_tool_error_message(
@@ -118,3 +155,20 @@ def make_tool_error_message(
 ) -> Message:
     location = Location(path=filepath, module=module, function=function, line=line, character=character)
     return Message(source=source, code=code, location=location, message=message)
+
+
+def in_file_order(paths: Iterable[Path], messages: Iterable[Message]) -> list[Message]:
+    """
+    Put the messages in the order of the files they are about, keeping the order of the
+    messages about each file. Messages about any other path come last.
+    """
+    by_path: dict[Path | None, list[Message]] = defaultdict(list)
+    for message in messages:
+        by_path[message.location.path].append(message)
+
+    ordered: list[Message] = []
+    for path in paths:
+        ordered += by_path.pop(path, [])
+    for remaining in by_path.values():
+        ordered += remaining
+    return ordered
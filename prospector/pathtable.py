@@ -0,0 +1,115 @@
+"""
+The paths messages are about, each kept once for the whole run however many messages
+there are about it, and known by a small integer id.
+
+A check can produce hundreds of thousands of messages about a few thousand files.
+Rather than each message's location holding its own ``Path``, and the formatters
+working out how to show that path again for every message, locations hold the id of
+the path in ``PATHS``, and what is derived from a path - what it sorts by, and its
+form relative to the directory the output is relative to - is worked out once per
+path. The files ``FileFinder`` finds are added to the table as they are found, so the
+paths of the messages are the very objects the finder lists.
+
+Ids only mean something within the process which handed them out, so anything sent
+to another process carries the paths themselves.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+__all__ = ("PATHS", "PathTable")
+
+_MODULE_SUFFIX = re.compile(r"(\.__init__)?\.py$")
+
+
+class PathTable:
+    def __init__(self) -> None:
+        # the absolute paths by id
+        self._paths: list[Path] = []
+        self._sort_keys: list[tuple[str, ...]] = []
+        # the id of each absolute path, and of the strings absolute paths were given as
+        self._ids: dict[Path | str, int] = {}
+        # by the directory paths are relative to, the relative form of each path by id
+        self._relative: dict[Path | None, dict[int, Path]] = {}
+        self._module_names: dict[Path | None, dict[int, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __getitem__(self, path_id: int) -> Path:
+        return self._paths[path_id]
+
+    def intern(self, path: Path | str) -> int:
+        """
+        The id of the given path, made absolute, adding it to the table if need be.
+        """
+        path_id = self._ids.get(path)
+        if path_id is not None:
+            return path_id
+
+        absolute = path if isinstance(path, Path) else Path(path)
+        given_absolute = absolute.is_absolute()
+        if not given_absolute:
+            # relative to the current directory, which could change, so only the
+            # absolute path is kept
+            absolute = absolute.absolute()
+
+        path_id = self._ids.get(absolute)
+        if path_id is None:
+            path_id = len(self._paths)
+            self._paths.append(absolute)
+            # what paths compare by, as a tuple, so that sorting never calls back into Python
+            self._sort_keys.append(tuple(os.path.normcase(str(absolute)).split(os.sep)))
+            self._ids[absolute] = path_id
+        if given_absolute and isinstance(path, str):
+            self._ids[path] = path_id
+        return path_id
+
+    def interned(self, path: Path | str) -> Path:
+        """
+        The one absolute ``Path`` the table keeps for the given path.
+        """
+        return self._paths[self.intern(path)]
+
+    def sort_key(self, path_id: int) -> tuple[str, ...]:
+        """
+        What the path sorts by, in the same order as the paths themselves sort.
+        """
+        return self._sort_keys[path_id]
+
+    def relative(self, path_id: int, root: Path | None) -> Path:
+        """
+        The path relative to the given directory, or the absolute path if it is not in
+        that directory or there is no directory.
+        """
+        by_id = self._relative.get(root)
+        if by_id is None:
+            by_id = self._relative[root] = {}
+        relative = by_id.get(path_id)
+        if relative is None:
+            path = self._paths[path_id]
+            if root is not None and path.is_relative_to(root):
+                path = path.relative_to(root)
+            relative = by_id[path_id] = path
+        return relative
+
+    def module_name(self, path_id: int, root: Path | None) -> str:
+        """
+        The module the path is, as the pylint formatters head the messages about each
+        file with: the relative path, with dots for separators and no ``.py``.
+        """
+        by_id = self._module_names.get(root)
+        if by_id is None:
+            by_id = self._module_names[root] = {}
+        name = by_id.get(path_id)
+        if name is None:
+            name = str(self.relative(path_id, root)).replace(os.path.sep, ".")
+            name = by_id[path_id] = _MODULE_SUFFIX.sub("", name)
+        return name
+
+
+# The table for the whole run, and any other run in the same process
+PATHS = PathTable()
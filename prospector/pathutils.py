@@ -1,12 +1,22 @@
+import errno
 import mimetypes
 import os
 import re
+import stat
+from collections.abc import Mapping
 from pathlib import Path
 
 from prospector import identify
 
 _PYTHON_COMMAND_RE = re.compile(r"^python[0-9]?$")
 
+_EXECUTABLE = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+# Whether the files whose shebang had to be read are python scripts, by path, inode and
+# modification time. This lives as long as the process, so that watch mode and the daemon
+# do not read them again on every check.
+_SHEBANG_CACHE: dict[tuple[Path, int, int], bool] = {}
+
 
 def is_python_package(path: Path) -> bool:
     return path.is_dir() and (path / "__init__.py").exists()
@@ -17,35 +27,71 @@ def is_python_module(path: Path) -> bool:
     del encoding
     if mimetype == "text/x-python":
         return True
+    if mimetype is not None:
+        # a known extension of some other type of file
+        return False
 
-    executor = identify.parse_shebang_from_file(path)
+    # without a known extension, only executable files can be python scripts
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return False
+    if not stat.S_ISREG(stat_result.st_mode):
+        return False
+    # windows has no executable bit, so every file might be a script there
+    if os.name != "nt" and not stat_result.st_mode & _EXECUTABLE:
+        return False
+
+    key = (path, stat_result.st_ino, stat_result.st_mtime_ns)
+    if key not in _SHEBANG_CACHE:
+        _SHEBANG_CACHE[key] = _has_python_shebang(path)
+    return _SHEBANG_CACHE[key]
+
+
+def _has_python_shebang(path: Path) -> bool:
+    try:
+        with path.open("rb") as script:
+            executor = identify.parse_shebang(script)
+    except OSError as err:
+        if err.errno == errno.EINVAL:
+            return False
+        raise
     if executor is not None and len(executor) > 0:
         return _PYTHON_COMMAND_RE.match(Path(executor[0]).name) is not None
-
     return False
 
 
 def is_virtualenv(path: Path) -> bool:
-    clues = ("Scripts", "lib", "include") if os.name == "nt" else ("bin", "lib", "include")
+    # virtualenvs created by venv, and by virtualenv since version 20, have this marker
+    if (path / "pyvenv.cfg").is_file():
+        return True
 
     try:
-        # just get the name, iterdir returns absolute paths by default
-        dircontents = [obj.name for obj in path.iterdir()]
+        with os.scandir(path) as entries:
+            contents = {entry.name: entry.is_dir() for entry in entries}
     except (OSError, TypeError):
         # listdir failed, probably due to path length issues in windows
         return False
 
-    if not all(clue in dircontents for clue in clues):
+    return is_virtualenv_listing(contents)
+
+
+def is_virtualenv_listing(contents: Mapping[str, bool]) -> bool:
+    """
+    Whether a directory is a virtualenv, given the names of its entries mapped to whether
+    each of them is a directory, as listing the directory tells.
+    """
+    if contents.get("pyvenv.cfg") is False:
+        return True
+
+    clues = ("Scripts", "lib", "include") if os.name == "nt" else ("bin", "lib", "include")
+    if not all(contents.get(clue) for clue in clues):
         # we don't have the 3 directories which would imply
         # this is a virtualenvironment
         return False
 
-    if not all((path / clue).is_dir() for clue in clues):
-        # some of them are not actually directories
-        return False
-
     # if we do have all three directories, make sure that it's not
     # just a coincidence by doing some heuristics on the rest of
     # the directory
     # if there are more than 7 things it's probably not a virtualenvironment
-    return len(dircontents) <= 7
+    return len(contents) <= 7
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from prospector import tracing
+from prospector.encoding import SourceStore
 from prospector.message import Message
+from prospector.pathtable import PATHS
 from prospector.suppression import get_suppressions
 from prospector.tools.base import ToolBase
 
@@ -13,6 +16,7 @@ def filter_messages(
     tools: dict[str, ToolBase] | None = None,
     blending: bool = False,
     blend_combos: list[list[tuple[str, str]]] | None = None,
+    sources: SourceStore | None = None,
 ) -> list[Message]:
     """
     This method post-processes all messages output by all tools, in order to filter
@@ -32,14 +36,27 @@ def filter_messages(
     This method uses the information about suppressed messages from pylint to
     squash the unwanted redundant error from pyflakes and frosted.
     """
-    paths_to_ignore, lines_to_ignore, messages_to_ignore = get_suppressions(
-        filepaths, messages, tools, blending, blend_combos
-    )
+    # suppressions only matter in the files which have messages
+    with_messages = {message.location.path_id for message in messages}
+    with tracing.span("scan suppressions", "messages"):
+        paths_to_ignore, lines_to_ignore, messages_to_ignore = get_suppressions(
+            [path for path in filepaths if PATHS.intern(path) in with_messages],
+            messages,
+            tools,
+            blending,
+            blend_combos,
+            sources,
+        )
+
+    # the messages are looked up by the ids of their paths
+    ids_to_ignore = {_path_id(path) for path in paths_to_ignore}
+    lines_by_id = {_path_id(path): lines for path, lines in lines_to_ignore.items()}
+    messages_by_id = {_path_id(path): by_line for path, by_line in messages_to_ignore.items()}
 
     filtered = []
     for message in messages:
         # first get rid of the pylint informational messages
-        relative_message_path = message.location.path
+        path_id = message.location.path_id
 
         if message.source == "pylint" and message.code in (
             "suppressed-message",
@@ -48,20 +65,17 @@ def filter_messages(
             continue
 
         # some files are skipped entirely by messages
-        if relative_message_path in paths_to_ignore:
+        if path_id in ids_to_ignore:
             continue
 
         # some lines are skipped entirely by messages
-        if relative_message_path in lines_to_ignore and message.location.line in lines_to_ignore[relative_message_path]:
+        if path_id in lines_by_id and message.location.line in lines_by_id[path_id]:
             continue
 
         # and some lines have only certain messages explicitly ignored
-        if (
-            relative_message_path in messages_to_ignore
-            and message.location.line in messages_to_ignore[relative_message_path]
-        ):
+        if path_id in messages_by_id and message.location.line in messages_by_id[path_id]:
             matched = False
-            for ignore in messages_to_ignore[relative_message_path][message.location.line]:
+            for ignore in messages_by_id[path_id][message.location.line]:
                 if (ignore.source is None or message.source == ignore.source) and message.code in ignore.code:
                     matched = True
                     continue
@@ -72,3 +86,7 @@ def filter_messages(
         filtered.append(message)
 
     return filtered
+
+
+def _path_id(path: Path | None) -> int | None:
+    return None if path is None else PATHS.intern(path)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import codecs
+import copy
 import json
 import os
 import pkgutil
@@ -14,6 +15,11 @@ from prospector.tools import DEFAULT_TOOLS, TOOLS
 
 BUILTIN_PROFILE_PATH = (Path(__file__).parent / "profiles").absolute()
 
+# Parsed profile files, keyed by path, along with the modification time and size they
+# had when they were parsed. This mostly matters to long-running processes such as
+# the daemon, which load the same profiles over and over.
+_PARSED_PROFILES: dict[str, tuple[tuple[int, int], Any]] = {}
+
 
 class ProspectorProfile:
     def __init__(self, name: str, profile_dict: dict[str, Any], inherit_order: list[str]) -> None:
@@ -183,11 +189,21 @@ def _load_content(name_or_path: str | Path, profile_path: list[Path]) -> dict[st
 
         raise ProfileNotFound(str(name_or_path), profile_path)
 
-    with codecs.open(filename) as fct:
-        try:
-            return yaml.safe_load(fct) or {}
-        except yaml.parser.ParserError as parse_error:
-            raise CannotParseProfile(filename, parse_error) from parse_error
+    return _parse_profile_file(filename)
+
+
+def _parse_profile_file(filename: str) -> dict[str, Any]:
+    stat = os.stat(filename)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _PARSED_PROFILES.get(filename)
+    if cached is None or cached[0] != stamp:
+        with codecs.open(filename) as fct:
+            try:
+                cached = _PARSED_PROFILES[filename] = (stamp, yaml.safe_load(fct) or {})
+            except yaml.parser.ParserError as parse_error:
+                raise CannotParseProfile(filename, parse_error) from parse_error
+    # loading a profile modifies the content, so every caller needs its own copy
+    return copy.deepcopy(cached[1])
 
 
 def _ensure_list(value: Any) -> list[Any]:
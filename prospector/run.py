@@ -2,47 +2,132 @@ from __future__ import annotations
 
 import argparse
 import codecs
+import copy
+import functools
 import os.path
 import sys
 import warnings
 from datetime import datetime
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any, Callable, TextIO
 
-from prospector import blender, postfilter, tools
+from prospector import blender, daemon, executor, postfilter, suppression, tools, tracing, vcs
+from prospector.cache import CacheLookup, ResultCache
 from prospector.compat import is_relative_to
 from prospector.config import ProspectorConfig
 from prospector.config import configuration as cfg
+from prospector.dependencies import ImportGraph
 from prospector.exceptions import FatalProspectorException
 from prospector.finder import FileFinder
 from prospector.formatters import FORMATTERS, Formatter
-from prospector.message import Location, Message
+from prospector.message import Location, Message, in_file_order
+from prospector.pathutils import is_python_module
+from prospector.streaming import MessageStream
+from prospector.timing import Measurement, measure
 from prospector.tools import DEPRECATED_TOOL_NAMES
 from prospector.tools.base import ToolBase
 from prospector.tools.utils import CaptureOutput
 
 
+class ToolResult:
+    """
+    Everything a single tool run produced. This is what travels back from a worker
+    process when the tools run in parallel.
+    """
+
+    def __init__(self, messages: list[Message], cache_hits: int = 0, cache_misses: int = 0) -> None:
+        self.messages = messages
+        self.cache_hits = cache_hits
+        self.cache_misses = cache_misses
+        self.failed = False
+        self.timing = Measurement()
+        # the spans recorded while the tool ran, for --trace-out
+        self.trace_events: list[dict[str, Any]] = []
+
+
+# The files of a tool checking them one at a time are only split between worker
+# processes when each worker gets at least this many, as smaller shards cost more to
+# hand out and collect than they save
+_MIN_FILES_PER_SHARD = 8
+
+# When the messages are written out as each file is done, the files are also split into
+# shards of about this many, so that the first files are done early on
+_FILES_PER_STREAMED_SHARD = 32
+
+
+def _importers(found_files: FileFinder, changed: set[Path]) -> set[Path]:
+    """
+    The modules importing one of the changed files, directly or not, including the
+    modules importing one which was deleted, as they now fail to import it.
+    """
+    changed_modules = changed.intersection(found_files.python_modules)
+    removed = {path for path in changed if is_python_module(path) and not path.exists()}
+    if not changed_modules and not removed:
+        return set()
+    graph = ImportGraph(found_files.python_modules, read=found_files.sources.read, removed=removed)
+    return graph.dependents(changed_modules | removed) - removed
+
+
 class Prospector:
     def __init__(self, config: ProspectorConfig) -> None:
         self.config = config
         self.summary: dict[str, Any] | None = None
         self.messages = config.messages
+        self.found_files: FileFinder | None = None
+        self.cache: ResultCache | None = None
+        # what the previous check ran and found, kept for --watch to update
+        self._to_run: list[tuple[str, ToolBase]] = []
+        self._prospector_messages: list[Message] = []
+        self._tool_messages: list[list[Message]] = []
+        # how long blending, filtering and rendering the messages took
+        self._phase_timings: dict[str, Measurement] = {}
+        # while messages are written out as the tools run: the open targets of each of
+        # the reports doing so, by the index of the report, and the messages left to
+        # write out at the end
+        self._stream: MessageStream | None = None
+        self._stream_targets: dict[int, list[TextIO]] = {}
+        self._stream_leftover: list[Message] = []
+        if config.cache_dir is not None:
+            self.cache = ResultCache(config.cache_dir, config)
 
     def process_messages(
         self, found_files: FileFinder, messages: list[Message], tools: dict[str, tools.ToolBase]
+    ) -> list[Message]:
+        return self._process_messages(
+            found_files.python_modules, found_files, messages, tools, timings=self._phase_timings
+        )
+
+    def _process_messages(
+        self,
+        filepaths: list[Path],
+        found_files: FileFinder,
+        messages: list[Message],
+        tools: dict[str, tools.ToolBase],
+        timings: dict[str, Measurement],
     ) -> list[Message]:
         if self.config.blending:
-            messages = blender.blend(messages)
+            with measure() as timings["blend"], tracing.span("blend", "messages"):
+                messages = blender.blend(messages)
 
         if self.config.legacy_tool_names:
             updated = []
             new_names = {v: k for k, v in DEPRECATED_TOOL_NAMES.items()}
             for msg in messages:
-                msg.source = new_names.get(msg.source, msg.source)
+                if msg.source in new_names:
+                    # renamed on a copy, as the messages of the tools are kept from one check to the next
+                    msg = copy.copy(msg)
+                    msg.source = new_names[msg.source]
                 updated.append(msg)
             messages = updated
 
-        return postfilter.filter_messages(found_files.python_modules, messages, tools, self.config.blending)
+        with measure() as timings["postfilter"], tracing.span("postfilter", "messages"):
+            return postfilter.filter_messages(
+                filepaths, messages, tools, self.config.blending, sources=found_files.sources
+            )
+
+    def find_files(self) -> FileFinder:
+        paths = [Path(p) for p in self.config.paths]
+        return FileFinder(*paths, exclusion_filters=[self.config.make_exclusion_filter()])
 
     def execute(self) -> None:
         deprecated_names = self.config.replace_deprecated_tool_names()
@@ -53,8 +138,7 @@ class Prospector:
         }
         summary.update(self.config.get_summary_information())
 
-        paths = [Path(p) for p in self.config.paths]
-        found_files = FileFinder(*paths, exclusion_filters=[self.config.make_exclusion_filter()])
+        found_files = self.find_files()
         messages = []
 
         # see if any old tool names are run
@@ -76,9 +160,12 @@ class Prospector:
             messages.append(message)
             warnings.warn(msg, category=DeprecationWarning, stacklevel=0)
 
-        running_tools: dict[str, ToolBase] = {}
+        to_run: list[tuple[str, ToolBase]] = []
+
+        # pylint extends sys.path while it is configured and restores it once it has run,
+        # which does not happen in this process if it runs in a worker process
+        orig_sys_path = sys.path
 
-        # Run the tools
         for tool in self.config.get_tools(found_files):
             for name, cls in tools.TOOLS.items():
                 if cls == tool.__class__:
@@ -87,8 +174,295 @@ class Prospector:
             else:
                 toolname = "Unknown"
 
-            running_tools[toolname] = tool
+            to_run.append((toolname, tool))
+
+        # tools are configured with every file, so that they know about the whole project,
+        # but may then only need to check some of them
+        per_file_files, whole_project_files = self._files_to_check(found_files)
+
+        # every message about the modules ignored as a whole would be thrown away, so the
+        # tools checking files one at a time do not check them; the tools looking at the
+        # whole project still need them, for what the other modules use from them, and
+        # the postfilter throws away what they say about them
+        per_file_checked = per_file_files
+        if any(tool.file_scope is not None for _, tool in to_run):
+            with tracing.span("find ignored files", "discovery"):
+                ignored = suppression.get_ignored_files(
+                    per_file_files.python_modules, dict(to_run), self.config.blending, found_files.sources
+                )
+            if ignored:
+                per_file_checked = per_file_files.restricted_to(per_file_files.files - ignored)
+
+        # Run the tools
+        self._stream = self._start_stream(found_files, dict(to_run))
+        results = self._run_tools(
+            [
+                (toolname, tool, whole_project_files if tool.file_scope is None else per_file_checked)
+                for toolname, tool in to_run
+            ],
+            stream=self._stream,
+        )
+
+        sys.path = orig_sys_path
+
+        self.found_files = found_files
+        self._to_run = to_run
+        self._prospector_messages = messages
+        self._tool_messages = [result.messages for result in results]
+        self._finish(summary, whole_project_files, list(zip([toolname for toolname, _ in to_run], results)))
+
+    def update(self, changed: set[Path], found_files: FileFinder) -> None:
+        """
+        Check the given files again after they changed, along with the modules importing
+        them for the tools which look at the whole project, and keep the messages of the
+        previous check about every other file. Used by --watch.
 
+        :param changed: The files which changed, were created or were deleted
+        :param found_files: The files to check now, which may differ from the previous
+                            check if files were created or deleted
+        """
+        summary: dict[str, Any] = {
+            "started": datetime.now(),
+        }
+        summary.update(self.config.get_summary_information())
+
+        # the finder can be the one of the previous check, which has the old content
+        found_files.sources.forget(changed)
+        # taken once, as each access makes a new copy of the files found
+        all_files = found_files.files
+        present = changed & all_files
+        dependents = _importers(found_files, changed)
+        per_file_files = found_files.restricted_to(present)
+        whole_project_files = found_files.restricted_to(present | dependents)
+
+        # tools with nothing left to check keep their previous messages, apart from those
+        # about files which were deleted
+        to_check = []
+        for idx, (toolname, tool) in enumerate(self._to_run):
+            tool_files = whole_project_files if tool.file_scope is None else per_file_files
+            if tool_files.files:
+                to_check.append((idx, toolname, tool, tool_files))
+            else:
+                self._tool_messages[idx] = [
+                    message for message in self._tool_messages[idx] if message.location.path not in changed
+                ]
+
+        orig_sys_path = sys.path
+        results = self._run_tools([(toolname, tool, tool_files) for _, toolname, tool, tool_files in to_check])
+        sys.path = orig_sys_path
+
+        for (idx, _, tool, _), result in zip(to_check, results):
+            checked = changed if tool.file_scope is not None else changed | dependents
+            replaced = checked | {message.location.path for message in result.messages}
+            # messages which are not about a file, such as a tool failing to run, are
+            # only kept until the tool runs again
+            kept = [
+                message
+                for message in self._tool_messages[idx]
+                if message.location.path not in replaced and message.location.path in all_files
+            ]
+            self._tool_messages[idx] = kept + result.messages
+
+        self.found_files = found_files
+        self._finish(summary, found_files, list(zip([toolname for _, toolname, _, _ in to_check], results)))
+
+    def _run_tools(
+        self, to_run: list[tuple[str, ToolBase, FileFinder]], stream: MessageStream | None = None
+    ) -> list[ToolResult]:
+        """
+        Run the tools, spread over worker processes with --jobs. The files of the tools
+        which check files one at a time are split into shards, one per worker, and the
+        messages of the shards put back together file by file, so that the result does
+        not depend on the number of workers.
+
+        :param stream: Given the messages of each shard as soon as it is done. The shards
+                       are then also made small enough for the first files to be done
+                       early, even without worker processes.
+        """
+        workers = executor.resolve_jobs(self.config.jobs) if executor.can_run_in_parallel() else 1
+
+        # (whether the tool checks files one at a time, the number of the shard, the index
+        # of the tool, the task, and the files it checks)
+        tasks: list[tuple[bool, int, int, Callable[[], ToolResult], set[Path]]] = []
+        plans: list[tuple[CacheLookup | None, list[Path], int]] = []
+        # the files the cache has the messages of, and those messages
+        cached: list[tuple[set[Path], list[Message]]] = []
+        for index, (toolname, tool, found_files) in enumerate(to_run):
+            lookup = None
+            targets: list[Path] = []
+            shards: list[FileFinder] = [found_files]
+            if tool.file_scope is not None:
+                if self.cache is not None:
+                    lookup = self.cache.lookup(toolname, tool, found_files)
+                    targets = lookup.misses
+                    shards = [found_files.restricted_to(targets)] if targets else []
+                    cached.append((set(lookup.targets).difference(targets), lookup.cached))
+                else:
+                    targets = sorted(getattr(found_files, tool.file_scope))
+                if len(targets) >= 2 * _MIN_FILES_PER_SHARD:
+                    parts = min(workers, len(targets) // _MIN_FILES_PER_SHARD)
+                    if stream is not None:
+                        parts = max(parts, len(targets) // _FILES_PER_STREAMED_SHARD)
+                    shards = [found_files.restricted_to(part) for part in executor.split(targets, parts)]
+
+            per_file = tool.file_scope is not None
+            for number, shard in enumerate(shards):
+                checked = set(getattr(shard, tool.file_scope)) if tool.file_scope is not None else shard.files
+                task = functools.partial(self._run_tool, toolname, tool, shard)
+                tasks.append((per_file, number, index, task, checked))
+            plans.append((lookup, targets, len(shards)))
+
+        # the tools looking at the whole project usually take the longest, so the workers
+        # start with them and share out the shards afterwards, the first shard of every
+        # tool before the second one of any, so that the files of the first shards are
+        # done first
+        tasks.sort(key=lambda task: task[:2])
+
+        if stream is not None:
+            # every task has to be expected before any is done, for a file to only be
+            # handed out once all of them are
+            for _, _, _, _, checked in tasks:
+                stream.expect(checked)
+            for hits, _ in cached:
+                stream.expect(hits)
+            for hits, messages in cached:
+                stream.done(hits, messages)
+
+        def _stream_done(position: int, result: ToolResult) -> None:
+            if stream is not None:
+                stream.done(tasks[position][4], result.messages)
+
+        results: list[list[ToolResult]] = [[] for _ in plans]
+        done = executor.run_all(
+            [task[3] for task in tasks], jobs=self.config.jobs, on_done=_stream_done if stream is not None else None
+        )
+        for (_, _, index, _, _), result in zip(tasks, done):
+            results[index].append(result)
+            tracing.add(result.trace_events)
+
+        tool_results = []
+        for (lookup, targets, shard_count), shard_results in zip(plans, results):
+            messages = [message for result in shard_results for message in result.messages]
+            failed = any(result.failed for result in shard_results)
+            if lookup is not None and self.cache is not None and not failed:
+                tool_result = ToolResult(self.cache.store(lookup, messages), lookup.hits, len(lookup.misses))
+            elif shard_count > 1:
+                tool_result = ToolResult(in_file_order(targets, messages))
+            else:
+                tool_result = ToolResult(messages)
+            tool_result.failed = failed
+            tool_result.timing = Measurement.in_parallel(result.timing for result in shard_results)
+            tool_results.append(tool_result)
+        return tool_results
+
+    def _start_stream(self, found_files: FileFinder, tools: dict[str, ToolBase]) -> MessageStream | None:
+        """
+        Open the targets of the reports which write out each message on its own, and
+        have the messages about each file written to them as soon as the tools are done
+        with it, blended and filtered just as they are at the end of the check.
+        """
+        if self.config.summary_only:
+            return None
+        relative_to = self._paths_relative_to()
+        streamed: list[tuple[Formatter, list[TextIO]]] = []
+        for index, (output_format, output_files) in enumerate(self.config.get_output_report()):
+            if not FORMATTERS[output_format].streams_messages:
+                continue
+            targets: list[TextIO] = [
+                codecs.open(output_file, "w+")  # noqa: SIM115 - kept open until print_messages
+                for output_file in output_files
+            ]
+            if not output_files and not self.config.quiet:
+                targets.append(sys.stdout)
+            # the formatter is only used to render single messages, so needs no summary yet
+            streamed.append((FORMATTERS[output_format]({}, [], self.config.profile, relative_to), targets))
+            self._stream_targets[index] = targets
+        if not streamed:
+            return None
+
+        filepaths = set(found_files.python_modules)
+
+        def write(path: Path, messages: list[Message]) -> None:
+            messages = self._process_messages([path] if path in filepaths else [], found_files, messages, tools, {})
+            for formatter, targets in streamed:
+                for target in targets:
+                    for message in messages:
+                        target.write(formatter.render_message(message))
+                        target.write("\n")
+                    target.flush()
+
+        return MessageStream(write)
+
+    def _finish(self, summary: dict[str, Any], found_files: FileFinder, results: list[tuple[str, ToolResult]]) -> None:
+        messages = list(self._prospector_messages)
+        for tool_messages in self._tool_messages:
+            messages += tool_messages
+
+        self._phase_timings = {}
+        messages = self.process_messages(found_files, messages, dict(self._to_run))
+
+        summary["message_count"] = len(messages)
+        if self.cache is not None:
+            summary["cache_hits"] = sum(result.cache_hits for _, result in results)
+            summary["cache_misses"] = sum(result.cache_misses for _, result in results)
+        summary["completed"] = datetime.now()  # noqa: DTZ005
+
+        delta = summary["completed"] - summary["started"]
+        summary["time_taken"] = f"{delta.total_seconds():0.2f}"
+
+        external_config = []
+        for tool_name, configured_by in self.config.configured_by.items():
+            if configured_by is not None:
+                external_config.append((tool_name, configured_by))
+        if len(external_config) > 0:
+            summary["external_config"] = ", ".join(["{}: {}".format(*info) for info in external_config])
+
+        summary["timings"] = self._timings(results)
+
+        self.summary = summary
+        self.messages = self.config.messages + messages
+        if self._stream is not None:
+            self._stream_leftover = [
+                message for message in self.messages if message.location.path not in self._stream.streamed
+            ]
+
+    def _timings(self, results: list[tuple[str, ToolResult]]) -> dict[str, Any]:
+        tool_timings: dict[str, dict[str, Any]] = {}
+        for toolname, timing in self.config.configure_timings.items():
+            tool_timings[toolname] = {"configure": timing.as_dict()}
+        for toolname, result in results:
+            tool_timings.setdefault(toolname, {})["run"] = result.timing.as_dict()
+        phase_timings = {phase: timing.as_dict() for phase, timing in self._phase_timings.items()}
+        return {"tools": tool_timings, "phases": phase_timings}
+
+    def _files_to_check(self, found_files: FileFinder) -> tuple[FileFinder, FileFinder]:
+        """
+        Work out which files need checking: all of them, unless --changed-since is used.
+
+        :return: A tuple of the files to give to tools which check files one at a time, and
+                 of those to give to tools which look at the project as a whole. The latter
+                 also include the modules importing the changed ones, as messages about them
+                 may depend on what changed.
+        """
+        if self.config.changed_since is None:
+            return found_files, found_files
+
+        try:
+            changed = vcs.changed_files(self.config.workdir, self.config.changed_since)
+        except FatalProspectorException as fatal:
+            sys.stderr.write(f"FatalProspectorException: {fatal!s}\n")
+            sys.exit(2)
+
+        # the deleted files are left out of those to check, but not their importers
+        dependents = _importers(found_files, changed)
+        return found_files.restricted_to(changed), found_files.restricted_to(changed | dependents)
+
+    def _run_tool(self, toolname: str, tool: ToolBase, found_files: FileFinder) -> ToolResult:
+        result = ToolResult([])
+        messages = result.messages
+        # the spans of the tool are sent back with its messages, as it may run in a worker process
+        trace_mark = tracing.mark()
+        with measure() as result.timing, tracing.span(f"{toolname} run", "tool", files=len(found_files.files)):
             try:
                 # Tools can output to stdout/stderr in unexpected places, for example,
                 # pydocstyle emits warnings about __all__ and as pyroma exec's the setup.py
@@ -111,6 +485,7 @@ class Prospector:
                 sys.exit(2)
 
             except (SystemExit, Exception) as ex:  # pylint:disable=broad-except
+                result.failed = True
                 if self.config.die_on_tool_error:
                     raise FatalProspectorException(f"Tool {toolname} failed to run.") from ex
                 loc = Location(self.config.workdir, None, None, None, None)
@@ -127,23 +502,8 @@ class Prospector:
                 )
                 messages.append(message)
 
-        messages = self.process_messages(found_files, messages, running_tools)
-
-        summary["message_count"] = len(messages)
-        summary["completed"] = datetime.now()  # noqa: DTZ005
-
-        delta = summary["completed"] - summary["started"]
-        summary["time_taken"] = f"{delta.total_seconds():0.2f}"
-
-        external_config = []
-        for tool_name, configured_by in self.config.configured_by.items():
-            if configured_by is not None:
-                external_config.append((tool_name, configured_by))
-        if len(external_config) > 0:
-            summary["external_config"] = ", ".join(["{}: {}".format(*info) for info in external_config])
-
-        self.summary = summary
-        self.messages = self.messages + messages
+        result.trace_events = tracing.take(trace_mark)
+        return result
 
     def get_summary(self) -> dict[str, Any] | None:
         return self.summary
@@ -152,37 +512,60 @@ class Prospector:
         return self.messages
 
     def print_messages(self) -> None:
+        """
+        Write out every output report. The time taken to render a report cannot be part
+        of its own summary, so the summary only includes the rendering of the reports
+        written before it; after the last one, it includes them all.
+        """
         output_reports = self.config.get_output_report()
+        self._phase_timings.pop("render", None)
 
-        for report in output_reports:
+        relative_to = self._paths_relative_to()
+        for index, report in enumerate(output_reports):
             assert self.summary is not None
             output_format, output_files = report
             self.summary["formatter"] = output_format
 
-            relative_to = None
-            # use relative paths by default unless explicitly told otherwise (with a --absolute-paths flag)
-            # or if some paths passed to prospector are not relative to the CWD
-            if not self.config.absolute_paths and all(
-                is_relative_to(p, self.config.workdir) for p in self.config.paths
-            ):
-                relative_to = self.config.workdir
-
-            formatter = FORMATTERS[output_format](self.summary, self.messages, self.config.profile, relative_to)
-            if not output_files and not self.config.quiet:
-                self.write_to(formatter, sys.stdout)
-            for output_file in output_files:
-                with codecs.open(output_file, "w+") as target:
+            if index in self._stream_targets:
+                # the messages about the files were written out already, while the tools ran
+                formatter = FORMATTERS[output_format](
+                    self.summary, self._stream_leftover, self.config.profile, relative_to
+                )
+                for target in self._stream_targets[index]:
                     self.write_to(formatter, target)
+                    if target is not sys.stdout:
+                        target.close()
+            else:
+                formatter = FORMATTERS[output_format](self.summary, self.messages, self.config.profile, relative_to)
+                if not output_files and not self.config.quiet:
+                    self.write_to(formatter, sys.stdout)
+                for output_file in output_files:
+                    with codecs.open(output_file, "w+") as target:
+                        self.write_to(formatter, target)
+            if "render" in self._phase_timings:
+                self.summary["timings"]["phases"]["render"] = self._phase_timings["render"].as_dict()
+
+        self._stream = None
+        self._stream_targets = {}
+        self._stream_leftover = []
+
+    def _paths_relative_to(self) -> Path | None:
+        # use relative paths by default unless explicitly told otherwise (with a --absolute-paths flag)
+        # or if some paths passed to prospector are not relative to the CWD
+        if not self.config.absolute_paths and all(is_relative_to(p, self.config.workdir) for p in self.config.paths):
+            return self.config.workdir
+        return None
 
     def write_to(self, formatter: Formatter, target: TextIO) -> None:
         # Produce the output
-        target.write(
-            formatter.render(
+        with measure() as timing, tracing.span("render", "output", formatter=type(formatter).__name__):
+            output = formatter.render(
                 summary=not self.config.messages_only,
                 messages=not self.config.summary_only,
                 profile=self.config.show_profile,
             )
-        )
+        self._phase_timings["render"] = self._phase_timings.get("render", Measurement()) + timing
+        target.write(output)
         target.write("\n")
 
 
@@ -200,6 +583,18 @@ def main() -> None:
     # Get our configuration
     config = ProspectorConfig()
 
+    if config.daemon:
+        try:
+            daemon.serve(config.daemon_socket)
+        except FatalProspectorException as fatal:
+            sys.stderr.write(f"FatalProspectorException: {fatal!s}\n")
+            sys.exit(2)
+        sys.exit(0)
+    if config.watch and daemon.is_serving():
+        # the daemon runs one check at a time, and would never be done with this one
+        sys.stderr.write("--watch cannot be used through the prospector daemon\n")
+        sys.exit(2)
+
     paths = config.paths
     if len(paths) > 1 and not all(os.path.isfile(path) for path in paths):
         sys.stderr.write(f"\nIn multi-path mode, all inputs must be files, not directories, for {paths}.\n\n")
@@ -208,8 +603,17 @@ def main() -> None:
 
     # Make it so
     prospector = Prospector(config)
-    prospector.execute()
-    prospector.print_messages()
+    if config.watch:
+        # only imported for --watch, as it depends on parts of astroid which are not public
+        from prospector import watch  # pylint: disable=import-outside-toplevel
+
+        prospector = watch.watch(prospector)
+    else:
+        prospector.execute()
+        prospector.print_messages()
+
+    if config.trace_out is not None:
+        tracing.finish(config.trace_out)
 
     if config.exit_with_zero_on_success():
         # if we ran successfully, and the user wants us to, then we'll
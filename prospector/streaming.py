@@ -0,0 +1,55 @@
+"""
+Hands out the messages about each file as soon as every tool checking it is done, for
+the output formats which write messages out while the tools are still running.
+
+Blending and suppressions only ever combine messages about the same file, so once no
+tool has anything left to say about a file, its messages can be blended and filtered
+on their own, and come out just as they would at the end of the check.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Callable
+
+from prospector.message import Message
+
+__all__ = ("MessageStream",)
+
+
+class MessageStream:
+    """
+    Keeps track of which tools still have to report about each file.
+
+    Every task checking files is first announced with ``expect``, and then reported
+    ``done`` along with its messages. Once the last task checking a file is done, the
+    messages about it are given to ``handle``. Messages about files which no task was
+    expected to check, or which are not about a file at all, are left for the end of
+    the check.
+    """
+
+    def __init__(self, handle: Callable[[Path, list[Message]], None]) -> None:
+        self._handle = handle
+        self._pending: dict[Path, int] = defaultdict(int)
+        self._messages: dict[Path, list[Message]] = defaultdict(list)
+        # the files the messages of which were handed out
+        self.streamed: set[Path] = set()
+
+    def expect(self, paths: Iterable[Path]) -> None:
+        for path in paths:
+            self._pending[path] += 1
+
+    def done(self, paths: Iterable[Path], messages: Iterable[Message]) -> None:
+        for message in messages:
+            path = message.location.path
+            if path is not None and path in self._pending:
+                self._messages[path].append(message)
+
+        for path in paths:
+            self._pending[path] -= 1
+            if self._pending[path] == 0:
+                del self._pending[path]
+                self.streamed.add(path)
+                self._handle(path, self._messages.pop(path, []))
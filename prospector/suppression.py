@@ -18,13 +18,21 @@ in the file:
 
 This module's job is to attempt to collect all of these methods into
 a single coherent list of error suppression locations.
+
+Suppressions are only looked for in comments, and only in the modules which the tools
+had something to say about.
 """
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import io
 import re
+import tokenize
 import warnings
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from prospector import encoding
@@ -35,6 +43,22 @@ from prospector.tools.base import PEP8_IGNORE_LINE_CODE, ToolBase
 
 _FLAKE8_IGNORE_FILE = re.compile(r"flake8[:=]\s*noqa", re.IGNORECASE)
 _PEP8_IGNORE_LINE = re.compile(r"#\s*noqa(\s*#.*)?$", re.IGNORECASE)
+# the rest of a line from its first "#", where any suppression is
+_COMMENT_TAIL = re.compile(r"#.*")
+# the comments and strings of some code, stepped over to find whether a line starts in
+# the middle of a string much faster than the tokenizer can
+_COMMENT_OR_STRING = re.compile(
+    r"""
+    \#[^\n]*
+    | (?P<string>
+        \"\"\"(?:[^"\\]|\\.|"(?!""))*\"\"\"
+        | '''(?:[^'\\]|\\.|'(?!''))*'''
+        | "(?:[^"\\\n]|\\.)*"
+        | '(?:[^'\\\n]|\\.)*'
+    )
+    """,
+    re.VERBOSE | re.DOTALL,
+)
 _PYLINT_SUPPRESSED_MESSAGE = re.compile(r"^Suppressed \'([a-z0-9-]+)\' \(from line \d+\)$")
 
 
@@ -65,35 +89,147 @@ class Ignore:
         return hash((self.source, self.code))
 
 
-def get_noqa_suppressions(file_contents: list[str]) -> tuple[bool, set[int], dict[int, set[Ignore]]]:
-    """
-    Finds all pep8/flake8 suppression messages
-
-    :param file_contents:
-        A list of file lines
-    :return:
-        A pair - the first is whether to ignore the whole file, the
-        second is a set of (0-indexed) line numbers to ignore.
-    """
+def _noqa_suppressions(lines: Iterable[tuple[int, str]]) -> tuple[bool, set[int], dict[int, set[Ignore]]]:
     ignore_whole_file = False
     ignore_lines = set()
     messages_to_ignore: dict[int, set[Ignore]] = defaultdict(set)
-    for line_number, line in enumerate(file_contents):
+    for line_number, line in lines:
         if _FLAKE8_IGNORE_FILE.search(line):
             ignore_whole_file = True
         if _PEP8_IGNORE_LINE.search(line):
-            ignore_lines.add(line_number + 1)
+            ignore_lines.add(line_number)
         else:
             noqa_match = PEP8_IGNORE_LINE_CODE.search(line)
             if noqa_match:
                 prospector_ignore = noqa_match.group(1).strip().split(",")
                 prospector_ignore = [elem.strip() for elem in prospector_ignore]
                 for code in prospector_ignore:
-                    messages_to_ignore[line_number + 1].add(Ignore(None, code))
+                    messages_to_ignore[line_number].add(Ignore(None, code))
 
     return ignore_whole_file, ignore_lines, messages_to_ignore
 
 
+def get_noqa_suppressions(file_contents: list[str]) -> tuple[bool, set[int], dict[int, set[Ignore]]]:
+    """
+    Finds all pep8/flake8 suppression messages
+
+    :param file_contents:
+        A list of file lines
+    :return:
+        A pair - the first is whether to ignore the whole file, the
+        second is a set of (0-indexed) line numbers to ignore.
+    """
+    return _noqa_suppressions(enumerate(file_contents, 1))
+
+
+@functools.cache
+def _suppression_pattern(tool_patterns: tuple[re.Pattern[str], ...]) -> re.Pattern[str]:
+    """
+    A single regular expression matching wherever any of the noqa patterns or of the
+    given patterns of the tools does, to find the comments worth looking at in one go.
+    """
+    patterns = (_FLAKE8_IGNORE_FILE, _PEP8_IGNORE_LINE, PEP8_IGNORE_LINE_CODE, *tool_patterns)
+    alternatives = []
+    for pattern in dict.fromkeys(patterns):
+        flags = "i" if pattern.flags & re.IGNORECASE else "-i"
+        alternatives.append(f"(?{flags}:{pattern.pattern})")
+    return re.compile("|".join(alternatives))
+
+
+def _comments(text: str) -> dict[int, list[str]]:
+    """
+    The comments of some code, by line number. Code ending with brackets left open, such
+    as a line on its own, is fine.
+
+    :raises tokenize.TokenError: if the code ends in the middle of a string
+    :raises SyntaxError: if the code is not indented consistently
+    """
+    comments: dict[int, list[str]] = defaultdict(list)
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(text).readline):
+            if token.type == tokenize.COMMENT:
+                comments[token.start[0]].append(token.string)
+    except tokenize.TokenError as err:
+        # every comment is found before the end of the code
+        if "statement" not in err.args[0]:
+            raise
+    return comments
+
+
+def _suppression_comments(text: str, pattern: re.Pattern[str]) -> Iterator[tuple[int, str]]:
+    """
+    The comments of a module which the pattern matches, with their line number.
+
+    Every suppression starts with a ``#``, so only the rest of each line from its first
+    one is searched. The few lines where the pattern matches are then tokenized on their
+    own to leave out what only looks like a suppression in a string. Once a line cannot
+    be, as it starts in the middle of a string or is part of a longer one, the whole
+    module is tokenized and the comments of the remaining lines taken from it. If the
+    module cannot be tokenized, the rest of each line counts as a comment.
+    """
+    module_comments: dict[int, list[str]] | None = None
+    tokenized = True
+    line_number = 1
+    position = 0
+    comments_and_strings = _COMMENT_OR_STRING.finditer(text)
+    # the first comment or string not ending before the line being looked at
+    ahead = next(comments_and_strings, None)
+    for tail in _COMMENT_TAIL.finditer(text):
+        if pattern.search(tail.group()) is None:
+            continue
+        line_number += text.count("\n", position, tail.start())
+        position = tail.start()
+        if module_comments is None:
+            line_start = text.rfind("\n", 0, position) + 1
+            while ahead is not None and ahead.end() <= line_start:
+                ahead = next(comments_and_strings, None)
+            line_comments = None
+            if ahead is None or ahead.start() >= line_start or ahead.group("string") is None:
+                with contextlib.suppress(tokenize.TokenError, SyntaxError):
+                    line_comments = _comments(text[line_start : tail.end()])[1]
+            if line_comments is not None:
+                comments = line_comments
+            else:
+                try:
+                    module_comments = _comments(text)
+                except (tokenize.TokenError, SyntaxError):
+                    module_comments = {}
+                    tokenized = False
+        if module_comments is not None:
+            comments = module_comments.get(line_number, []) if tokenized else [tail.group()]
+        for comment in comments:
+            if pattern.search(comment):
+                yield line_number, comment
+
+
+def get_ignored_files(
+    filepaths: Iterable[Path],
+    tools: dict[str, ToolBase],
+    blending: bool,
+    sources: encoding.SourceStore,
+) -> set[Path]:
+    """
+    Find the modules which get_suppressions would ignore as a whole, because of a
+    ``flake8: noqa`` comment, or because one of the tools ignores them, such as pylint
+    with ``skip-file``. Every message about them would be thrown away, so they need not
+    be checked at all.
+    """
+    pattern = _suppression_pattern(
+        tuple(pattern for tool in tools.values() for pattern in tool.ignore_code_patterns) if blending else ()
+    )
+    ignored = set()
+    for filepath in filepaths:
+        try:
+            source = sources.read(filepath)
+        except encoding.CouldNotHandleEncoding:
+            continue
+        # the same comments as get_suppressions looks at, if there is anything like one
+        comments = _suppression_comments(source, pattern) if _FLAKE8_IGNORE_FILE.search(source) else iter(())
+        if _noqa_suppressions(comments)[0] or any(tool.ignores_file(source) for tool in tools.values()):
+            ignored.add(filepath)
+    return ignored
+
+
 def _parse_pylint_informational(
     messages: list[Message],
 ) -> tuple[set[Path | None], dict[Path | None, dict[int, list[str]]]]:
@@ -135,13 +271,21 @@ def get_suppressions(
     tools: dict[str, ToolBase] | None = None,
     blending: bool = False,
     blend_combos: list[list[tuple[str, str]]] | None = None,
+    sources: encoding.SourceStore | None = None,
 ) -> tuple[set[Path | None], dict[Path, set[int]], dict[Path | None, dict[int, set[Ignore]]]]:
     """
     Given every message which was emitted by the tools, and the
     list of files to inspect, create a list of files to ignore,
     and a map of filepath -> line-number -> codes to ignore
+
+    The files are read from ``sources`` when given, so that they are not read again
+    after the tools already read them.
     """
     tools = tools or {}
+    read = encoding.read_py_file if sources is None else sources.read
+    pattern = _suppression_pattern(
+        tuple(pattern for tool in tools.values() for pattern in tool.ignore_code_patterns) if blending else ()
+    )
     blend_combos = blend_combos or BLEND_COMBOS
     blend_combos_dict: dict[Ignore, set[Ignore]] = defaultdict(set)
     if blending:
@@ -158,13 +302,15 @@ def get_suppressions(
     # First deal with 'noqa' style messages
     for filepath in filepaths:
         try:
-            file_contents = encoding.read_py_file(filepath).split("\n")
+            comments = list(_suppression_comments(read(filepath), pattern))
         except encoding.CouldNotHandleEncoding as err:
             # TODO: this output will break output formats such as JSON
             warnings.warn(f"{err.path}: {err.__cause__}", ImportWarning, stacklevel=2)
             continue
+        if not comments:
+            continue
 
-        ignore_file, ignore_lines, file_messages_to_ignore = get_noqa_suppressions(file_contents)
+        ignore_file, ignore_lines, file_messages_to_ignore = _noqa_suppressions(comments)
         if ignore_file:
             paths_to_ignore.add(filepath)
         lines_to_ignore[filepath] |= ignore_lines
@@ -172,11 +318,11 @@ def get_suppressions(
             messages_to_ignore[filepath][line] |= codes_ignore
 
         if blending:
-            for line_number, line_content in enumerate(file_contents):
+            for line_number, comment in comments:
                 for tool_name, tool in tools.items():
-                    tool_ignores = tool.get_ignored_codes(line_content)
+                    tool_ignores = tool.get_ignored_codes(comment)
                     for tool_ignore, offset in tool_ignores:
-                        tools_ignore[filepath][line_number + 1 + offset].add(Ignore(tool_name, tool_ignore))
+                        tools_ignore[filepath][line_number + offset].add(Ignore(tool_name, tool_ignore))
 
     # Ignore the blending messages
     if blending:
@@ -0,0 +1,103 @@
+"""
+Measures the wall time, CPU time and peak memory of the parts of a check - configuring
+and running each tool, blending, filtering and rendering the messages - for the
+timings in the summary.
+
+The CPU time includes that of the processes started and waited for meanwhile, such as
+ruff, so that tools running an external program are not made to look free. The peak
+memory is the peak resident set size of the process up to the end of the measured
+part: the most memory the check needed by then, rather than what that part needed
+on its own, as memory is rarely given back to the system.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows, where the peak memory is simply not measured
+    resource = None  # type: ignore[assignment]
+
+__all__ = ("Measurement", "measure")
+
+
+class Measurement:
+    def __init__(self, wall_time: float = 0.0, cpu_time: float = 0.0, peak_rss: int | None = None) -> None:
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        # in bytes
+        self.peak_rss = peak_rss
+
+    def __add__(self, other: Measurement) -> Measurement:
+        """
+        Combine the measurements of work done one part after the other: the times add
+        up, and the peak memory is the highest of them.
+        """
+        peaks = [peak for peak in (self.peak_rss, other.peak_rss) if peak is not None]
+        return Measurement(self.wall_time + other.wall_time, self.cpu_time + other.cpu_time, max(peaks, default=None))
+
+    @classmethod
+    def in_parallel(cls, measurements: Iterable[Measurement]) -> Measurement:
+        """
+        Combine the measurements of work split between processes running at the same
+        time: the wall time is that of the part which took the longest, while the CPU
+        time of every part adds up, and the peak memory is that of the process which
+        needed the most.
+        """
+        combined = cls()
+        peaks = []
+        for measurement in measurements:
+            combined.wall_time = max(combined.wall_time, measurement.wall_time)
+            combined.cpu_time += measurement.cpu_time
+            if measurement.peak_rss is not None:
+                peaks.append(measurement.peak_rss)
+        combined.peak_rss = max(peaks, default=None)
+        return combined
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "wall_time": round(self.wall_time, 3),
+            "cpu_time": round(self.cpu_time, 3),
+            "peak_rss": self.peak_rss,
+        }
+
+
+def _children_cpu_time() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _peak_rss(who: int) -> int:
+    peak = resource.getrusage(who).ru_maxrss
+    # kilobytes, apart from on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@contextmanager
+def measure() -> Iterator[Measurement]:
+    """
+    Measure the body of the ``with`` statement. The measurement it gives is only filled
+    in once the body is done, even if it raised an exception.
+    """
+    measurement = Measurement()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time() + _children_cpu_time()
+    children_peak = _peak_rss(resource.RUSAGE_CHILDREN) if resource is not None else 0
+    try:
+        yield measurement
+    finally:
+        measurement.wall_time = time.perf_counter() - wall_start
+        measurement.cpu_time = time.process_time() + _children_cpu_time() - cpu_start
+        if resource is not None:
+            measurement.peak_rss = _peak_rss(resource.RUSAGE_SELF)
+            # the children only count if one of them set a new peak meanwhile
+            if _peak_rss(resource.RUSAGE_CHILDREN) > children_peak:
+                measurement.peak_rss = max(measurement.peak_rss, _peak_rss(resource.RUSAGE_CHILDREN))
@@ -7,6 +7,7 @@ from prospector.finder import FileFinder
 from prospector.message import Message
 from prospector.tools.base import ToolBase
 from prospector.tools.dodgy import DodgyTool
+from prospector.tools.duplicates import DuplicatesTool
 from prospector.tools.mccabe import McCabeTool
 from prospector.tools.profile_validator import ProfileValidationTool  # pylint: disable=cyclic-import
 from prospector.tools.pycodestyle import PycodestyleTool
@@ -66,6 +67,7 @@ TOOLS: dict[str, type[ToolBase]] = {
     "pylint": PylintTool,
     "pydocstyle": PydocstyleTool,
     "profile-validator": ProfileValidationTool,
+    "duplicates": DuplicatesTool,
     "vulture": _optional_tool("vulture"),
     "pyroma": _optional_tool("pyroma"),
     "pyright": _optional_tool("pyright"),
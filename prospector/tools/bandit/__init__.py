@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
 
 class BanditTool(ToolBase):
+    file_scope = "files"
+
     manager: BanditManager | None = None
     profile: str | None = None
     config_file: str | None = None
@@ -61,6 +63,9 @@ class BanditTool(ToolBase):
 
         self.manager.files_list = sorted(found_files.files)
         self.manager.exclude_files = []
+        # the manager keeps its results, so start afresh when checking the changed files again in watch mode
+        self.manager.results = []
+        self.manager.skipped = []
 
         if not self.manager.b_ts.tests:
             raise ValueError("No test will run for bandit")
@@ -16,6 +16,16 @@ PEP8_IGNORE_LINE_CODE = re.compile(r"#\s*noqa:([^#]*[^# ])(\s*#.*)?$", re.IGNORE
 
 
 class ToolBase(ABC):
+    # The FileFinder attribute listing the files this tool checks one at a time, each
+    # independently of the others ("python_modules" or "files"). Prospector can then
+    # cache and split up the work of the tool file by file. None means the tool looks
+    # at the project as a whole, so what it finds in one file can depend on others.
+    file_scope: str | None = None
+
+    # The regular expressions get_ignored_codes looks for. It is only given the comments
+    # which one of them matches, so a tool ignoring codes must list them.
+    ignore_code_patterns: tuple[re.Pattern[str], ...] = ()
+
     @abstractmethod
     def configure(
         self, prospector_config: ProspectorConfig, found_files: FileFinder
@@ -46,9 +56,18 @@ class ToolBase(ABC):
         """
         raise NotImplementedError
 
+    def ignores_file(self, source: str) -> bool:
+        """
+        Whether the tool ignores the whole of a python module, given its source. Prospector
+        then throws away every message about the module, whichever tool it comes from.
+        """
+        del source  # unused
+        return False
+
     def get_ignored_codes(self, line: str) -> list[tuple[str, int]]:
         """
-        Return a list of error codes and line offset that the tool will ignore from a line of code.
+        Return a list of error codes and line offset that the tool will ignore from a line of code,
+        or from a comment on it which matches one of the ``ignore_code_patterns``.
         """
         del line  # unused
         return []
@@ -4,7 +4,8 @@ from typing import TYPE_CHECKING
 
 from dodgy.checks import check_file_contents
 
-from prospector.encoding import CouldNotHandleEncoding, read_py_file
+from prospector import tracing
+from prospector.encoding import CouldNotHandleEncoding
 from prospector.finder import FileFinder
 from prospector.message import Location, Message
 from prospector.tools.base import ToolBase
@@ -19,18 +20,20 @@ def module_from_path(path: Path) -> str:
 
 
 class DodgyTool(ToolBase):
+    file_scope = "files"
+
     def configure(self, prospector_config: "ProspectorConfig", found_files: FileFinder) -> None:
         # empty: just implementing to satisfy the ABC contract
         pass
 
     def run(self, found_files: FileFinder) -> list[Message]:
         warnings = []
-        for filepath in found_files.files:
+        for filepath in tracing.per_file(found_files.files, "dodgy"):
             mimetype = mimetypes.guess_type(str(filepath.absolute()))
             if mimetype[0] is None or not mimetype[0].startswith("text/") or mimetype[1] is not None:
                 continue
             try:
-                contents = read_py_file(filepath)
+                contents = found_files.sources.read(filepath)
             except CouldNotHandleEncoding:
                 continue
             for line, code, message in check_file_contents(contents):
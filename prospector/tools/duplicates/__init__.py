@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import tokenize
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from prospector import tracing
+from prospector.encoding import CouldNotHandleEncoding
+from prospector.finder import FileFinder
+from prospector.message import Location, Message
+from prospector.pathtable import PATHS
+from prospector.tools.base import ToolBase
+from prospector.tools.duplicates.clones import ModuleTokens, find_clones, new_vocabulary, tokenise
+
+if TYPE_CHECKING:
+    from prospector.config import ProspectorConfig
+
+__all__ = ("DuplicatesTool",)
+
+
+class DuplicatesTool(ToolBase):
+    """
+    Finds the code copied from one place of the project to another, possibly with
+    names or values changed, across all the python modules at once.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.ignore_codes: list[str] = []
+        self.min_tokens = 100
+        self.ignore_identifiers = True
+        self.ignore_literals = True
+        self._workdir: Path | None = None
+
+    def configure(self, prospector_config: ProspectorConfig, _: Any) -> None:
+        self.ignore_codes = prospector_config.get_disabled_messages("duplicates")
+        self._workdir = Path(prospector_config.workdir).absolute()
+
+        options = prospector_config.tool_options("duplicates")
+        self.min_tokens = max(1, int(options.get("min-tokens", self.min_tokens)))
+        self.ignore_identifiers = bool(options.get("ignore-identifiers", self.ignore_identifiers))
+        self.ignore_literals = bool(options.get("ignore-literals", self.ignore_literals))
+
+    def run(self, found_files: FileFinder) -> list[Message]:
+        # code can be copied from or to any module of the project, even when only some of
+        # them are checked, as with --changed-since, so every module is compared, and the
+        # copies only reported if one of their two places is in a module checked
+        checked = set(found_files.python_modules)
+        vocabulary = new_vocabulary()
+        modules = []
+        for code_file in tracing.per_file(sorted(found_files.unrestricted.python_modules), "duplicates"):
+            try:
+                source = found_files.sources.read(code_file)
+                tokens, lines = tokenise(source, vocabulary, self.ignore_identifiers, self.ignore_literals)
+            except (CouldNotHandleEncoding, SyntaxError, tokenize.TokenError):
+                # the other tools already report the files which cannot be read or parsed
+                continue
+            modules.append(ModuleTokens(code_file, tokens, lines))
+
+        messages = []
+        for clone in find_clones(modules, self.min_tokens):
+            if clone.copy.path not in checked and clone.original.path not in checked:
+                continue
+            first_line, last_line = clone.copy_lines
+            original_first, original_last = clone.original_lines
+            original_path = PATHS.relative(PATHS.intern(clone.original.path), self._workdir)
+            location = Location(clone.copy.path, None, None, first_line, 0, line_end=last_line)
+            message = Message(
+                "duplicates",
+                "duplicate-code",
+                location,
+                f"Lines {first_line}-{last_line} duplicate lines {original_first}-{original_last} of {original_path}",
+            )
+            messages.append(message)
+
+        return [message for message in messages if message.code not in self.ignore_codes]
@@ -0,0 +1,318 @@
+"""
+Finds the blocks of code which are copies of each other among all the modules of a
+project, in time roughly linear in the size of the code.
+
+Each module is turned into a stream of normalised tokens: comments, blank lines and
+imports are left out, and names and literals can all be made the same token, so that
+a copy is still found once its names or values were changed, and a statement or item
+of a list repeating the one right before it is dropped. The stream is cut into
+overlapping runs of ``kgram`` tokens, each hashed with a rolling hash, and winnowing
+keeps the smallest hash of every ``window`` consecutive ones as the fingerprints of
+the module: any two blocks sharing ``kgram + window - 1`` tokens or more share at
+least one fingerprint, while only a small fraction of the hashes are kept.
+
+An inverted index maps each fingerprint to where it was first seen. Seeing it again
+makes a seed, which is checked token by token, as hashes can collide, and extended
+both ways into the longest block the two places have in common. Seeds within a block
+already found are skipped, so that each copy is only compared once, and a block found
+in many places is compared to the first of them rather than to each of the others.
+"""
+
+from __future__ import annotations
+
+import io
+import keyword
+import tokenize
+from array import array
+from collections import deque
+from pathlib import Path
+
+__all__ = ("Clone", "ModuleTokens", "find_clones", "fingerprints", "new_vocabulary", "tokenise")
+
+# The tokens laying out the code rather than saying anything, which a block is not
+# reported as starting or ending with
+_NEWLINE = 0
+_INDENT = 1
+_DEDENT = 2
+_LAYOUT = {tokenize.NEWLINE: _NEWLINE, tokenize.INDENT: _INDENT, tokenize.DEDENT: _DEDENT}
+
+_SKIPPED = frozenset((tokenize.COMMENT, tokenize.NL, tokenize.ENCODING, tokenize.ENDMARKER))
+_LITERALS = frozenset((tokenize.NUMBER, tokenize.STRING))
+# since python 3.12, f-strings are split into several tokens
+_FSTRING_START = getattr(tokenize, "FSTRING_START", None)
+_FSTRING_END = getattr(tokenize, "FSTRING_END", None)
+
+_NAME = "<name>"
+_LITERAL = "<literal>"
+
+# The longest runs of tokens hashed together: longer runs make fewer fingerprints
+# match by chance, shorter ones leave a wider window to pick fingerprints from
+_MAX_KGRAM = 25
+_BASE = 0x100000001B3
+_MASK = (1 << 64) - 1
+
+# The fewest different tokens a block is made of to be reported: with the names and
+# literals left out, tables of data, such as long lists of strings, are the same few
+# tokens over and over again, and so match each other at any offset, while even short
+# blocks of code are made of more
+_MIN_DISTINCT_TOKENS = 10
+
+# The longest units of code, such as the rows of a table or a simple statement, which
+# are only kept once when they are repeated one right after the other
+_MAX_REPEATED_UNIT = 20
+
+# How many tokens blocks are compared by at once, before going one token at a time
+_CHUNK = 32
+
+
+def new_vocabulary() -> dict[str, int]:
+    """
+    The table numbering the normalised tokens, to be shared by all the modules compared.
+    """
+    return {"<newline>": _NEWLINE, "<indent>": _INDENT, "<dedent>": _DEDENT}
+
+
+def tokenise(
+    source: str, vocabulary: dict[str, int], ignore_identifiers: bool = True, ignore_literals: bool = True
+) -> tuple[list[int], array[int]]:
+    """
+    The normalised tokens of a module, as their numbers in the vocabulary, and the line
+    each of them is on.
+
+    :raises tokenize.TokenError: If the source cannot be tokenised
+    :raises SyntaxError: If the indentation of the source is inconsistent
+    """
+    tokens: list[int] = []
+    lines: array[int] = array("i")
+    statement_start = True
+    in_import = False
+    # the parts of the f-string being read, and how deeply f-strings are nested in it
+    fstring: list[str] = []
+    fstring_depth = 0
+    fstring_line = 0
+
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        kind = token.type
+        if kind in _SKIPPED:
+            continue
+        if in_import:
+            if kind == tokenize.NEWLINE:
+                in_import = False
+                statement_start = True
+            continue
+        if fstring_depth:
+            fstring.append(token.string)
+            if kind == _FSTRING_START:
+                fstring_depth += 1
+            elif kind == _FSTRING_END:
+                fstring_depth -= 1
+            if fstring_depth:
+                continue
+            text = _LITERAL if ignore_literals else "".join(fstring)
+        elif kind == _FSTRING_START:
+            fstring = [token.string]
+            fstring_depth = 1
+            # the literal is numbered, and on the line it starts on, once it ends
+            fstring_line = token.start[0]
+            continue
+        elif kind == tokenize.NAME:
+            if statement_start and token.string in ("import", "from"):
+                in_import = True
+                continue
+            is_name = ignore_identifiers and not keyword.iskeyword(token.string)
+            text = _NAME if is_name else token.string
+        elif kind in _LITERALS:
+            text = _LITERAL if ignore_literals else token.string
+        elif kind in _LAYOUT:
+            tokens.append(_LAYOUT[kind])
+            lines.append(token.start[0])
+            if kind == tokenize.NEWLINE:
+                _drop_repeated_unit(tokens, lines)
+            statement_start = True
+            continue
+        else:
+            text = token.string
+
+        statement_start = False
+        tokens.append(vocabulary.setdefault(text, len(vocabulary)))
+        lines.append(fstring_line if kind == _FSTRING_END else token.start[0])
+        if text == ",":
+            _drop_repeated_unit(tokens, lines)
+    return tokens, lines
+
+
+def _drop_repeated_unit(tokens: list[int], lines: array[int]) -> None:
+    # once the tokens end a unit of code, such as a statement or an item of a list,
+    # which repeats the one right before, the repeat is dropped: tables of data are then
+    # a single row, rather than the same few tokens matching each other at any offset
+    end = tokens[-1]
+    for size in range(1, min(_MAX_REPEATED_UNIT, len(tokens) // 2) + 1):
+        if tokens[-1 - size] == end and tokens[-size:] == tokens[-2 * size : -size]:
+            del tokens[-size:]
+            del lines[-size:]
+            return
+
+
+class ModuleTokens:
+    def __init__(self, path: Path, tokens: list[int], lines: array[int]) -> None:
+        self.path = path
+        self.tokens = tokens
+        self.lines = lines
+
+    def line_span(self, start: int, length: int) -> tuple[int, int]:
+        """
+        The first and last lines of the given tokens, leaving out the line breaks and
+        changes of indentation at either end.
+        """
+        end = start + length - 1
+        while start < end and self.tokens[start] <= _DEDENT:
+            start += 1
+        while end > start and self.tokens[end] <= _DEDENT:
+            end -= 1
+        return self.lines[start], self.lines[end]
+
+
+class Clone:
+    """
+    A block of ``length`` tokens found at ``original_start`` in ``original``, and again,
+    further on in the same module or in a module sorting after it, at ``copy_start`` in
+    ``copy``.
+    """
+
+    def __init__(
+        self, original: ModuleTokens, original_start: int, copy: ModuleTokens, copy_start: int, length: int
+    ) -> None:
+        self.original = original
+        self.original_start = original_start
+        self.copy = copy
+        self.copy_start = copy_start
+        self.length = length
+
+    @property
+    def original_lines(self) -> tuple[int, int]:
+        return self.original.line_span(self.original_start, self.length)
+
+    @property
+    def copy_lines(self) -> tuple[int, int]:
+        return self.copy.line_span(self.copy_start, self.length)
+
+
+def fingerprints(tokens: list[int], kgram: int, window: int) -> list[tuple[int, int]]:
+    """
+    The hashes winnowing keeps of the runs of ``kgram`` tokens, with where their runs
+    start: the smallest of every ``window`` consecutive hashes, the rightmost one if
+    several are, each kept once however many windows it is the smallest of.
+    """
+    if len(tokens) < kgram:
+        return []
+    top = pow(_BASE, kgram - 1, _MASK + 1)
+    rolling = 0
+    for token in tokens[:kgram]:
+        rolling = (rolling * _BASE + token) & _MASK
+    hashes = [rolling]
+    for position in range(kgram, len(tokens)):
+        rolling = ((rolling - tokens[position - kgram] * top) * _BASE + tokens[position]) & _MASK
+        hashes.append(rolling)
+
+    kept = []
+    # the positions which can still be the smallest of a window, their hashes increasing
+    candidates: deque[int] = deque()
+    last = -1
+    for position, value in enumerate(hashes):
+        while candidates and hashes[candidates[-1]] >= value:
+            candidates.pop()
+        candidates.append(position)
+        if candidates[0] <= position - window:
+            candidates.popleft()
+        if position >= window - 1 and candidates[0] != last:
+            last = candidates[0]
+            kept.append((hashes[last], last))
+    return kept
+
+
+def _same_after(first: list[int], first_at: int, second: list[int], second_at: int) -> int:
+    # how many tokens are the same from the given positions on, comparing chunks of
+    # them at once, then one at a time within the first chunk which differs
+    limit = min(len(first) - first_at, len(second) - second_at)
+    length = 0
+    while length + _CHUNK <= limit and (
+        first[first_at + length : first_at + length + _CHUNK]
+        == second[second_at + length : second_at + length + _CHUNK]
+    ):
+        length += _CHUNK
+    while length < limit and first[first_at + length] == second[second_at + length]:
+        length += 1
+    return length
+
+
+def _same_before(first: list[int], first_at: int, second: list[int], second_at: int) -> int:
+    # how many tokens are the same right before the given positions
+    limit = min(first_at, second_at)
+    length = 0
+    while length + _CHUNK <= limit and (
+        first[first_at - length - _CHUNK : first_at - length]
+        == second[second_at - length - _CHUNK : second_at - length]
+    ):
+        length += _CHUNK
+    while length < limit and first[first_at - length - 1] == second[second_at - length - 1]:
+        length += 1
+    return length
+
+
+def _extend(original: ModuleTokens, original_at: int, copy: ModuleTokens, copy_at: int, kgram: int) -> Clone | None:
+    first, second = original.tokens, copy.tokens
+    if first[original_at : original_at + kgram] != second[copy_at : copy_at + kgram]:
+        # the hashes collided
+        return None
+    before = _same_before(first, original_at, second, copy_at)
+    after = kgram + _same_after(first, original_at + kgram, second, copy_at + kgram)
+    return Clone(original, original_at - before, copy, copy_at - before, before + after)
+
+
+def find_clones(modules: list[ModuleTokens], min_tokens: int) -> list[Clone]:
+    """
+    The blocks of at least ``min_tokens`` tokens which are found more than once among
+    the modules. Each block is reported against the first place it is found in, going
+    through the modules in the order given.
+
+    Code which repeats itself is not taken as a copy: within a module, the two places
+    a block is found in must not overlap, a block must be made of enough different
+    tokens, and a block overlapping one already found again in the same place is only
+    reported once.
+    """
+    kgram = min(min_tokens, _MAX_KGRAM)
+    window = min_tokens - kgram + 1
+
+    # the inverted index: where each fingerprint was first seen
+    first_seen: dict[int, tuple[int, int]] = {}
+    # by pair of modules and offset between them, the blocks of the first one already
+    # found again in the second one
+    found: dict[tuple[int, int, int], list[tuple[int, int]]] = {}
+    # by pair of modules, where the second one has the blocks reported
+    reported: dict[tuple[int, int], list[tuple[int, int]]] = {}
+    clones = []
+    for index, module in enumerate(modules):
+        for fingerprint, position in fingerprints(module.tokens, kgram, window):
+            original_index, original_at = first_seen.setdefault(fingerprint, (index, position))
+            if original_index == index and original_at == position:
+                continue
+            blocks = found.setdefault((original_index, index, position - original_at), [])
+            if any(start <= original_at < end for start, end in blocks):
+                continue
+            clone = _extend(modules[original_index], original_at, module, position, kgram)
+            if clone is None:
+                continue
+            blocks.append((clone.original_start, clone.original_start + clone.length))
+            if clone.length < min_tokens:
+                continue
+            if original_index == index and clone.original_start + clone.length > clone.copy_start:
+                continue
+            start, end = clone.copy_start, clone.copy_start + clone.length
+            if len(set(module.tokens[start:end])) < _MIN_DISTINCT_TOKENS:
+                continue
+            copies = reported.setdefault((original_index, index), [])
+            if any(start < other_end and other_start < end for other_start, other_end in copies):
+                continue
+            copies.append((start, end))
+            clones.append(clone)
+    return clones
@@ -1,9 +1,9 @@
-import ast
 from typing import TYPE_CHECKING, Any
 
 from mccabe import PathGraphingAstVisitor
 
-from prospector.encoding import CouldNotHandleEncoding, read_py_file
+from prospector import tracing
+from prospector.encoding import CouldNotHandleEncoding
 from prospector.finder import FileFinder
 from prospector.message import Location, Message, make_tool_error_message
 from prospector.tools.base import ToolBase
@@ -15,6 +15,8 @@ __all__ = ("McCabeTool",)
 
 
 class McCabeTool(ToolBase):
+    file_scope = "python_modules"
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.ignore_codes: list[str] = []
@@ -30,13 +32,9 @@ class McCabeTool(ToolBase):
     def run(self, found_files: FileFinder) -> list[Message]:
         messages = []
 
-        for code_file in found_files.python_modules:
+        for code_file in tracing.per_file(found_files.python_modules, "mccabe"):
             try:
-                contents = read_py_file(code_file)
-                tree = ast.parse(
-                    contents,
-                    filename=code_file,
-                )
+                tree = found_files.sources.tree(code_file)
             except CouldNotHandleEncoding as err:
                 messages.append(
                     make_tool_error_message(
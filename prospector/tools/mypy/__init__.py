@@ -72,6 +72,8 @@ def _run_in_subprocess(
 
 
 class MypyTool(ToolBase):
+    ignore_code_patterns = (_IGNORE_RE,)
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.checker = mypy.api
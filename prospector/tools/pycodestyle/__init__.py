@@ -8,8 +8,10 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from pep8ext_naming import NamingChecker
-from pycodestyle import PROJECT_CONFIG, USER_CONFIG, BaseReport, StyleGuide, register_check
+from pycodestyle import PROJECT_CONFIG, USER_CONFIG, BaseReport, Checker, StyleGuide, noqa, register_check
 
+from prospector import tracing
+from prospector.encoding import CouldNotHandleEncoding, SourceStore
 from prospector.finder import FileFinder
 from prospector.message import Location, Message
 from prospector.tools.base import ToolBase
@@ -25,6 +27,11 @@ class ProspectorReport(BaseReport):
         super().__init__(*args, **kwargs)
         self._prospector_messages: list[Message] = []
 
+    def start(self) -> None:
+        super().start()
+        # the same report is used again when only changed files are checked in watch mode
+        self._prospector_messages = []
+
     def error(self, line_number: int | None, offset: int, text: str, check: str) -> None:
         code = super().error(
             line_number,
@@ -65,17 +72,61 @@ class ProspectorReport(BaseReport):
         return self._prospector_messages
 
 
+class ProspectorChecker(Checker):
+    def __init__(self, filename: str, lines: list[str] | None, options: Any, sources: SourceStore | None) -> None:
+        super().__init__(filename, lines=lines, options=options)
+        # the store the lines come from, if they do
+        self.sources = sources
+
+    def check_ast(self) -> None:
+        if self.sources is None:
+            super().check_ast()
+            return
+
+        # the AST checks, such as pep8-naming, get the tree the other tools use rather
+        # than compiling the lines again
+        try:
+            tree = self.sources.tree(Path(self.filename))
+        except (SyntaxError, ValueError):
+            self.report_invalid_syntax()
+            return
+        for _, cls, _ in self._ast_checks:
+            checker = cls(tree, self.filename)
+            for lineno, offset, text, check in checker.run():
+                if not self.lines or not noqa(self.lines[lineno - 1]):
+                    self.report_error(lineno, offset, text, check)
+
+
 class ProspectorStyleGuide(StyleGuide):
     def __init__(self, config: ProspectorConfig, found_files: FileFinder, *args: Any, **kwargs: Any) -> None:
         self._config = config
         self._files = found_files
         self._module_paths = found_files.python_modules
+        self.sources = found_files.sources
 
         # Override the default reporter with our custom one.
         kwargs["reporter"] = ProspectorReport
 
         super().__init__(*args, **kwargs)
 
+    def input_file(
+        self, filename: str, lines: list[str] | None = None, expected: Any = None, line_offset: int = 0
+    ) -> int:
+        sources = None
+        if lines is None:
+            try:
+                # pycodestyle may change the lines it is given, so it gets its own copy
+                lines = list(self.sources.lines(Path(filename)))
+                sources = self.sources
+            except CouldNotHandleEncoding:
+                # pycodestyle has its own fallback for badly encoded files
+                pass
+        if self.options.verbose:
+            print(f"checking {filename}")
+        checker = ProspectorChecker(filename, lines=lines, options=self.options, sources=sources)
+        with tracing.span(filename, "file", tool="pycodestyle"):
+            return checker.check_all(expected=expected, line_offset=line_offset)
+
     def excluded(self, filename: str, parent: str | None = None) -> bool:
         if super().excluded(filename, parent):
             return True
@@ -90,6 +141,8 @@ class ProspectorStyleGuide(StyleGuide):
 
 
 class PycodestyleTool(ToolBase):
+    file_scope = "python_modules"
+
     checker: ProspectorStyleGuide | None = None
 
     def configure(
@@ -151,9 +204,10 @@ class PycodestyleTool(ToolBase):
 
         return configured_by, []
 
-    def run(self, _: Any) -> list[Message]:
+    def run(self, found_files: FileFinder) -> list[Message]:
         assert self.checker is not None
-        report = self.checker.check_files()
+        self.checker.sources = found_files.sources
+        report = self.checker.check_files([str(f.absolute()) for f in found_files.python_modules])
         return report.get_messages()
 
 
@@ -2,7 +2,8 @@ from typing import TYPE_CHECKING, Any
 
 from pydocstyle.checker import AllError, ConventionChecker
 
-from prospector.encoding import CouldNotHandleEncoding, read_py_file
+from prospector import tracing
+from prospector.encoding import CouldNotHandleEncoding
 from prospector.finder import FileFinder
 from prospector.message import Location, Message, make_tool_error_message
 from prospector.tools.base import ToolBase
@@ -15,6 +16,8 @@ __all__ = ("PydocstyleTool",)
 
 
 class PydocstyleTool(ToolBase):
+    file_scope = "python_modules"
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._code_files: list[str] = []
@@ -28,9 +31,9 @@ class PydocstyleTool(ToolBase):
 
         checker = ConventionChecker()
 
-        for code_file in found_files.python_modules:
+        for code_file in tracing.per_file(found_files.python_modules, "pydocstyle"):
             try:
-                for error in checker.check_source(read_py_file(code_file), str(code_file.absolute()), None):
+                for error in checker.check_source(found_files.sources.read(code_file), str(code_file.absolute()), None):
                     location = Location(path=code_file, module=None, function="", line=error.line, character=0)
                     message = Message(
                         source="pydocstyle",
@@ -3,9 +3,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from pyflakes.api import checkPath
+from pyflakes.checker import Checker
 from pyflakes.messages import Message as FlakeMessage
 from pyflakes.reporter import Reporter
 
+from prospector import tracing
+from prospector.encoding import CouldNotHandleEncoding
+from prospector.exceptions import PermissionMissing
 from prospector.finder import FileFinder
 from prospector.message import Location, Message
 from prospector.tools.base import ToolBase
@@ -133,7 +137,7 @@ class ProspectorReporter(Reporter):
         )
 
     # pylint: disable=too-many-arguments
-    def syntaxError(self, filename: str, msg: str, lineno: int, offset: int, text: str) -> None:
+    def syntaxError(self, filename: str, msg: str, lineno: int | None, offset: int | None, text: str | None) -> None:
         self.record_message(
             filename=filename,
             line=lineno,
@@ -158,6 +162,8 @@ class ProspectorReporter(Reporter):
 
 
 class PyFlakesTool(ToolBase):
+    file_scope = "python_modules"
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.ignore_codes: list[str] = []
@@ -169,7 +175,22 @@ class PyFlakesTool(ToolBase):
 
     def run(self, found_files: FileFinder) -> list[Message]:
         reporter = ProspectorReporter(ignore=self.ignore_codes)
-        for filepath in found_files.python_modules:
-            checkPath(str(filepath.absolute()), reporter)
+        for filepath in tracing.per_file(found_files.python_modules, "pyflakes"):
+            filename = str(filepath.absolute())
+            try:
+                tree = found_files.sources.tree(filepath)
+            except (CouldNotHandleEncoding, PermissionMissing, OSError):
+                # let pyflakes report the problem itself, as it does files it cannot read
+                checkPath(filename, reporter)
+            except SyntaxError as err:
+                reporter.syntaxError(filename, err.args[0], err.lineno, err.offset, err.text)
+            except ValueError:
+                reporter.unexpectedError(filename, "problem decoding source")
+            else:
+                # what pyflakes.api.check does, but with the tree shared with the other tools
+                checker = Checker(tree, filename=filename)
+                checker.messages.sort(key=lambda message: message.lineno)
+                for warning in checker.messages:
+                    reporter.flake(warning)
 
         return reporter.get_messages()
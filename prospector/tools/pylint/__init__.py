@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import ast
+import io
 import os
 import re
 import sys
+import tokenize
 from collections import defaultdict
 from collections.abc import Iterable
 from pathlib import Path
@@ -11,12 +14,15 @@ from typing import TYPE_CHECKING, Any
 from pylint.config import find_default_config_files
 from pylint.exceptions import UnknownMessageError
 from pylint.lint.run import _cpu_count
+from pylint.utils.pragma_parser import ATOMIC_KEYWORDS, OPTION_PO, PragmaParserError, parse_pragma
 
+from prospector.cache import ResultCache
 from prospector.finder import FileFinder
-from prospector.message import Location, Message
+from prospector.message import Location, Message, sort_messages
 from prospector.tools.base import ToolBase
 from prospector.tools.pylint.collector import Collector
 from prospector.tools.pylint.linter import ProspectorLinter
+from prospector.tools.pylint.module_cache import ModuleCache
 
 if TYPE_CHECKING:
     from prospector.config import ProspectorConfig
@@ -25,6 +31,8 @@ _UNUSED_WILDCARD_IMPORT_RE = re.compile(r"^Unused import(\(s\))? (.*) from wildc
 
 _IGNORE_RE = re.compile(r"#\s*pylint:\s*disable=([^#]*[^#\s])(\s*#.*)?$", re.IGNORECASE)
 _IGNORE_NEXT_RE = re.compile(r"#\s*pylint:\s*disable-next=([^#]*[^#\s])(\s*#.*)?$", re.IGNORECASE)
+# anything which may be a pragma making pylint ignore a whole module
+_IGNORE_FILE_RE = re.compile(r"\bpylint:.*\b(skip-file|disable-all|all)\b")
 
 
 def _is_in_dir(subpath: Path, path: Path) -> bool:
@@ -36,10 +44,13 @@ class PylintTool(ToolBase):
     # be functions (they don't use the 'self' argument) but that would
     # make this module/class a bit ugly.
 
+    ignore_code_patterns = (_IGNORE_RE, _IGNORE_NEXT_RE)
+
     def __init__(self) -> None:
         self._args: Any = None
         self._collector: Collector | None = None
         self._linter: ProspectorLinter | None = None
+        self._result_cache: ResultCache | None = None
         self._orig_sys_path: list[str] = []
 
     def _prospector_configure(self, prospector_config: ProspectorConfig, linter: ProspectorLinter) -> list[Message]:
@@ -138,6 +149,8 @@ class PylintTool(ToolBase):
         if linter.config.jobs == 0:
             linter.config.jobs = _cpu_count()
         self._linter = linter
+        cache_dir = prospector_config.cache_dir
+        self._result_cache = ResultCache(cache_dir, prospector_config) if cache_dir is not None else None
         return configured_by, config_messages
 
     def _set_path_finder(self, extra_sys_path: list[Path], pylint_options: dict[str, Any]) -> None:
@@ -258,18 +271,48 @@ class PylintTool(ToolBase):
         This method will combine these into a single warning.
         """
         combined = self._combine_w0614(messages)
-        return sorted(combined)
+        return sort_messages(combined)
 
     def run(self, found_files: FileFinder) -> list[Message]:
         assert self._collector is not None
         assert self._linter is not None
 
-        self._linter.check(self._args)
+        # the files to check may have been narrowed down since configuration, for
+        # example by --changed-since, so they are worked out again from found_files
+        self._linter.set_found_files(found_files)
+        if self._result_cache is not None:
+            # the modules checked depend on those they import, which may not be checked
+            self._linter.set_module_cache(ModuleCache(self._result_cache, found_files.unrestricted))
+        # the tool may run more than once, as with --watch
+        self._collector.clear()
+        self._linter.check([str(path) for path in self._get_pylint_check_paths(found_files)])
         sys.path = self._orig_sys_path
 
         messages = self._collector.get_messages()
         return self.combine(messages)
 
+    def ignores_file(self, source: str) -> bool:
+        # the pragmas are found the way pylint finds them, which it only does in the
+        # modules it can parse; it reports a syntax error in the others
+        if _IGNORE_FILE_RE.search(source) is None:
+            return False
+        try:
+            ast.parse(source)
+            tokens = list(tokenize.generate_tokens(io.StringIO(source).readline))
+        except (SyntaxError, ValueError, tokenize.TokenError):
+            return False
+        for token in tokens:
+            match = OPTION_PO.search(token.string) if token.type == tokenize.COMMENT else None
+            if match is None:
+                continue
+            try:
+                for pragma in parse_pragma(match.group(2)):
+                    if pragma.action in ATOMIC_KEYWORDS or (pragma.action == "disable" and "all" in pragma.messages):
+                        return True
+            except PragmaParserError:
+                continue
+        return False
+
     def get_ignored_codes(self, line: str) -> list[tuple[str, int]]:
         match = _IGNORE_RE.search(line)
         if match:
@@ -0,0 +1,149 @@
+"""
+Keeps astroid's cache of analysed modules in step with the files on disk, for
+processes which run pylint more than once, such as the daemon and watch mode.
+
+pylint asks astroid for the module of each file it checks, and astroid hands back
+the module it analysed before, if any, whether or not the file changed since.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import os
+import sysconfig
+from pathlib import Path
+from typing import Any
+
+from astroid import MANAGER
+from astroid.inference_tip import clear_inference_tip_cache
+
+from prospector.compat import is_relative_to
+from prospector.dependencies import ImportGraph
+
+__all__ = ("AstroidCache",)
+
+# Files changed this long before a check started may still have been changed while it
+# ran, as file modification times are only updated every few clock ticks
+_MODIFICATION_TIME_MARGIN_NS = 1_000_000_000
+
+# astroid's caches of what it derives from the modules it analysed, which need
+# clearing when a module changes. This mirrors AstroidManager.clear_cache, apart
+# from forgetting the analysed modules themselves. They are private to astroid, so
+# are only looked up when clearing them, and skipped if they cannot be found.
+_ASTROID_DERIVED_CACHES = (
+    ("astroid.nodes._base_nodes", "LookupMixIn.lookup"),
+    ("astroid.modutils", "_cache_normalize_path_"),
+    ("astroid.modutils", "_has_init"),
+    ("astroid.modutils", "cached_os_path_isfile"),
+    ("astroid.interpreter._import.util", "is_namespace"),
+    ("astroid.interpreter.objectmodel", "ObjectModel.attributes"),
+    ("astroid.nodes.scoped_nodes", "ClassDef._metaclass_lookup_attribute"),
+    ("astroid.interpreter._import.spec", "_find_spec"),
+    ("astroid.interpreter._import.spec", "_is_setuptools_namespace"),
+)
+
+
+def _stamp(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _has_failed_imports() -> bool:
+    try:
+        lookups = MANAGER._mod_file_cache  # pylint: disable=protected-access
+    except AttributeError:
+        # there is no telling in this version of astroid, so assume there are
+        return True
+    return any(isinstance(found, Exception) for found in lookups.values())
+
+
+class AstroidCache:
+    """
+    Keeps astroid's cache of analysed modules in step with the files on disk: when a
+    module changes, its analysis is dropped, as well as the analysis of the modules
+    which import it, since what astroid inferred about them may depend on it.
+    """
+
+    def __init__(self) -> None:
+        # the modification time and size of the file of every module astroid analysed
+        self._stamps: dict[str, tuple[int, int]] = {}
+        self._installed = [Path(sysconfig.get_paths()[name]) for name in ("stdlib", "platstdlib", "purelib", "platlib")]
+
+    def _is_installed(self, path: str) -> bool:
+        return any(is_relative_to(Path(path), directory) for directory in self._installed)
+
+    def refresh(self) -> None:
+        """
+        Forget the analysis of the modules which changed since they were analysed, and
+        the modules astroid failed to find.
+        """
+        changed = {path for path, stamp in self._stamps.items() if _stamp(path) != stamp}
+        if not changed:
+            if _has_failed_imports():
+                # the modules astroid could not find may have been created since
+                self._clear_derived_caches()
+            return
+
+        if any(self._is_installed(path) for path in changed):
+            # something was installed or upgraded, so start over
+            MANAGER.clear_cache()
+            self._stamps.clear()
+            return
+
+        project_modules = [Path(path) for path in self._stamps if not self._is_installed(path)]
+        graph = ImportGraph(project_modules)
+        stale = changed | {str(path) for path in graph.dependents(Path(path) for path in changed)}
+
+        for name, module in list(MANAGER.astroid_cache.items()):
+            if module.file in stale:
+                del MANAGER.astroid_cache[name]
+        for path in stale:
+            self._stamps.pop(path, None)
+
+        self._clear_derived_caches()
+
+    def _clear_derived_caches(self) -> None:
+        clear_inference_tip_cache()
+
+        with contextlib.suppress(ImportError):
+            from astroid.context import _invalidate_cache  # pylint: disable=import-outside-toplevel
+
+            _invalidate_cache()
+        with contextlib.suppress(AttributeError):
+            MANAGER._mod_file_cache.clear()  # pylint: disable=protected-access
+
+        for module_name, qualified_name in _ASTROID_DERIVED_CACHES:
+            try:
+                cached: Any = importlib.import_module(module_name)
+                for attribute in qualified_name.split("."):
+                    cached = getattr(cached, attribute)
+            except (ImportError, AttributeError):
+                # moved or removed in this version of astroid
+                continue
+            cached.cache_clear()
+
+        with contextlib.suppress(ImportError, AttributeError):
+            from astroid.interpreter._import import spec  # pylint: disable=import-outside-toplevel
+
+            for finder in spec._SPEC_FINDERS:  # pylint: disable=protected-access
+                finder.find_module.cache_clear()
+
+    def record(self, started_ns: int) -> None:
+        """
+        Remember the state of the files of the modules astroid analysed during a check.
+        """
+        for name, module in list(MANAGER.astroid_cache.items()):
+            path = module.file
+            if not path or path in self._stamps:
+                continue
+            stamp = _stamp(path)
+            if stamp is None or stamp[0] >= started_ns - _MODIFICATION_TIME_MARGIN_NS:
+                # it may have changed after astroid analysed it, so there is no telling
+                # whether the analysis is up to date
+                del MANAGER.astroid_cache[name]
+                continue
+            self._stamps[path] = stamp
@@ -42,3 +42,6 @@ class Collector(BaseReporter):
 
     def get_messages(self) -> list[Message]:
         return self._messages
+
+    def clear(self) -> None:
+        self._messages = []
@@ -1,27 +1,116 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+import contextlib
+import functools
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from packaging import version as packaging_version
 from pylint import version as pylint_version
+from pylint.checkers import BaseChecker, BaseRawFileChecker, BaseTokenChecker
 from pylint.config.config_initialization import _config_initialization
 from pylint.lint import PyLinter
+from pylint.utils import ASTWalker
 
+from prospector import executor
 from prospector.finder import FileFinder
+from prospector.tools.pylint.parallel import check_by_module
+
+if TYPE_CHECKING:
+    from astroid import nodes
+
+    from prospector.tools.pylint.module_cache import ModuleCache
 
 
 class UnrecognizedOptions(Exception):
     """Raised when an unrecognized option is found in the Pylint configuration."""
 
 
+class CheckerPlan:
+    """
+    The checkers which can report anything with the messages enabled for the run, and
+    the callbacks walking the AST of a module calls on them.
+
+    Pylint works these out whenever it starts checking modules, which it does once for
+    a whole run, but once for every module when they are checked one at a time, by
+    ``check_by_module``. Most of the checkers are then compared and sorted, and looked
+    through for their visit methods, for every module: planning it once, for the
+    messages enabled as a whole, leaves only opening and closing the checkers needed.
+    """
+
+    def __init__(self, linter: PyLinter) -> None:
+        self.checkers: list[BaseChecker] = PyLinter.prepare_checkers(linter)
+        self.tokencheckers = [checker for checker in self.checkers if isinstance(checker, BaseTokenChecker)]
+        self.rawcheckers = [checker for checker in self.checkers if isinstance(checker, BaseRawFileChecker)]
+        walker = ASTWalker(linter)
+        for checker in self.checkers:
+            walker.add_checker(checker)
+        self.visit_events = walker.visit_events
+        self.leave_events = walker.leave_events
+
+    def make_walker(self, linter: PyLinter) -> ASTWalker:
+        walker = ASTWalker(linter)
+        walker.visit_events = self.visit_events
+        walker.leave_events = self.leave_events
+        return walker
+
+
 class ProspectorLinter(PyLinter):
     def __init__(self, found_files: FileFinder, *args: Any, **kwargs: Any) -> None:
         self._files = found_files
+        self._module_cache: ModuleCache | None = None
+        self._checker_plan: CheckerPlan | None = None
         # set up the standard PyLint linter
         PyLinter.__init__(self, *args, **kwargs)
 
+    def set_found_files(self, found_files: FileFinder) -> None:
+        self._files = found_files
+
+    def set_module_cache(self, module_cache: ModuleCache | None) -> None:
+        self._module_cache = module_cache
+
+    def initialize(self) -> None:
+        super().initialize()
+        # the messages enabled as a whole are settled for the run by now
+        self._checker_plan = CheckerPlan(self)
+
+    def prepare_checkers(self) -> list[BaseChecker]:
+        if self._checker_plan is None:
+            return super().prepare_checkers()
+        if not self.config.reports:
+            self.disable_reporters()
+        return list(self._checker_plan.checkers)
+
+    @contextlib.contextmanager
+    def _astroid_module_checker(self) -> Iterator[Callable[[nodes.Module], bool | None]]:
+        plan = self._checker_plan
+        if plan is None:
+            with super()._astroid_module_checker() as check_astroid_module:
+                yield check_astroid_module
+            return
+
+        walker = plan.make_walker(self)
+        for checker in plan.checkers:
+            checker.open()
+        yield functools.partial(
+            self.check_astroid_module,
+            walker=walker,
+            tokencheckers=plan.tokencheckers,
+            rawcheckers=plan.rawcheckers,
+        )
+        self.stats.statement = walker.nbstatements
+        for checker in reversed(plan.checkers):
+            checker.close()
+
+    def check(self, files_or_modules: Sequence[str]) -> None:
+        # rather than pylint's own parallel mode, which has to pickle the linter
+        parallel = self.config.jobs > 1 and executor.can_run_in_parallel()
+        if (parallel or self._module_cache is not None) and not self.config.from_stdin:
+            check_by_module(self, files_or_modules, self.config.jobs if parallel else 1, self._module_cache)
+        else:
+            super().check(files_or_modules)
+
     # Largely inspired by https://github.com/pylint-dev/pylint/blob/main/pylint/config/config_initialization.py#L26
     def config_from_file(self, config_file: str | Path | None = None) -> bool:
         """Initialize the configuration from a file."""
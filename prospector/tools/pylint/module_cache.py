@@ -0,0 +1,129 @@
+"""
+A persistent cache of what pylint found in each module, for ``check_by_module`` to
+replay rather than checking the modules again.
+
+What pylint finds in a module depends on the modules it imports, as it infers what
+they hold, so an entry is only valid as long as neither the module nor any module of
+the project it imports, directly or not, changed: entries are keyed by the
+``dependency_digests`` of the modules. Everything else which can change what pylint
+finds is part of the fingerprint of the store, as for the other tools.
+
+Every message pylint gave is kept, including the ``suppressed-message`` and
+``file-ignored`` ones the suppressions are worked out from, as well as the imports
+of the module, so that the cyclic imports are found among all the modules, whether
+they were checked again or not. A module for which any other checker looks at the
+project as a whole is not kept, as there is no telling what its data would be.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pylint.interfaces import CONFIDENCE_MAP, UNDEFINED
+from pylint.message import Message as PylintMessage
+from pylint.typing import FileItem, MessageLocationTuple
+from pylint.utils import LinterStats
+
+from prospector.cache import ResultCache, dependency_digests
+from prospector.tools.pylint.parallel import ModuleResult
+
+if TYPE_CHECKING:
+    from prospector.finder import FileFinder
+
+__all__ = ("ModuleCache",)
+
+# The checker whose data, the import graph, is kept along with the messages
+_IMPORTS_CHECKER = "imports"
+
+
+def _message_to_dict(message: PylintMessage) -> dict[str, Any]:
+    return {
+        "msg_id": message.msg_id,
+        "symbol": message.symbol,
+        "msg": message.msg,
+        "confidence": message.confidence.name,
+        "location": list(message.location),
+    }
+
+
+def _message_from_dict(data: dict[str, Any]) -> PylintMessage:
+    return PylintMessage(
+        data["msg_id"],
+        data["symbol"],
+        MessageLocationTuple(*data["location"]),
+        data["msg"],
+        CONFIDENCE_MAP.get(data["confidence"], UNDEFINED),
+    )
+
+
+def _graph_to_dict(graph: dict[str, set[str]]) -> dict[str, list[str]]:
+    return {name: sorted(imported) for name, imported in graph.items()}
+
+
+def _graph_from_dict(data: dict[str, list[str]]) -> defaultdict[str, set[str]]:
+    return defaultdict(set, {name: set(imported) for name, imported in data.items()})
+
+
+def _result_from_dict(data: dict[str, Any]) -> ModuleResult:
+    map_data: defaultdict[str, list[Any]] = defaultdict(list)
+    for graph, excluded in data["imports"]:
+        map_data[_IMPORTS_CHECKER].append((_graph_from_dict(graph), _graph_from_dict(excluded)))
+    messages = [_message_from_dict(message) for message in data["messages"]]
+    return ModuleResult(data["base_name"], messages, LinterStats(), data["msg_status"], map_data)
+
+
+class ModuleCache:
+    def __init__(self, result_cache: ResultCache, found_files: FileFinder) -> None:
+        self._result_cache = result_cache
+        self._store_path = result_cache.store_path("pylint")
+        self._entries = result_cache.load(self._store_path)
+        self._digests = dependency_digests(found_files)
+        self._changed = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, fileitem: FileItem) -> ModuleResult | None:
+        """
+        What checking the module found, if it is in the cache and still valid.
+        """
+        digest = self._digests.get(Path(fileitem.filepath))
+        entry = self._entries.get(fileitem.filepath)
+        result = None
+        if digest is not None and entry is not None and entry.get("hash") == digest:
+            try:
+                result = _result_from_dict(entry) if entry["name"] == fileitem.name else None
+            except (KeyError, TypeError, ValueError):
+                # written by something else than this version of prospector
+                result = None
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, fileitem: FileItem, result: ModuleResult) -> None:
+        """
+        Keep what checking the module found.
+        """
+        digest = self._digests.get(Path(fileitem.filepath))
+        if digest is None or set(result.map_data) - {_IMPORTS_CHECKER}:
+            return
+        self._entries[fileitem.filepath] = {
+            "hash": digest,
+            "name": fileitem.name,
+            "base_name": result.base_name,
+            "msg_status": result.msg_status,
+            "messages": [_message_to_dict(message) for message in result.messages],
+            "imports": [
+                [_graph_to_dict(graph), _graph_to_dict(excluded)]
+                for graph, excluded in result.map_data[_IMPORTS_CHECKER]
+            ],
+        }
+        self._changed = True
+
+    def save(self) -> None:
+        if self._changed:
+            self._result_cache.save(self._store_path, self._entries)
+            self._changed = False
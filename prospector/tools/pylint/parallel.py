@@ -0,0 +1,143 @@
+"""
+Checks the modules with pylint one at a time, spread over worker processes, and
+replaying what checking them found before for the modules the cache still has.
+
+Pylint's own parallel mode sends its linter to each worker pickled with dill, which
+for ours means pickling the file finder and the collector along with it, and unless
+its workers are forked, they do not have the paths prospector adds to ``sys.path``.
+Instead, like the tools spread over workers by ``prospector.executor``, the workers
+are forked from the configured linter, and check the modules one at a time the way
+pylint's workers do. Only what checking each module produced travels back: its
+messages, statistics, and the data of the checkers looking at the whole project, such
+as the import graph the cyclic imports are found in, which are all picklable.
+
+The results, whether just found or from the cache, are then handed to the linter in
+the order a serial run checks the modules, so that the collector ends up with the same
+messages as if the modules had been checked one after the other.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from pylint.lint.expand_modules import discover_package_path
+from pylint.lint.parallel import _merge_mapreduce_data
+from pylint.lint.utils import augmented_sys_path
+from pylint.message import Message as PylintMessage
+from pylint.reporters import CollectingReporter
+from pylint.typing import FileItem
+from pylint.utils import LinterStats, merge_stats
+
+from prospector import executor
+
+if TYPE_CHECKING:
+    from prospector.tools.pylint.linter import ProspectorLinter
+    from prospector.tools.pylint.module_cache import ModuleCache
+
+__all__ = ("ModuleResult", "check_by_module")
+
+
+class ModuleResult:
+    """
+    What checking one module found.
+    """
+
+    def __init__(
+        self,
+        base_name: str,
+        messages: list[PylintMessage],
+        stats: LinterStats,
+        msg_status: int,
+        map_data: defaultdict[str, list[Any]],
+    ) -> None:
+        self.base_name = base_name
+        self.messages = messages
+        self.stats = stats
+        self.msg_status = msg_status
+        # by checker, the data of the checkers looking at the whole project
+        self.map_data = map_data
+
+
+def _check_modules(linter: ProspectorLinter, fileitems: list[FileItem]) -> list[ModuleResult]:
+    # usually in a forked worker, so the linter is this process' own copy
+    reporter = CollectingReporter()
+    linter.set_reporter(reporter)
+    # only the checkers which have messages enabled look at the modules, so the others
+    # have no data worth sending back
+    checkers = linter.prepare_checkers()
+    results = []
+    for fileitem in fileitems:
+        linter.stats = LinterStats()
+        linter.msg_status = 0
+        linter.open()
+        linter.check_single_file_item(fileitem)
+        map_data: defaultdict[str, list[Any]] = defaultdict(list)
+        for checker in checkers:
+            data = checker.get_map_data()
+            if data is not None:
+                map_data[checker.name].append(data)
+        results.append(
+            ModuleResult(linter.file_state.base_name, reporter.messages, linter.stats, linter.msg_status, map_data)
+        )
+        reporter.messages = []
+    return results
+
+
+def check_by_module(
+    linter: ProspectorLinter, files_or_modules: Sequence[str], jobs: int, cache: ModuleCache | None = None
+) -> None:
+    """
+    Check the given files or modules like ``linter.check`` does, with up to ``jobs``
+    worker processes. The messages go to the linter's reporter.
+
+    :param cache: What checking the modules found before, so that only the modules
+                  which are not in it are checked, and what checking them found is
+                  added to it
+    """
+    linter.initialize()
+    if linter.config.recursive:
+        files_or_modules = tuple(linter._discover_files(files_or_modules))  # pylint: disable=protected-access
+    extra_packages_paths = list(
+        dict.fromkeys(discover_package_path(path, linter.config.source_roots) for path in files_or_modules)
+    )
+    fileitems = list(
+        linter._iterate_file_descrs(  # pylint: disable=protected-access
+            files_or_modules, extra_packages_paths=extra_packages_paths
+        )
+    )
+
+    results = [cache.get(fileitem) if cache is not None else None for fileitem in fileitems]
+    stale = [index for index, result in enumerate(results) if result is None]
+    if stale:
+        shards = executor.split(stale, jobs)
+        tasks = [functools.partial(_check_modules, linter, [fileitems[index] for index in shard]) for shard in shards]
+        # with a single shard, it is checked in this process, by this very linter
+        reporter, stats = linter.reporter, linter.stats
+        with augmented_sys_path(extra_packages_paths):
+            by_shard = executor.run_all(tasks, jobs=jobs)
+        linter.set_reporter(reporter)
+        linter.stats = stats
+
+        for shard, shard_results in zip(shards, by_shard):
+            for index, result in zip(shard, shard_results):
+                results[index] = result
+                if cache is not None:
+                    cache.put(fileitems[index], result)
+        if cache is not None:
+            cache.save()
+
+    checked = [result for result in results if result is not None]
+    linter.open()
+    for fileitem, result in zip(fileitems, checked):
+        linter.file_state.base_name = result.base_name
+        linter.file_state._is_base_filestate = False  # pylint: disable=protected-access
+        linter.set_current_module(fileitem.name, fileitem.filepath)
+        for message in result.messages:
+            linter.reporter.handle_message(message)
+        linter.msg_status |= result.msg_status
+    # the checkers looking at the whole project report once they have all the data
+    _merge_mapreduce_data(linter, defaultdict(list, {0: [result.map_data for result in checked]}))
+    linter.stats = merge_stats([linter.stats, *(result.stats for result in checked)])
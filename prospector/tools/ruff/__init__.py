@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 
 
 class RuffTool(ToolBase):
+    ignore_code_patterns = (PEP8_IGNORE_LINE_CODE,)
+
     def configure(self, prospector_config: "ProspectorConfig", _: Any) -> None:
         self.ruff_bin = find_ruff_bin()
         self.ruff_args = ["check", "--output-format=json"]
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 from vulture import Vulture
 from vulture.config import DEFAULTS, InputError, make_config
 
-from prospector.encoding import CouldNotHandleEncoding, read_py_file
+from prospector.encoding import CouldNotHandleEncoding
 from prospector.finder import FileFinder
 from prospector.message import Location, Message, make_tool_error_message
 from prospector.tools.base import ToolBase
@@ -41,7 +41,7 @@ class ProspectorVulture(Vulture):
         # are overriding the Vulture.scavenge method.
         for module in self._files.python_modules:
             try:
-                module_string = read_py_file(module)
+                module_string = self._files.sources.read(module)
             except CouldNotHandleEncoding as err:
                 self._internal_messages.append(
                     make_tool_error_message(
@@ -0,0 +1,141 @@
+"""
+Records what a check spends its time on for --trace-out, as a Chrome trace-event file
+which trace viewers such as Perfetto (https://ui.perfetto.dev) or chrome://tracing load.
+
+Parts of the check are recorded as spans, using the ``span`` context manager. Until
+tracing is started, spans record nothing and cost next to nothing, so they can wrap
+even small pieces of work, such as one tool checking one file.
+
+Spans recorded in a worker process are taken out of its trace with ``take`` and sent
+back along with the rest of its results, for the parent process to ``add`` to its own.
+Every span keeps the process it was recorded in, so the trace shows which work ran
+at the same time and which did not.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+__all__ = (
+    "add",
+    "finish",
+    "mark",
+    "per_file",
+    "span",
+    "start",
+    "take",
+)
+
+T = TypeVar("T")
+
+# The events of the trace being recorded, if any
+_EVENTS: list[dict[str, Any]] | None = None
+
+
+def start() -> None:
+    """
+    Start recording a new trace, dropping anything recorded before.
+    """
+    global _EVENTS  # pylint: disable=global-statement
+    _EVENTS = []
+
+
+@contextmanager
+def span(name: str, category: str, **args: Any) -> Iterator[None]:
+    """
+    Record the body of the ``with`` statement as a span, if a trace is being recorded.
+
+    :param name: What the viewer shows on the span
+    :param category: The kind of work, such as "tool" or "file", to filter spans by
+    :param args: Anything else worth showing about the span, which must be JSON serialisable
+    """
+    events = _EVENTS
+    if events is None:
+        yield
+        return
+
+    started = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                # microseconds of a clock shared by the worker processes
+                "ts": started // 1000,
+                "dur": (time.perf_counter_ns() - started) // 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+                "args": args,
+            }
+        )
+
+
+def per_file(paths: Iterable[T], tool: str) -> Iterator[T]:
+    """
+    Iterate over the files a tool checks, recording each turn of the loop as a span.
+    """
+    if _EVENTS is None:
+        yield from paths
+        return
+    for path in paths:
+        with span(str(path), "file", tool=tool):
+            yield path
+
+
+def mark() -> int:
+    """
+    Where the trace is up to, to ``take`` the spans recorded after it.
+    """
+    return len(_EVENTS) if _EVENTS is not None else 0
+
+
+def take(since: int) -> list[dict[str, Any]]:
+    """
+    Remove the spans recorded since the mark from the trace and return them.
+    """
+    if _EVENTS is None:
+        return []
+    taken = _EVENTS[since:]
+    del _EVENTS[since:]
+    return taken
+
+
+def add(events: Iterable[dict[str, Any]]) -> None:
+    """
+    Add spans taken from the trace of another process, or of this one.
+    """
+    if _EVENTS is not None:
+        _EVENTS.extend(events)
+
+
+def finish(path: Path) -> None:
+    """
+    Stop recording, and write the trace to the given file.
+    """
+    global _EVENTS  # pylint: disable=global-statement
+    events, _EVENTS = _EVENTS or [], None
+
+    main_pid = os.getpid()
+    metadata = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "prospector" if pid == main_pid else f"prospector worker {pid}"},
+        }
+        for pid in sorted({event["pid"] for event in events} | {main_pid})
+    ]
+    # a span starting at the same time as the one around it comes after it
+    events.sort(key=lambda event: (event["ts"], -event["dur"]))
+    with open(path, "w", encoding="utf-8") as trace_file:
+        json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, trace_file)
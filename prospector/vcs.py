@@ -0,0 +1,56 @@
+"""
+Finds the files changed in a git working copy, for ``--changed-since``.
+"""
+
+from __future__ import annotations
+
+import subprocess  # nosec
+from pathlib import Path
+
+from prospector.exceptions import FatalProspectorException
+
+__all__ = ("changed_files",)
+
+
+def _git(workdir: Path, *args: str) -> str:
+    try:
+        completed = subprocess.run(  # noqa: S603 - the arguments are not passed through a shell
+            ["git", "-C", str(workdir), *args],  # noqa: S607 - git is looked up on the PATH on purpose
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except FileNotFoundError as err:
+        raise FatalProspectorException("--changed-since needs git, which could not be found") from err
+    except subprocess.CalledProcessError as err:
+        raise FatalProspectorException(f"git {args[0]} failed: {err.stderr.strip()}") from err
+    return completed.stdout
+
+
+def changed_files(workdir: Path, ref: str) -> set[Path]:
+    """
+    List the files which differ between the working copy and the point where it forked
+    from ``ref`` - that is, the changes a pull request based on ``ref`` would contain -
+    including uncommitted and untracked files.
+
+    :return: The absolute paths of the changed files, including those which were deleted,
+             under ``workdir`` as given, even if symbolic links lead to it.
+    """
+    toplevel = Path(_git(workdir, "rev-parse", "--show-toplevel").strip())
+    merge_base = _git(workdir, "merge-base", ref, "HEAD").strip()
+
+    names = _git(toplevel, "diff", "--name-only", "-z", merge_base, "--").split("\0")
+    names += _git(toplevel, "ls-files", "--others", "--exclude-standard", "-z").split("\0")
+
+    # git resolves the symbolic links leading to the working copy, while the files found
+    # to check are under the workdir as given, so the changed files are moved under it
+    given, resolved = workdir.absolute(), workdir.resolve()
+    changed = set()
+    for name in names:
+        if not name:
+            continue
+        path = toplevel / name
+        if path.is_relative_to(resolved):
+            path = given / path.relative_to(resolved)
+        changed.add(path)
+    return changed
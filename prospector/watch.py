@@ -0,0 +1,147 @@
+"""
+Keeps checking a project as it changes, for --watch.
+
+Changes are found by polling the modification times of the files found by the first
+check, and of the directories they are in, which change when a file is created,
+renamed or deleted. Only when a directory changes are the files looked for again.
+When files change, only they (and, for the tools which look at the whole project,
+the modules importing them) are checked again, and the messages about every other
+file are kept from the previous check.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+
+from prospector import run
+from prospector.config import ProspectorConfig
+from prospector.finder import FileFinder
+from prospector.tools.pylint.astroid_cache import AstroidCache
+
+__all__ = ("watch",)
+
+# How often to look for changes, in seconds
+_POLL_INTERVAL = 0.5
+
+# Changes to these mean the configuration of prospector or of the tools may have
+# changed, and so everything is checked again from scratch
+_CONFIGURATION_SUFFIXES = (".cfg", ".ini", ".toml", ".yaml", ".yml")
+_CONFIGURATION_NAMES = (
+    ".bandit",
+    ".flake8",
+    ".pep8",
+    ".prospectorrc",
+    ".pycodestyle",
+    ".pydocstyle",
+    ".pydocstylerc",
+    ".pylintrc",
+    "pylintrc",
+)
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _is_configuration(path: Path) -> bool:
+    return path.suffix in _CONFIGURATION_SUFFIXES or path.name in _CONFIGURATION_NAMES
+
+
+class _Snapshot:
+    """
+    The state of the files and directories of a FileFinder, to find what changed since.
+    """
+
+    def __init__(self, found_files: FileFinder) -> None:
+        self.found_files = found_files
+        self.files = found_files.files
+        self._file_stamps = {path: _stamp(path) for path in self.files}
+        self._directory_stamps = {path: _stamp(path) for path in found_files.directories}
+
+    def changed_files(self) -> set[Path]:
+        changed = set()
+        for path, stamp in self._file_stamps.items():
+            current = _stamp(path)
+            if current != stamp:
+                self._file_stamps[path] = current
+                changed.add(path)
+        return changed
+
+    def directories_changed(self) -> bool:
+        return any(_stamp(path) != stamp for path, stamp in self._directory_stamps.items())
+
+
+def _wait_for_changes(snapshot: _Snapshot) -> tuple[set[Path], bool]:
+    while True:
+        time.sleep(_POLL_INTERVAL)
+        changed = snapshot.changed_files()
+        directories_changed = snapshot.directories_changed()
+        if changed or directories_changed:
+            break
+
+    # editors and other tools often write several files, or one file several times,
+    # in a row: wait until they are done
+    while True:
+        time.sleep(_POLL_INTERVAL)
+        more = snapshot.changed_files()
+        if not more:
+            return changed, directories_changed or snapshot.directories_changed()
+        changed |= more
+
+
+def watch(prospector: run.Prospector) -> run.Prospector:
+    """
+    Check the project, print the messages, then check it again and print the updated
+    messages each time files change, until interrupted.
+
+    :return: The Prospector instance which made the last check
+    """
+    astroid_cache = AstroidCache()
+
+    started_ns = time.time_ns()
+    prospector.execute()
+    prospector.print_messages()
+    astroid_cache.record(started_ns)
+
+    assert prospector.found_files is not None
+    snapshot = _Snapshot(prospector.found_files)
+
+    try:
+        while True:
+            changed, directories_changed = _wait_for_changes(snapshot)
+
+            found_files = snapshot.found_files
+            if directories_changed:
+                found_files = prospector.find_files()
+                # created and deleted files count as changed too
+                changed |= found_files.files ^ snapshot.files
+
+            started_ns = time.time_ns()
+            astroid_cache.refresh()
+
+            if any(_is_configuration(path) for path in changed):
+                sys.stderr.write("Configuration changed, checking everything again\n")
+                prospector = run.Prospector(ProspectorConfig())
+                prospector.execute()
+                assert prospector.found_files is not None
+                found_files = prospector.found_files
+            else:
+                prospector.update(changed, found_files)
+
+            prospector.print_messages()
+            astroid_cache.record(started_ns)
+
+            if found_files is not snapshot.found_files:
+                snapshot = _Snapshot(found_files)
+
+    except KeyboardInterrupt:
+        pass
+
+    return prospector
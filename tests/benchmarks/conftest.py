@@ -0,0 +1,70 @@
+"""
+The benchmarks check a synthetic project, the size of which is picked with the
+PROSPECTOR_BENCHMARK_SIZE environment variable: "small" (the default), "medium" or
+"large". They are only run when asked for, with ``-m benchmark``.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from prospector.config import ProspectorConfig
+from prospector.finder import FileFinder
+from prospector.message import Message
+from prospector.run import Prospector
+from prospector.tools.base import ToolBase
+
+from ..utils import patch_execution
+from .synthetic import make_project
+
+SIZES: dict[str, dict[str, Any]] = {
+    "small": {"packages": 4, "modules": 5, "messages": 10},
+    "medium": {"packages": 10, "modules": 20, "messages": 20},
+    "large": {"packages": 25, "modules": 40, "messages": 40, "ignored_packages": 5},
+}
+
+
+@pytest.fixture(scope="session")
+def project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    size = os.environ.get("PROSPECTOR_BENCHMARK_SIZE", "small")
+    return make_project(tmp_path_factory.mktemp("synthetic"), **SIZES[size])
+
+
+@pytest.fixture(scope="session")
+def config(project: Path) -> ProspectorConfig:
+    with patch_execution(str(project), set_cwd=project):
+        return ProspectorConfig()
+
+
+def find_files(config: ProspectorConfig) -> FileFinder:
+    """
+    A new finder, which has not read any file yet.
+    """
+    return FileFinder(*config.paths, exclusion_filters=[config.make_exclusion_filter()])
+
+
+class CheckedProject:
+    """
+    What checking the synthetic project produced, for the benchmarks of the steps after
+    the tools ran.
+    """
+
+    def __init__(self, prospector: Prospector) -> None:
+        # pylint: disable=protected-access
+        self.tools: dict[str, ToolBase] = dict(prospector._to_run)
+        self.tool_messages: list[Message] = [message for messages in prospector._tool_messages for message in messages]
+        assert prospector.summary is not None
+        self.summary = prospector.summary
+        self.messages = prospector.get_messages()
+
+
+@pytest.fixture(scope="session")
+def checked(project: Path) -> CheckedProject:
+    with patch_execution(str(project), set_cwd=project):
+        prospector = Prospector(ProspectorConfig())
+        prospector.execute()
+    return CheckedProject(prospector)
@@ -0,0 +1,118 @@
+"""
+Generates synthetic projects for the benchmarks, of whatever size is needed.
+
+Every module of a generated project has a known number of problems which the default
+tools find, some of them reported by several tools so that blending has something to
+do, a share of them suppressed with ``# noqa`` for the postfilter to deal with, and
+imports of the other modules of its package. The project also has packages which its
+profile's ``ignore-patterns`` exclude, so that finding the files has some to skip.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+
+# each a problem, as the lines of code causing it, formatted with a unique number, and
+# the index of the line the tools report
+_PROBLEMS: tuple[tuple[tuple[str, ...], int], ...] = (
+    # unused import: pyflakes F401 and pylint unused-import, blended together
+    (("import os as unused_os_{n}",), 0),
+    # pycodestyle E225
+    (("SPACING_{n}=1",), 0),
+    # unused variable: pyflakes F841 and pylint unused-variable, blended together
+    (("def unused_variable_{n}():", '    """Has an unused variable."""', "    unused = {n}"), 2),
+    # bare except: pycodestyle E722 and pylint bare-except, blended together
+    (
+        (
+            "def bare_except_{n}():",
+            '    """Catches everything."""',
+            "    try:",
+            "        return int('{n}')",
+            "    except:",
+            "        return None",
+        ),
+        4,
+    ),
+    # line too long: pycodestyle E501 and pylint line-too-long, blended together
+    (("LONG_{n} = '" + "x" * 150 + "'",), 0),
+)
+
+
+def _module_source(package: str, module: int, modules: int, messages: int, noqa_density: float) -> str:
+    lines = [
+        f'"""Module {module} of {package}."""',
+        "",
+    ]
+    # import the previous module of the package, so that the modules depend on each other
+    if module > 0:
+        lines += [f"from {package} import module{module - 1:03}", ""]
+
+    # suppress every nth problem, spread out over the module
+    every = round(1 / noqa_density) if noqa_density > 0 else 0
+    for index in range(messages):
+        problem_lines, reported = _PROBLEMS[index % len(_PROBLEMS)]
+        problem = [line.format(n=index) for line in problem_lines]
+        if every and index % every == every - 1:
+            problem[reported] += "  # noqa"
+        lines += [*problem, "", ""]
+
+    lines += [
+        f"class Thing{module}:",
+        '    """Does something."""',
+        "",
+        "    def __init__(self, value):",
+        "        self.value = value",
+        "",
+        "    def double(self):",
+        '        """Double the value."""',
+        "        return self.value * 2",
+    ]
+    if module > 0:
+        lines += [
+            "",
+            "    def previous(self):",
+            '        """Use the previous module."""',
+            f"        return module{module - 1:03}.Thing{module - 1}(self.value).double()",
+        ]
+    if module == modules - 1:
+        lines += ["", "", f"__all__ = ['Thing{module}']"]
+    return "\n".join(lines) + "\n"
+
+
+def make_project(
+    root: Path,
+    packages: int = 4,
+    modules: int = 5,
+    messages: int = 10,
+    noqa_density: float = 0.2,
+    ignored_packages: int = 1,
+    ignore_patterns: Sequence[str] = (r"^ignored",),
+) -> Path:
+    """
+    Write a synthetic project into the given directory.
+
+    :param packages: How many packages the project has, not counting the ignored ones
+    :param modules: How many modules each package has, besides its ``__init__.py``
+    :param messages: How many problems each module has
+    :param noqa_density: The share of the problems suppressed with ``# noqa``
+    :param ignored_packages: How many packages the ``ignore_patterns`` exclude,
+                             each like the others
+    :param ignore_patterns: The ``ignore-patterns`` of the profile of the project
+    :return: The directory of the project
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    profile = ["strictness: veryhigh", "doc-warnings: true", "ignore-patterns:"]
+    profile += [f"  - '{pattern}'" for pattern in ignore_patterns]
+    (root / ".prospector.yaml").write_text("\n".join(profile) + "\n")
+
+    names = [f"package{index:03}" for index in range(packages)]
+    names += [f"ignored{index:03}" for index in range(ignored_packages)]
+    for name in names:
+        directory = root / name
+        directory.mkdir(exist_ok=True)
+        (directory / "__init__.py").write_text(f'"""Package {name}."""\n')
+        for module in range(modules):
+            source = _module_source(name, module, modules, messages, noqa_density)
+            (directory / f"module{module:03}.py").write_text(source)
+    return root
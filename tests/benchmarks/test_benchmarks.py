@@ -0,0 +1,87 @@
+"""
+Benchmarks of the steps of a check, run with pytest-benchmark. See the "Benchmarks"
+section of CONTRIBUTING.rst for how to compare them with a baseline.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from prospector import blender, postfilter
+from prospector.config import ProspectorConfig
+from prospector.finder import FileFinder
+from prospector.formatters import FORMATTERS
+from prospector.message import Message
+from prospector.tools import TOOLS
+from prospector.tools.base import ToolBase
+
+from .conftest import CheckedProject, find_files
+
+pytestmark = pytest.mark.benchmark
+
+# pyright downloads node on its first run, which does not belong in a benchmark
+_TOOLS = sorted(name for name, tool in TOOLS.items() if tool.__name__ != "NotAvailableTool" and name != "pyright")
+
+
+def test_find_files(benchmark: Any, config: ProspectorConfig) -> None:
+    def _find() -> FileFinder:
+        found_files = find_files(config)
+        # the index is built on first use
+        found_files.python_modules  # noqa: B018 - only building it
+        return found_files
+
+    found_files = benchmark(_find)
+    assert all(path.parent.name.startswith("package") for path in found_files.python_modules)
+
+
+@pytest.mark.parametrize("toolname", _TOOLS)
+def test_tool_configure(benchmark: Any, config: ProspectorConfig, toolname: str) -> None:
+    def _setup() -> tuple[tuple[ToolBase, FileFinder], dict[str, Any]]:
+        return (TOOLS[toolname](), find_files(config)), {}
+
+    benchmark.pedantic(lambda tool, found_files: tool.configure(config, found_files), setup=_setup, rounds=5)
+
+
+@pytest.mark.parametrize("toolname", _TOOLS)
+def test_tool_run(benchmark: Any, config: ProspectorConfig, toolname: str) -> None:
+    def _setup() -> tuple[tuple[ToolBase, FileFinder], dict[str, Any]]:
+        found_files = find_files(config)
+        tool = TOOLS[toolname]()
+        tool.configure(config, found_files)
+        return (tool, found_files), {}
+
+    benchmark.pedantic(lambda tool, found_files: tool.run(found_files), setup=_setup, rounds=3)
+
+
+def test_blend(benchmark: Any, checked: CheckedProject) -> None:
+    blended = benchmark(blender.blend, checked.tool_messages)
+    assert 0 < len(blended) < len(checked.tool_messages)
+
+
+def test_postfilter(benchmark: Any, config: ProspectorConfig, checked: CheckedProject) -> None:
+    messages = blender.blend(checked.tool_messages)
+
+    def _setup() -> tuple[tuple[list[Path], list[Message]], dict[str, Any]]:
+        # a new finder, so that the files are read as in a check
+        found_files = find_files(config)
+        return (found_files.python_modules, messages), {
+            "tools": checked.tools,
+            "blending": True,
+            "sources": found_files.sources,
+        }
+
+    filtered = benchmark.pedantic(postfilter.filter_messages, setup=_setup, rounds=10)
+    # some of the messages are suppressed with noqa
+    assert 0 < len(filtered) < len(messages)
+
+
+@pytest.mark.parametrize("output_format", sorted(FORMATTERS))
+def test_formatter(benchmark: Any, config: ProspectorConfig, checked: CheckedProject, output_format: str) -> None:
+    formatter = FORMATTERS[output_format](
+        dict(checked.summary, formatter=output_format), checked.messages, config.profile, config.workdir
+    )
+    output = benchmark(formatter.render)
+    assert output
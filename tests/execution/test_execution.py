@@ -3,15 +3,22 @@ Tests that prospector raises the expected errors on the expected files depending
 configuration of the file finder
 """
 
+import io
+import json
 import shutil
 import tempfile
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
+import pytest
+
 from prospector.config import ProspectorConfig
 from prospector.finder import FileFinder
-from prospector.run import Prospector
+from prospector.message import Message
+from prospector.run import Prospector, main
 from prospector.tools import PylintTool
+from prospector.tools.pyflakes import PyFlakesTool
 
 from ..utils import patch_cli, patch_cwd, patch_execution
 
@@ -95,3 +102,212 @@ def test_relative_path_specified() -> None:
     assert found_files3.python_modules == found_files2.python_modules == found_files1.python_modules
     assert found_files3.python_packages == found_files2.python_packages == found_files1.python_packages
     assert found_files3.directories == found_files2.directories == found_files1.directories
+
+
+def test_parallel_tools_same_messages() -> None:
+    """
+    Running the tools in worker processes must find exactly the messages of a serial run
+    """
+    workdir = TEST_DATA / "test_errors_found"
+
+    def _messages(*args: str) -> list[tuple[str, str, str, int]]:
+        with patch_execution(*args, str(workdir), set_cwd=workdir):
+            pros = Prospector(ProspectorConfig())
+            pros.execute()
+        return sorted((m.source, m.code, str(m.location.path), m.location.line or 0) for m in pros.get_messages())
+
+    serial = _messages()
+    assert len(serial) > 0
+    assert _messages("--jobs", "4") == serial
+
+
+def test_sharded_tools_same_messages(tmp_path: Path) -> None:
+    """
+    Splitting the files of per-file tools between worker processes must find exactly the
+    messages of a serial run, in the order of the files
+    """
+    for index in range(40):
+        (tmp_path / f"module{index:02}.py").write_text("import os\nx=1\n")
+
+    def _messages(*args: str) -> list[list[tuple[str, str, int]]]:
+        with patch_execution(
+            "-s", "veryhigh", "-t", "pyflakes", "-t", "pycodestyle", *args, str(tmp_path), set_cwd=tmp_path
+        ):
+            pros = Prospector(ProspectorConfig())
+            pros.execute()
+        return [
+            [(m.location.path.name, m.code, m.location.line or 0) for m in tool_messages]  # type: ignore[union-attr]
+            for tool_messages in pros._tool_messages  # pylint: disable=protected-access
+        ]
+
+    serial = _messages()
+    assert sum(len(tool_messages) for tool_messages in serial) == 40 * 2
+    sharded = _messages("--jobs", "4")
+    assert [sorted(tool_messages) for tool_messages in sharded] == [sorted(tool_messages) for tool_messages in serial]
+    assert all(tool_messages == sorted(tool_messages) for tool_messages in sharded)
+
+    cache_dir = tmp_path / "cache"
+    assert _messages("--jobs", "4", "--cache-dir", str(cache_dir)) == sharded
+    (tmp_path / "module07.py").write_text("import sys\n")
+    cached = _messages("--jobs", "4", "--cache-dir", str(cache_dir))
+    assert sorted(m for tool_messages in cached for m in tool_messages if m[0] == "module07.py") == [
+        ("module07.py", "F401", 1)
+    ]
+    assert sum(len(tool_messages) for tool_messages in cached) == 39 * 2 + 1
+
+
+def test_summary_timings(tmp_path: Path) -> None:
+    """
+    The summary has the timings of configuring and running every tool, and of handling
+    the messages, which the output reports render
+    """
+    (tmp_path / "module.py").write_text("import os\n")
+
+    with patch_execution("-t", "pyflakes", "-t", "pycodestyle", "-o", "json", str(tmp_path), set_cwd=tmp_path):
+        pros = Prospector(ProspectorConfig())
+        pros.execute()
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            pros.print_messages()
+
+    assert pros.summary is not None
+    timings = pros.summary["timings"]
+    assert sorted(timings["tools"]) == ["pycodestyle", "pyflakes"]
+    assert all(sorted(steps) == ["configure", "run"] for steps in timings["tools"].values())
+    assert sorted(timings["phases"]) == ["blend", "postfilter", "render"]
+    # the rendering of a report is not part of its own summary
+    assert sorted(json.loads(stdout.getvalue())["summary"]["timings"]["phases"]) == ["blend", "postfilter"]
+
+
+def test_trace_out(tmp_path: Path) -> None:
+    """
+    The trace has the spans of every tool and file, including those checked in worker processes
+    """
+    workdir = tmp_path / "project"
+    workdir.mkdir()
+    for index in range(20):
+        (workdir / f"module{index:02}.py").write_text("import os\n")
+    trace_out = tmp_path / "trace.json"
+
+    args = ["-t", "pyflakes", "-t", "pycodestyle", "--jobs", "2", "--trace-out", str(trace_out), str(workdir)]
+    with (
+        patch_execution(*args, set_cwd=workdir),
+        patch("sys.stdout", new_callable=io.StringIO),
+        pytest.raises(SystemExit),
+    ):
+        main()
+
+    spans = [event for event in json.loads(trace_out.read_text())["traceEvents"] if event["ph"] == "X"]
+    names = {event["name"] for event in spans if event["cat"] != "file"}
+    assert {"load profile", "find files", "pyflakes configure", "pyflakes run", "pycodestyle run"} <= names
+    assert {"blend", "postfilter", "scan suppressions", "render"} <= names
+    for tool in ("pyflakes", "pycodestyle"):
+        assert len([event for event in spans if event["cat"] == "file" and event["args"]["tool"] == tool]) == 20
+
+
+@pytest.mark.parametrize("jobs", ["1", "4"])
+def test_jsonl_streams_messages(tmp_path: Path, jobs: str) -> None:
+    """
+    The messages about each file are written out while the tools still run, and are those
+    the json output has at the end
+    """
+    for index in range(40):
+        (tmp_path / f"module{index:02}.py").write_text("import os\nx=1\nimport sys  # noqa\n")
+
+    def _run(output_format: str) -> tuple[Prospector, list[str], list[str]]:
+        args = ["-s", "veryhigh", "-t", "pyflakes", "-t", "pycodestyle", "--jobs", jobs, "-o", output_format]
+        with (
+            patch_execution(*args, str(tmp_path), set_cwd=tmp_path),
+            patch("sys.stdout", new_callable=io.StringIO) as stdout,
+        ):
+            pros = Prospector(ProspectorConfig())
+            pros.execute()
+            streamed = stdout.getvalue().splitlines()
+            pros.print_messages()
+        return pros, streamed, stdout.getvalue().splitlines()
+
+    def _key(message: dict[str, Any]) -> tuple[str, str, str, int]:
+        return (message["source"], message["code"], message["location"]["path"], message["location"]["line"])
+
+    pros, streamed, written = _run("jsonl")
+    # every file is checked by the time the tools are done, so only the summary is left
+    assert len(streamed) == len(pros.get_messages()) == 40 * 2
+    assert written[: len(streamed)] == streamed
+    assert json.loads(written[-1])["summary"]["message_count"] == 40 * 2
+
+    _, _, json_output = _run("json")
+    expected = json.loads("\n".join(json_output))["messages"]
+    assert sorted(_key(json.loads(line)) for line in streamed) == sorted(_key(message) for message in expected)
+
+
+def test_ignored_files_not_checked(tmp_path: Path) -> None:
+    """
+    The modules ignored as a whole are not checked by the tools checking files one at a
+    time, which changes nothing in the messages
+    """
+    (tmp_path / "checked.py").write_text("import os\n")
+    (tmp_path / "flake8_noqa.py").write_text("# flake8: noqa\nimport os\n")
+    (tmp_path / "skip_file.py").write_text("# pylint: skip-file\nimport os\n")
+    (tmp_path / "disable_all.py").write_text("import os  # pylint: disable=all\n")
+    (tmp_path / "in_a_string.py").write_text("import os\nTEXT = '# pylint: skip-file'\n")
+
+    def _messages() -> tuple[list[tuple[str, str, str]], dict[str, set[str]]]:
+        checked: dict[str, set[str]] = {"pylint": set(), "pyflakes": set()}
+
+        def _recording(name: str, run: Any) -> Any:
+            def _run(tool: Any, found_files: FileFinder) -> list[Message]:
+                checked[name].update(path.name for path in found_files.python_modules)
+                return run(tool, found_files)
+
+            return _run
+
+        with (
+            patch_execution("-t", "pylint", "-t", "pyflakes", str(tmp_path), set_cwd=tmp_path),
+            patch.object(PylintTool, "run", _recording("pylint", PylintTool.run)),
+            patch.object(PyFlakesTool, "run", _recording("pyflakes", PyFlakesTool.run)),
+        ):
+            pros = Prospector(ProspectorConfig())
+            pros.execute()
+        return sorted((m.source, m.code, m.location.path.name) for m in pros.get_messages()), checked  # type: ignore[union-attr]
+
+    everything = {"checked.py", "in_a_string.py", "flake8_noqa.py", "skip_file.py", "disable_all.py"}
+    messages, checked = _messages()
+    # the tools looking at the whole project still see every module
+    assert checked == {"pylint": everything, "pyflakes": {"checked.py", "in_a_string.py"}}
+    assert {path for _, _, path in messages} == {"checked.py", "in_a_string.py"}
+    with patch("prospector.suppression.get_ignored_files", return_value=set()):
+        assert _messages() == (messages, {"pylint": everything, "pyflakes": everything})
+
+
+def test_ignored_files_used_by_whole_project_tools(tmp_path: Path) -> None:
+    """
+    What a module ignored as a whole uses from the others is still used
+    """
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "a.py").write_text("\n\n\n\ndef helper_used_only_by_b():\n    return 1\n")
+    (package / "b.py").write_text("# flake8: noqa\nimport pkg.a\n\nVALUE = pkg.a.helper_used_only_by_b()\n")
+
+    with patch_execution("-t", "vulture", str(tmp_path), set_cwd=tmp_path):
+        pros = Prospector(ProspectorConfig())
+        pros.execute()
+    assert [message for message in pros.get_messages() if message.code == "unused-function"] == []
+
+
+def test_changed_since_rechecks_importers_of_deleted_modules(tmp_path: Path) -> None:
+    """
+    The modules importing a module which was deleted are checked again, as they now
+    fail to import it
+    """
+    (tmp_path / "a.py").write_text('"""A."""\nimport b\n\nb.func()\n')
+    (tmp_path / "other.py").write_text('"""Other."""\n')
+
+    with (
+        patch_execution("-t", "pylint", "--changed-since", "main", str(tmp_path), set_cwd=tmp_path),
+        patch("prospector.run.vcs.changed_files", return_value={tmp_path / "b.py"}),
+    ):
+        pros = Prospector(ProspectorConfig())
+        pros.execute()
+    assert [(message.location.path, message.code) for message in pros.get_messages()] == [
+        (tmp_path / "a.py", "import-error")
+    ]
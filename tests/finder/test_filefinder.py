@@ -1,5 +1,8 @@
+import os
+import tempfile
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 import pytest
 
@@ -113,3 +116,42 @@ class TestFileFinder(TestCase):
         finder = FileFinder(TEST_DATA / "test1", exclusion_filters=[exclude])
         modules = finder.python_modules
         assert pkg1 not in modules
+
+    def test_tree_walked_once(self) -> None:
+        """
+        Checks that the tree is only walked once, however many times the files are asked for,
+        and that restricted finders do not walk it again
+        """
+        finder = FileFinder(TEST_DATA / "test3")
+        with patch("os.scandir", wraps=os.scandir) as scandir:
+            files = finder.files
+            walked = scandir.call_count
+            assert finder.files == files
+            assert len(finder.python_modules) == 4
+            assert len(finder.python_packages) == 4
+            assert len(finder.directories) == walked
+
+            module = min(finder.python_modules)
+            restricted = finder.restricted_to([module])
+            assert restricted.python_modules == [module]
+            assert restricted.directories == finder.directories
+            assert restricted.is_excluded(sorted(files)[1])
+        assert scandir.call_count == walked
+
+    def test_virtualenv_not_walked(self) -> None:
+        """
+        Checks that virtualenvs are recognised from their listing, and nothing inside is looked at
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "module.py").write_text("")
+            env = root / "env"
+            (env / "lib" / "site-packages").mkdir(parents=True)
+            (env / "lib" / "site-packages" / "dependency.py").write_text("")
+            (env / "pyvenv.cfg").write_text("home = /usr/bin\n")
+
+            finder = FileFinder(root)
+            with patch("os.scandir", wraps=os.scandir) as scandir:
+                assert finder.python_modules == [root / "module.py"]
+            assert env not in finder.directories
+            assert [call.args[0] for call in scandir.call_args_list] == [root, env]
@@ -1,7 +1,8 @@
+import tempfile
 from pathlib import Path
 from unittest import TestCase
 
-from prospector.pathutils import is_python_module, is_python_package, is_virtualenv
+from prospector.pathutils import is_python_module, is_python_package, is_virtualenv, is_virtualenv_listing
 
 from .utils import TEST_DATA
 
@@ -23,6 +24,19 @@ class TestVirtualenvDetection(TestCase):
         path = TEST_DATA / "venvs" / "is_a_venv"
         assert is_virtualenv(path)
 
+    def test_pyvenv_cfg_venv(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            assert not is_virtualenv(path)
+            (path / "pyvenv.cfg").write_text("home = /usr/bin\n")
+            assert is_virtualenv(path)
+            assert not is_virtualenv(path / "pyvenv.cfg")
+
+    def test_venv_listing(self) -> None:
+        assert is_virtualenv_listing({"pyvenv.cfg": False, "lib": True})
+        assert not is_virtualenv_listing({"pyvenv.cfg": True})
+        assert not is_virtualenv_listing({"lib": True, "thing.py": False})
+
     def test_not_a_venv(self) -> None:
         path = TEST_DATA / "venvs" / "not_a_venv"
         assert not is_virtualenv(path)
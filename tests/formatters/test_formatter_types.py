@@ -1,4 +1,5 @@
 import datetime
+import json
 from pathlib import Path
 from typing import Any
 
@@ -51,3 +52,31 @@ def test_formatters_render(_simple_summary: dict[str, Any], _simple_profile: Pro
         ]
         formatter_instance = formatter(_simple_summary, messages, _simple_profile)
         formatter_instance.render(True, True, False)
+
+
+@pytest.mark.usefixtures("_simple_summary", "_simple_profile")  # type: ignore[untyped-decorator]
+def test_summary_timings(_simple_summary: dict[str, Any], _simple_profile: ProspectorProfile) -> None:  # noqa: PT019
+    timing = {"wall_time": 1.5, "cpu_time": 1.25, "peak_rss": 3 * 2**20}
+    _simple_summary["timings"] = {
+        "tools": {"pylint": {"configure": timing, "run": timing}},
+        "phases": {"postfilter": {**timing, "peak_rss": None}},
+    }
+    output = FORMATTERS["text"](_simple_summary, [], _simple_profile).render(True, False, False)
+    assert "\n pylint configure:      1.50s      1.25s      3.0 MiB\n" in output
+    assert "\n       postfilter:      1.50s      1.25s            -" in output
+    output = FORMATTERS["json"](_simple_summary, [], _simple_profile).render()
+    assert json.loads(output)["summary"]["timings"] == _simple_summary["timings"]
+
+
+@pytest.mark.usefixtures("_simple_summary", "_simple_profile")  # type: ignore[untyped-decorator]
+def test_jsonl_lines(_simple_summary: dict[str, Any], _simple_profile: ProspectorProfile) -> None:  # noqa: PT019
+    location = Location(Path(__file__), "formatters/test_formatter_types", "test_jsonl_lines", 1, 0)
+    messages = [Message("testtool", f"code-{index}", location, "one line each") for index in range(2)]
+    formatter = FORMATTERS["jsonl"](_simple_summary, messages, _simple_profile)
+    lines = [json.loads(line) for line in formatter.render(True, True, True).splitlines()]
+    assert lines[:2] == [json.loads(formatter.render_message(message)) for message in messages]
+    assert lines[0]["code"] == "code-0"
+    assert (
+        lines[2]["summary"] == json.loads(FORMATTERS["json"](_simple_summary, [], _simple_profile).render())["summary"]
+    )
+    assert lines[3] == {"profile": _simple_profile.as_dict()}
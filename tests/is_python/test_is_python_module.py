@@ -1,4 +1,6 @@
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -22,3 +24,28 @@ from prospector.pathutils import is_python_module
 def test_is_python_module(filename: str, expected: bool) -> None:
     path = Path(__file__).parent / filename
     assert is_python_module(path) == expected
+
+
+def test_known_extension_not_opened(tmp_path: Path) -> None:
+    data = tmp_path / "data.json"
+    data.write_text("#!/usr/bin/env python\n")
+    data.chmod(0o755)
+    with patch.object(Path, "stat") as stat:
+        assert not is_python_module(data)
+    stat.assert_not_called()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="needs the executable bit")
+def test_shebang_read_once(tmp_path: Path) -> None:
+    script = tmp_path / "script"
+    script.write_text("#!/usr/bin/env python3\n")
+    script.chmod(0o755)
+    with patch.object(Path, "open", autospec=True, side_effect=Path.open) as opened:
+        assert is_python_module(script)
+        assert is_python_module(script)
+    assert opened.call_count == 1
+
+    # a file which changed is read again
+    script.write_text("#!/bin/sh\n")
+    os.utime(script, ns=(0, 0))
+    assert not is_python_module(script)
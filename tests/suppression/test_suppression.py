@@ -2,7 +2,9 @@ import os
 import unittest
 from pathlib import Path
 
-from prospector.suppression import get_noqa_suppressions
+from prospector.suppression import Ignore, get_noqa_suppressions, get_suppressions
+from prospector.tools.base import ToolBase
+from prospector.tools.pylint import PylintTool
 from tests.utils import patch_workdir_argv
 
 
@@ -57,3 +59,38 @@ class SuppressionTest(unittest.TestCase):
         ) as pros:
             assert pros.summary is not None
             assert pros.summary["message_count"] == 5
+
+
+def test_only_comments(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_text(
+        "CODE = 'import os  # noqa'\n"
+        "call(1,  # noqa: code\n"
+        "     2)\n"
+        'TEXT = """# flake8: noqa\n'
+        "import os  # pylint: disable=unused-import\n"
+        '"""\n'
+    )
+    tools: dict[str, ToolBase] = {"pylint": PylintTool()}
+    paths_to_ignore, lines_to_ignore, messages_to_ignore = get_suppressions([path], [], tools, blending=True)
+    assert not paths_to_ignore
+    assert not lines_to_ignore[path]
+    assert messages_to_ignore[path] == {2: {Ignore(None, "code")}}
+
+
+def test_only_comments_after_multiline_string(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_text(
+        'DOC = """\n'
+        "some text  # noqa\n"
+        "more text  # pylint: disable=unused-import\n"
+        '"""  # noqa: after\n'
+        "TEXT = '''it''' + \"\"\"also '''  # noqa\n"
+        '"""\n'
+        "CODE = 1  # noqa: code\n"
+    )
+    tools: dict[str, ToolBase] = {"pylint": PylintTool()}
+    paths_to_ignore, lines_to_ignore, messages_to_ignore = get_suppressions([path], [], tools, blending=True)
+    assert not paths_to_ignore
+    assert not lines_to_ignore[path]
+    assert messages_to_ignore[path] == {4: {Ignore(None, "after")}, 7: {Ignore(None, "code")}}
@@ -76,3 +76,20 @@ def test_multiple_lines() -> None:
     expected = {("s1", "s1c001", 4), ("s1", "s1c001", 6), ("s2", "s2c001", 6)}
 
     assert expected == result_set
+
+
+def test_blend_index() -> None:
+    index = blender.BlendIndex([[("s1", "a"), ("s2", "b"), ("s1", "a")], [("s2", "b"), ("s3", "c")]])
+    assert index.positions == {("s1", "a"): [(0, 0)], ("s2", "b"): [(0, 1), (1, 0)], ("s3", "c"): [(1, 1)]}
+
+
+def test_messages_left_unchanged() -> None:
+    """
+    The same messages can be blended again, with other messages or other combinations
+    """
+    loc = Location("path.py", "path", None, 1, 0)
+    messages = [Message("s1", "s1c01", loc, "Test Message"), Message("s2", "s2c12", loc, "Test Message")]
+
+    assert blender.blend(messages, TestBlendLine.BLEND) == messages[:1]
+    assert blender.blend(messages[1:], TestBlendLine.BLEND) == messages[1:]
+    assert blender.blend(messages, [[("s2", "s2c12"), ("s1", "s1c01")]]) == messages[1:]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from prospector.cache import dependency_digests
+from prospector.config import ProspectorConfig
+from prospector.finder import FileFinder
+from prospector.message import Message
+from prospector.run import Prospector
+from prospector.tools.pyflakes import PyFlakesTool
+
+from .utils import patch_execution
+
+
+def _make_project(root: Path) -> None:
+    (root / "one.py").write_text("import os\n")
+    (root / "two.py").write_text("import sys\n")
+
+
+def _check(project: Path, cache_dir: Path) -> tuple[list[tuple[str, str, str]], list[str], int, int]:
+    """
+    Check the project with pyflakes, as prospector does with --cache-dir, giving the
+    messages, the modules pyflakes was run on, and the cache hits and misses
+    """
+    checked: list[str] = []
+    run = PyFlakesTool.run
+
+    def _record(tool: PyFlakesTool, found_files: FileFinder) -> list[Message]:
+        checked.extend(path.name for path in found_files.python_modules)
+        return run(tool, found_files)
+
+    with (
+        patch_execution("-t", "pyflakes", "--cache-dir", str(cache_dir), str(project), set_cwd=project),
+        patch.object(PyFlakesTool, "run", _record),
+    ):
+        pros = Prospector(ProspectorConfig())
+        pros.execute()
+    assert pros.summary is not None
+    messages = [(m.location.path.name, m.code, m.message) for m in pros.get_messages()]  # type: ignore[union-attr]
+    return sorted(messages), sorted(checked), pros.summary["cache_hits"], pros.summary["cache_misses"]
+
+
+def test_unchanged_files_are_replayed(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    _make_project(project)
+
+    first, checked, hits, misses = _check(project, tmp_path / "cache")
+    assert (hits, misses) == (0, 2)
+    assert checked == ["one.py", "two.py"]
+
+    second, checked, hits, misses = _check(project, tmp_path / "cache")
+    assert (hits, misses) == (2, 0)
+    assert checked == []
+    assert second == first
+
+
+def test_changed_files_are_checked_again(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    _make_project(project)
+    _check(project, tmp_path / "cache")
+
+    (project / "two.py").write_text("import json\n")
+    messages, checked, hits, misses = _check(project, tmp_path / "cache")
+    assert (hits, misses) == (1, 1)
+    assert checked == ["two.py"]
+    assert [(name, code) for name, code, _ in messages] == [("one.py", "F401"), ("two.py", "F401")]
+    assert "json" in messages[1][2]
+
+
+def test_profile_change_invalidates(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    _make_project(project)
+    profile = project / ".prospector.yaml"
+    profile.write_text("pyflakes:\n  disable:\n    - F811\n    - F841\n")
+    _check(project, tmp_path / "cache")
+
+    # the order of disabled messages does not matter...
+    profile.write_text("pyflakes:\n  disable:\n    - F841\n    - F811\n")
+    _, _, hits, misses = _check(project, tmp_path / "cache")
+    assert (hits, misses) == (2, 0)
+
+    # ...but what they are does
+    profile.write_text("pyflakes:\n  disable:\n    - F811\n")
+    _, _, hits, misses = _check(project, tmp_path / "cache")
+    assert (hits, misses) == (0, 2)
+
+
+def test_dependency_digests_follow_imports(tmp_path: Path) -> None:
+    (tmp_path / "base.py").write_text("VALUE = 1\n")
+    (tmp_path / "middle.py").write_text("import base\n")
+    (tmp_path / "top.py").write_text("import middle\n")
+    (tmp_path / "alone.py").write_text("import os\n")
+    before = dependency_digests(FileFinder(tmp_path))
+
+    (tmp_path / "base.py").write_text("VALUE = 2\n")
+    after = dependency_digests(FileFinder(tmp_path))
+    changed = {path.name for path in before if before[path] != after[path]}
+    assert changed == {"base.py", "middle.py", "top.py"}
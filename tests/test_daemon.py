@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from prospector import daemon
+from prospector.exceptions import FatalProspectorException
+
+_CLIENT = "import sys; from prospector.daemon import client_main; sys.argv[0] = 'prospector-client'; client_main()"
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="the daemon needs Unix sockets")
+
+
+def _write(path: Path, source: str, age: int) -> None:
+    # files changed just before a check are not trusted to stay cached, so make them older
+    path.write_text(source, encoding="utf-8")
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def daemon_socket(tmp_path: Path) -> Iterator[Path]:
+    socket_path = tmp_path / "daemon.sock"
+    env = {**os.environ, "PROSPECTOR_DAEMON_SOCKET": str(socket_path)}
+    daemon = subprocess.Popen(
+        [sys.executable, "-m", "prospector", "--daemon"], cwd=tmp_path, env=env, stderr=subprocess.DEVNULL
+    )
+    try:
+        for _ in range(300):
+            if socket_path.exists():
+                break
+            time.sleep(0.1)
+        yield socket_path
+    finally:
+        subprocess.run(  # noqa: S603 - runs this same python
+            [sys.executable, "-c", _CLIENT, "--stop-daemon"], env=env, check=False, capture_output=True
+        )
+        daemon.wait(timeout=30)
+
+
+def _client(project: Path, socket_path: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PROSPECTOR_DAEMON_SOCKET": str(socket_path)}
+    return subprocess.run(  # noqa: S603 - runs this same python
+        [sys.executable, "-c", _CLIENT, *args], cwd=project, env=env, capture_output=True, text=True, check=False
+    )
+
+
+def test_daemon_sees_changes(tmp_path: Path, daemon_socket: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    _write(project / "lib.py", '"""Lib."""\n\n\ndef func():\n    return 1\n', age=60)
+    _write(project / "use.py", '"""Use."""\nfrom lib import func\n\nprint(func(1))\n', age=60)
+
+    args = ("--tool", "pylint", "--output-format", "json", "use.py")
+    first = _client(project, daemon_socket, *args)
+    assert first.returncode == 1
+    assert [msg["code"] for msg in json.loads(first.stdout)["messages"]] == ["too-many-function-args"]
+
+    _write(project / "lib.py", '"""Lib."""\n\n\ndef func(arg):\n    return arg\n', age=30)
+    second = _client(project, daemon_socket, *args)
+    assert second.returncode == 0
+    assert json.loads(second.stdout)["messages"] == []
+
+    assert daemon_socket.exists()
+
+
+def _send_request(socket_path: Path, request: object) -> list[dict[str, object]]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path))
+        with connection.makefile("rb") as reader, connection.makefile("wb") as writer:
+            writer.write(json.dumps(request).encode() + b"\n")
+            writer.flush()
+            return [json.loads(line) for line in reader]
+
+
+def test_daemon_survives_bad_requests(tmp_path: Path, daemon_socket: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    _write(project / "mod.py", '"""Mod."""\nimport os\n', age=60)
+    gone = tmp_path / "gone"
+    gone.mkdir()
+    gone.rmdir()
+
+    check = {"command": "check", "argv": ["--tool", "pyflakes", "mod.py"], "cwd": str(project), "env": {}}
+    for request in ({"command": "check"}, {**check, "cwd": str(gone)}, {**check, "argv": ["--watch"]}):
+        frames = _send_request(daemon_socket, request)
+        assert frames[-1] == {"exit": 2}
+        assert any("stderr" in frame for frame in frames)
+
+    # and still runs the checks sent afterwards
+    assert _send_request(daemon_socket, check)[-1] == {"exit": 1}
+
+
+def test_client_without_daemon_runs_the_check(tmp_path: Path) -> None:
+    (tmp_path / "mod.py").write_text('"""Mod."""\nimport os\n', encoding="utf-8")
+    result = _client(tmp_path, tmp_path / "missing.sock", "--tool", "pyflakes", "--output-format", "json", "mod.py")
+    assert result.returncode == 1
+    assert [msg["code"] for msg in json.loads(result.stdout)["messages"]] == ["F401"]
+
+
+def test_client_ignores_socket_of_another_user(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    socket_path = tmp_path / "other.sock"
+    socket_path.write_text("")
+    argv = ["prospector-client", "--daemon-socket", str(socket_path), "mod.py"]
+    with (
+        patch("sys.argv", argv),
+        patch("os.getuid", return_value=os.getuid() + 1),
+        patch("prospector.run.main") as main,
+        patch("socket.socket") as connect,
+    ):
+        daemon.client_main()
+    # the check is run in this process, without even connecting
+    main.assert_called_once_with()
+    connect.assert_not_called()
+    assert "belongs to another user" in capsys.readouterr().err
+
+
+def test_only_the_needed_environment_is_sent() -> None:
+    environ = {"PATH": "/bin", "PROSPECTOR_FILE_PREFIX": "src", "LC_ALL": "C", "AWS_SECRET_ACCESS_KEY": "secret"}
+    assert daemon._forwarded_environ(environ) == {  # pylint: disable=protected-access
+        "PATH": "/bin",
+        "PROSPECTOR_FILE_PREFIX": "src",
+        "LC_ALL": "C",
+    }
+
+
+def test_default_socket_in_private_dir(tmp_path: Path) -> None:
+    with patch.dict("os.environ", {"XDG_RUNTIME_DIR": ""}), patch("tempfile.gettempdir", return_value=str(tmp_path)):
+        socket_path = daemon.default_socket_path()
+        assert socket_path.parent == tmp_path / f"prospector-{os.getuid()}"
+
+        # a directory left open to the others is closed again
+        socket_path.parent.mkdir(mode=0o777)
+        socket_path.parent.chmod(0o777)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with server:
+            daemon._bind(server, socket_path)  # pylint: disable=protected-access
+        assert socket_path.parent.stat().st_mode & 0o777 == 0o700
+
+
+def test_stale_socket_which_cannot_be_removed(tmp_path: Path) -> None:
+    socket_path = tmp_path / "stale.sock"
+    socket_path.write_text("")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with (
+        server,
+        patch.object(Path, "unlink", side_effect=PermissionError(1, "Operation not permitted")),
+        pytest.raises(FatalProspectorException, match="Could not remove"),
+    ):
+        daemon._bind(server, socket_path)  # pylint: disable=protected-access
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from prospector import vcs
+from prospector.dependencies import ImportGraph, find_imports, module_name
+from prospector.exceptions import FatalProspectorException
+
+
+def _write(root: Path, files: dict[str, str]) -> dict[str, Path]:
+    paths = {}
+    for name, source in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+        paths[name] = path
+    return paths
+
+
+def test_find_imports() -> None:
+    source = (
+        "import os, a.b as ab\n"
+        "from . import sibling\n"
+        "from ..other import (\n    thing,\n    more as alias,\n)\n"
+        "if x:\n    from pkg.sub import name  # comment\n"
+    )
+    found = find_imports(source, "pkg.sub.mod")
+    assert {"os", "a", "a.b", "pkg.sub", "pkg.sub.sibling", "pkg.other", "pkg.other.thing", "pkg.other.more"} <= found
+    assert "pkg.sub.name" in found
+
+
+def test_find_imports_relative_in_package() -> None:
+    assert "pkg.mod" in find_imports("from .mod import x\n", "pkg", is_package=True)
+
+
+def test_module_name(tmp_path: Path) -> None:
+    paths = _write(tmp_path, {"pkg/__init__.py": "", "pkg/sub/__init__.py": "", "pkg/sub/mod.py": "", "top.py": ""})
+    assert module_name(paths["pkg/sub/mod.py"]) == "pkg.sub.mod"
+    assert module_name(paths["pkg/sub/__init__.py"]) == "pkg.sub"
+    assert module_name(paths["top.py"]) == "top"
+
+
+def test_dependents_and_dependencies(tmp_path: Path) -> None:
+    paths = _write(
+        tmp_path,
+        {
+            "pkg/__init__.py": "",
+            "pkg/base.py": "import os\n",
+            "pkg/middle.py": "from pkg.base import Base\n",
+            "pkg/top.py": "from .middle import thing\n",
+            "pkg/alone.py": "import json\n",
+        },
+    )
+    graph = ImportGraph(paths.values())
+
+    assert graph.dependents([paths["pkg/base.py"]]) == {paths["pkg/middle.py"], paths["pkg/top.py"]}
+    assert graph.dependents([paths["pkg/alone.py"]]) == set()
+    # importing pkg.middle also imports the package itself
+    assert graph.dependencies([paths["pkg/top.py"]]) == {
+        paths["pkg/__init__.py"],
+        paths["pkg/middle.py"],
+        paths["pkg/base.py"],
+    }
+
+
+def _git(workdir: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(workdir), *args], check=True, capture_output=True)  # noqa: S603,S607
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_changed_files(tmp_path: Path) -> None:
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "test")
+    paths = _write(tmp_path, {"kept.py": "", "changed.py": "", "deleted.py": "", ".gitignore": "ignored.py\n"})
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+
+    _git(tmp_path, "checkout", "-q", "-b", "feature")
+    paths["changed.py"].write_text("x = 1\n", encoding="utf-8")
+    _git(tmp_path, "commit", "-q", "-am", "change")
+    paths["deleted.py"].unlink()
+    _write(tmp_path, {"new.py": "", "ignored.py": ""})
+
+    changed = vcs.changed_files(tmp_path, "main")
+    assert changed == {paths["changed.py"].absolute(), paths["deleted.py"].absolute(), (tmp_path / "new.py").absolute()}
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_changed_files_through_symlink(tmp_path: Path) -> None:
+    checkout = tmp_path / "checkout"
+    checkout.mkdir()
+    _git(checkout, "init", "-q", "-b", "main")
+    _git(checkout, "config", "user.email", "test@example.com")
+    _git(checkout, "config", "user.name", "test")
+    _git(checkout, "commit", "-q", "--allow-empty", "-m", "initial")
+    (checkout / "src").mkdir()
+    (checkout / "src" / "new.py").write_text("", encoding="utf-8")
+
+    link = tmp_path / "link"
+    link.symlink_to(checkout)
+    # the paths are under the workdir as given, as those of the files found to check are
+    assert vcs.changed_files(link / "src", "main") == {(link / "src" / "new.py").absolute()}
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_changed_files_unknown_ref(tmp_path: Path) -> None:
+    _git(tmp_path, "init", "-q")
+    with pytest.raises(FatalProspectorException):
+        vcs.changed_files(tmp_path, "does-not-exist")
+
+
+def test_dependents_of_removed_modules(tmp_path: Path) -> None:
+    paths = _write(tmp_path, {"pkg/__init__.py": "", "top.py": "from pkg.gone import thing\n", "alone.py": ""})
+    gone = tmp_path / "pkg" / "gone.py"
+    graph = ImportGraph(paths.values(), removed={gone})
+    assert graph.dependents([gone]) == {paths["top.py"]}
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from prospector import encoding
+from prospector.encoding import SourceStore, read_py_file
+from prospector.exceptions import CouldNotHandleEncoding
+
+
+def test_read_py_file_decodes(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_bytes(b"\xef\xbb\xbfx = 1\r\ny = '\xc3\xa9'\r")
+    assert read_py_file(path) == "x = 1\ny = 'é'\n"
+
+    path.write_bytes(b"# -*- coding: latin-1 -*-\ny = '\xe9'\n")
+    assert read_py_file(path) == "# -*- coding: latin-1 -*-\ny = 'é'\n"
+
+
+def test_read_py_file_undecodable(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_bytes(b"y = '\xe9'\n")
+    with pytest.raises(CouldNotHandleEncoding) as excinfo:
+        read_py_file(path)
+    assert excinfo.value.path == path
+    assert isinstance(excinfo.value.__cause__, SyntaxError)
+
+
+def test_source_store_reads_once(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_bytes(b"x = 1\r\n\r\ny = 2")
+    sources = SourceStore()
+
+    with patch.object(encoding, "_read_bytes", wraps=encoding._read_bytes) as read_bytes:
+        assert sources.read(path) == "x = 1\n\ny = 2"
+        assert sources.lines(path) == ["x = 1\n", "\n", "y = 2"]
+        assert len(sources.digest(path)) == 64
+    assert read_bytes.call_count == 1
+
+    with path.open(encoding="utf-8") as module:
+        assert sources.lines(path) == module.readlines()
+
+
+def test_source_store_forget(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_text("x = 1\n", encoding="utf-8")
+    sources = SourceStore()
+    digest = sources.digest(path)
+
+    path.write_text("x = 2\n", encoding="utf-8")
+    assert sources.read(path) == "x = 1\n"
+
+    sources.forget([path])
+    assert sources.read(path) == "x = 2\n"
+    assert sources.digest(path) != digest
+
+
+def test_source_store_undecodable(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_bytes(b"y = '\xe9'\n")
+    sources = SourceStore()
+
+    # the digest is known even if the content cannot be decoded
+    assert sources.digest(path)
+    for _ in range(2):
+        with pytest.raises(CouldNotHandleEncoding) as excinfo:
+            sources.read(path)
+        assert excinfo.value.path == path
+        assert isinstance(excinfo.value.__cause__, SyntaxError)
+    with pytest.raises(CouldNotHandleEncoding):
+        sources.lines(path)
+
+
+def test_source_store_tree(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_text("def f():\n    return 1\n", encoding="utf-8")
+    sources = SourceStore()
+
+    tree = sources.tree(path)
+    assert [node.name for node in tree.body] == ["f"]  # type: ignore[attr-defined]
+    assert sources.tree(path) is tree
+
+    path.write_text("def f(:\n", encoding="utf-8")
+    sources.forget([path])
+    with patch("ast.parse", wraps=ast.parse) as parse:
+        for _ in range(2):
+            with pytest.raises(SyntaxError) as excinfo:
+                sources.tree(path)
+            assert excinfo.value.lineno == 1
+    assert parse.call_count == 1
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from prospector.exclusion import ExclusionFilter
+
+_BOUNDARY = r"(^|/|\\)%s(/|\\|$)"
+
+_NAMES = [
+    "pkg",
+    "pkg/module.py",
+    "pkg2/module.py",
+    "src/pkg/module.py",
+    "docs/conf.py",
+    "migrations/0001.py",
+    "app/south_migrations/0001.py",
+    "build/lib/pkg/module.py",
+    "tests/data/aa.py",
+    "tests/data/ab.py",
+]
+
+
+def _reference(patterns: list[str], ignore_paths: list[str], name: str) -> bool:
+    # how every pattern used to be tried in turn
+    compiled = [re.compile(pattern) for pattern in patterns]
+    compiled += [re.compile(_BOUNDARY % re.escape(ignore_path)) for ignore_path in ignore_paths]
+    return any(pattern.match(name) for pattern in compiled)
+
+
+@pytest.mark.parametrize(
+    ("patterns", "ignore_paths"),
+    [
+        ([], []),
+        ([r"(^|/)(south_)?migrations(/|$)", r"^docs/"], []),
+        ([], ["pkg", "build/lib", "tests/data/aa.py"]),
+        ([r".*\.py$"], ["src"]),
+        # a pattern referring to its own group cannot be merged with the others
+        ([r"tests/data/(\w)\1\.py", r"^build"], ["docs"]),
+        # flags only allowed at the start of a pattern
+        ([r"(?i)^DOCS", r"^build"], []),
+    ],
+)
+def test_same_as_each_pattern(tmp_path: Path, patterns: list[str], ignore_paths: list[str]) -> None:
+    exclusion_filter = ExclusionFilter(tmp_path, [re.compile(pattern) for pattern in patterns], ignore_paths)
+    for name in _NAMES:
+        assert exclusion_filter(tmp_path / name) == _reference(patterns, ignore_paths, name), name
+
+
+def test_paths_outside_workdir_are_absolute(tmp_path: Path) -> None:
+    workdir = tmp_path / "project"
+    workdir.mkdir()
+    other = tmp_path / "other" / "module.py"
+
+    exclusion_filter = ExclusionFilter(workdir, [], [str(tmp_path / "other")])
+    assert exclusion_filter(other)
+    assert not exclusion_filter(workdir / "other" / "module.py")
+
+    exclusion_filter = ExclusionFilter(workdir, [], ["other"])
+    assert not exclusion_filter(other)
+    assert exclusion_filter(workdir / "other" / "module.py")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="needs symbolic links")
+def test_links_are_resolved(tmp_path: Path) -> None:
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real" / "module.py").write_text("")
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+    (tmp_path / "alias.py").symlink_to(tmp_path / "real" / "module.py")
+
+    exclusion_filter = ExclusionFilter(tmp_path, [], ["real"])
+    assert exclusion_filter(tmp_path / "link" / "module.py")
+    assert exclusion_filter(tmp_path / "alias.py")
+    assert not exclusion_filter(tmp_path / "link.py")
@@ -0,0 +1,74 @@
+import os
+from collections.abc import Callable
+from functools import partial
+
+import pytest
+
+from prospector import executor
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def _pid() -> int:
+    return os.getpid()
+
+
+def _sum_of_squares(value: int) -> int:
+    return sum(executor.run_all([partial(_square, value), partial(_square, value + 1)], jobs=2))
+
+
+def _fail() -> int:
+    raise ValueError("task failed")
+
+
+def test_results_in_task_order() -> None:
+    tasks = [partial(_square, value) for value in range(10)]
+    assert executor.run_all(tasks, jobs=1) == [value * value for value in range(10)]
+    assert executor.run_all(tasks, jobs=4) == [value * value for value in range(10)]
+
+
+@pytest.mark.skipif(not executor.can_run_in_parallel(), reason="needs the fork start method")
+def test_on_done() -> None:
+    tasks = [partial(_square, value) for value in range(10)]
+    for jobs in (1, 4):
+        done: list[tuple[int, int]] = []
+        executor.run_all(tasks, jobs=jobs, on_done=lambda index, result: done.append((index, result)))  # noqa: B023
+        assert sorted(done) == [(value, value * value) for value in range(10)]
+
+
+@pytest.mark.skipif(not executor.can_run_in_parallel(), reason="needs the fork start method")
+def test_tasks_run_in_worker_processes() -> None:
+    pids = executor.run_all([_pid, _pid], jobs=2)
+    assert os.getpid() not in pids
+
+
+@pytest.mark.skipif(not executor.can_run_in_parallel(), reason="needs the fork start method")
+def test_nested_calls() -> None:
+    tasks = [partial(_sum_of_squares, value) for value in range(6)]
+    assert executor.run_all(tasks, jobs=2) == [value * value + (value + 1) ** 2 for value in range(6)]
+    # the tasks of the calling process are still there once the nested calls are done
+    assert executor.run_all([partial(_square, 3), partial(_square, 4)], jobs=2) == [9, 16]
+
+
+def test_serial_runs_in_this_process() -> None:
+    assert executor.run_all([_pid, _pid], jobs=1) == [os.getpid(), os.getpid()]
+
+
+def test_task_exception_is_reraised() -> None:
+    tasks: list[Callable[[], int]] = [_fail, partial(_square, 2)]
+    with pytest.raises(ValueError, match="task failed"):
+        executor.run_all(tasks, jobs=2)
+
+
+def test_resolve_jobs() -> None:
+    assert executor.resolve_jobs(3) == 3
+    assert executor.resolve_jobs(0) == (os.cpu_count() or 1)
+
+
+def test_split() -> None:
+    assert executor.split(list(range(7)), 3) == [[0, 3, 6], [1, 4], [2, 5]]
+    assert executor.split([1, 2], 5) == [[1], [2]]
+    assert executor.split([], 4) == [[]]
+    assert executor.split([1, 2], 0) == [[1, 2]]
@@ -1,9 +1,11 @@
+import copy
+import pickle
 from pathlib import Path
 from unittest import TestCase
 
 import pytest
 
-from prospector.message import Location
+from prospector.message import Location, Message, sort_messages
 
 
 class LocationPathTest(TestCase):
@@ -91,3 +93,64 @@ class LocationOrderTest(TestCase):
         expected = [None if c == -1 else c for c in sorted(chars)]
 
         assert expected == [loc.character for loc in sorted(locs)]
+
+
+class MessageOrderTest(TestCase):
+    def _messages(self) -> list[Message]:
+        paths = ["/tmp/path/module1.py", "/tmp/path/module2.py", "/tmp/path-b/module1.py", None]  # noqa: S108
+        return [
+            Message("tool", code, Location(path, None, None, line, character), "message")
+            for path in paths
+            for line in (-1, 10, 2)
+            for character in (-1, 3, 1)
+            for code in ("B", "A")
+        ]
+
+    def test_sort_messages(self) -> None:
+        messages = self._messages()
+        expected = sorted(messages)
+        assert [message.sort_key for message in sort_messages(messages)] == [message.sort_key for message in expected]
+        # paths sort part by part, as they do compared with each other
+        paths = [message.location.path for message in expected if message.location.path is not None]
+        assert paths == sorted(paths)
+        assert expected[0].location.path is None
+
+    def test_same_order_as_locations(self) -> None:
+        messages = sort_messages(self._messages())
+        for first, second in zip(messages, messages[1:]):
+            assert not second.location < first.location
+            if first.location == second.location:
+                assert first.code <= second.code
+
+
+class MessageCopyTest(TestCase):
+    def test_pickle(self) -> None:
+        location = Location("/tmp/path/module1.py", "module1", "somefunc", 10, 2, 11, 0)  # noqa: S108
+        message = Message("pylint", "unused-import", location, "Unused import os", "https://example.com", True)
+        loaded = pickle.loads(pickle.dumps(message))  # noqa: S301
+        assert loaded == message
+        assert loaded.sort_key == message.sort_key
+        assert (loaded.source, loaded.message, loaded.doc_url, loaded.is_fixable) == (
+            "pylint",
+            "Unused import os",
+            "https://example.com",
+            True,
+        )
+        assert (loaded.location.module, loaded.location.function, loaded.location.line_end) == (
+            "module1",
+            "somefunc",
+            11,
+        )
+        assert loaded.location.character_end == 0
+
+    def test_copy(self) -> None:
+        message = Message("pylint", "unused-import", Location(None, None, None, None, None), "Unused import os")
+        copied = copy.copy(message)
+        copied.source = "pyflakes"
+        assert message.source == "pylint"
+        assert copied == message
+
+    def test_paths_interned(self) -> None:
+        first = Location("/tmp/path/module1.py", None, None, 1, 0)  # noqa: S108
+        second = Location(Path("/tmp/path/module1.py"), None, None, 2, 0)  # noqa: S108
+        assert first.path is second.path
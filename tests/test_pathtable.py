@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from prospector.message import Location
+from prospector.pathtable import PATHS, PathTable
+
+
+def test_paths_interned(tmp_path: Path) -> None:
+    table = PathTable()
+    module = tmp_path / "pkg" / "module.py"
+    path_id = table.intern(module)
+    assert table.intern(str(module)) == path_id
+    assert table.intern(Path(str(module))) == path_id
+    assert table[path_id] is module
+    assert table.interned(str(module)) is module
+    assert table.intern(tmp_path / "other.py") != path_id
+    assert len(table) == 2
+
+
+def test_relative_paths_follow_current_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    table = PathTable()
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    monkeypatch.chdir(tmp_path / "a")
+    in_a = table.intern("module.py")
+    monkeypatch.chdir(tmp_path / "b")
+    in_b = table.intern("module.py")
+    assert in_a != in_b
+    assert table[in_b] == tmp_path / "b" / "module.py"
+    assert table.intern(tmp_path / "a" / "module.py") == in_a
+
+
+def test_sort_key_same_order_as_paths(tmp_path: Path) -> None:
+    table = PathTable()
+    paths = [tmp_path / name for name in ("a-b/x.py", "a/x.py", "a/b/x.py", "ab.py", "a.py", "B.py")]
+    ids = [table.intern(path) for path in paths]
+    assert [table[path_id] for path_id in sorted(ids, key=table.sort_key)] == sorted(paths)
+
+
+def test_relative_and_module_name(tmp_path: Path) -> None:
+    table = PathTable()
+    module = table.intern(tmp_path / "pkg" / "module.py")
+    package = table.intern(tmp_path / "pkg" / "__init__.py")
+    outside = table.intern("/elsewhere/module.py")
+
+    assert table.relative(module, tmp_path) == Path("pkg", "module.py")
+    assert table.relative(module, None) == tmp_path / "pkg" / "module.py"
+    assert table.relative(outside, tmp_path) == Path("/elsewhere/module.py").absolute()
+    assert table.module_name(module, tmp_path) == "pkg.module"
+    assert table.module_name(package, tmp_path) == "pkg"
+    assert table.module_name(module, tmp_path / "pkg") == "module"
+
+
+def test_locations_share_paths(tmp_path: Path) -> None:
+    first = Location(tmp_path / "module.py", None, None, 1, 0)
+    second = Location(os.path.join(str(tmp_path), "module.py"), None, None, 2, 0)
+    assert first.path_id is not None
+    assert first.path_id == second.path_id
+    assert first.path is second.path is PATHS[first.path_id]
+    assert Location(None, None, None, 1, 0).path_id is None
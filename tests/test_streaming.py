@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from prospector.message import Location, Message
+from prospector.streaming import MessageStream
+
+
+def _message(path: Path, code: str) -> Message:
+    return Message("tool", code, Location(path, None, None, 1, 0), "")
+
+
+def test_handed_out_once_every_task_is_done(tmp_path: Path) -> None:
+    first, second = tmp_path / "first.py", tmp_path / "second.py"
+    handled: list[tuple[Path, list[str]]] = []
+    stream = MessageStream(lambda path, messages: handled.append((path, [m.code for m in messages])))
+
+    # a tool checking both files, and another checking each on its own
+    stream.expect([first, second])
+    stream.expect([first])
+    stream.expect([second])
+
+    stream.done([first, second], [_message(first, "a"), _message(second, "b"), _message(tmp_path / "other.py", "c")])
+    assert handled == []
+    stream.done([second], [])
+    assert handled == [(second, ["b"])]
+    stream.done([first], [_message(first, "d")])
+    assert handled == [(second, ["b"]), (first, ["a", "d"])]
+    assert stream.streamed == {first, second}
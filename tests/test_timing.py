@@ -0,0 +1,34 @@
+import time
+
+import pytest
+
+from prospector.timing import Measurement, measure
+
+
+def test_measure() -> None:
+    with measure() as timing:
+        deadline = time.process_time() + 0.05
+        while time.process_time() < deadline:
+            pass
+    assert timing.wall_time >= 0.05
+    assert timing.cpu_time >= 0.05
+    assert timing.peak_rss is None or timing.peak_rss > 0
+
+
+def test_measure_exception() -> None:
+    with pytest.raises(ValueError, match="oops"), measure() as timing:
+        raise ValueError("oops")
+    assert timing.wall_time > 0
+
+
+def test_add() -> None:
+    combined = Measurement(1.0, 0.5, 100) + Measurement(2.0, 1.5, 300) + Measurement(1.0, 1.0, None)
+    assert (combined.wall_time, combined.cpu_time, combined.peak_rss) == (4.0, 3.0, 300)
+    assert (Measurement() + Measurement()).peak_rss is None
+    assert Measurement(0.12345, 0.1, 1).as_dict() == {"wall_time": 0.123, "cpu_time": 0.1, "peak_rss": 1}
+
+
+def test_in_parallel() -> None:
+    combined = Measurement.in_parallel([Measurement(1.0, 0.5, 100), Measurement(2.0, 1.5, 300), Measurement(1.0, 1.0)])
+    assert (combined.wall_time, combined.cpu_time, combined.peak_rss) == (2.0, 3.0, 300)
+    assert Measurement.in_parallel([]).as_dict() == {"wall_time": 0.0, "cpu_time": 0.0, "peak_rss": None}
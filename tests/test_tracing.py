@@ -0,0 +1,51 @@
+import json
+import os
+from pathlib import Path
+
+from prospector import tracing
+
+
+def test_not_started(tmp_path: Path) -> None:
+    with tracing.span("nothing", "test"):
+        pass
+    assert list(tracing.per_file([Path("a.py")], "tool")) == [Path("a.py")]
+    assert tracing.take(tracing.mark()) == []
+
+    tracing.finish(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert [event["ph"] for event in events] == ["M"]
+
+
+def test_trace(tmp_path: Path) -> None:
+    tracing.start()
+    with tracing.span("outer", "test", detail=1):
+        for _ in tracing.per_file([Path("a.py"), Path("b.py")], "tool"):
+            pass
+
+    # what a worker process sends back
+    mark = tracing.mark()
+    with tracing.span("elsewhere", "test"):
+        pass
+    taken = tracing.take(mark)
+    assert [event["name"] for event in taken] == ["elsewhere"]
+    tracing.add([{**event, "pid": 1} for event in taken])
+
+    tracing.finish(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert [(event["name"], event["args"]) for event in events if event["ph"] == "M"] == [
+        ("process_name", {"name": "prospector worker 1"}),
+        ("process_name", {"name": "prospector"}),
+    ]
+    spans = [event for event in events if event["ph"] == "X"]
+    assert [(event["name"], event["cat"], event["args"]) for event in spans] == [
+        ("outer", "test", {"detail": 1}),
+        ("a.py", "file", {"tool": "tool"}),
+        ("b.py", "file", {"tool": "tool"}),
+        ("elsewhere", "test", {}),
+    ]
+    assert [event["pid"] for event in spans] == [os.getpid()] * 3 + [1]
+
+    # recording stopped with the trace written
+    with tracing.span("after", "test"):
+        pass
+    assert tracing.take(0) == []
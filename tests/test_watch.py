@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from prospector.config import ProspectorConfig
+from prospector.finder import FileFinder
+from prospector.run import Prospector
+from prospector.tools.pylint.astroid_cache import AstroidCache
+from prospector.watch import _Snapshot
+
+from .utils import patch_execution
+
+
+def _codes(prospector: Prospector) -> list[tuple[str, str]]:
+    return sorted((message.location.path.name, message.code) for message in prospector.get_messages())  # type: ignore[union-attr]
+
+
+def test_snapshot_changes(tmp_path: Path) -> None:
+    module = tmp_path / "module.py"
+    module.write_text("x = 1\n", encoding="utf-8")
+    # make sure creating a file later changes the modification time of the directory
+    os.utime(tmp_path, (0, 0))
+    snapshot = _Snapshot(FileFinder(tmp_path))
+
+    assert snapshot.changed_files() == set()
+    assert not snapshot.directories_changed()
+
+    module.write_text("x = 12\n", encoding="utf-8")
+    assert snapshot.changed_files() == {module}
+    assert snapshot.changed_files() == set()
+
+    (tmp_path / "other.py").write_text("", encoding="utf-8")
+    assert snapshot.directories_changed()
+
+
+def test_update_only_replaces_changed_files(tmp_path: Path) -> None:
+    (tmp_path / "first.py").write_text("import os\n", encoding="utf-8")
+    (tmp_path / "second.py").write_text("import sys\n", encoding="utf-8")
+
+    with patch_execution("--tool", "pyflakes", str(tmp_path), set_cwd=tmp_path):
+        prospector = Prospector(ProspectorConfig())
+        prospector.execute()
+        assert _codes(prospector) == [("first.py", "F401"), ("second.py", "F401")]
+
+        (tmp_path / "first.py").write_text("import os\n\nprint(os)\n", encoding="utf-8")
+        prospector.update({tmp_path / "first.py"}, prospector.find_files())
+        assert _codes(prospector) == [("second.py", "F401")]
+
+        (tmp_path / "third.py").write_text("import json\n", encoding="utf-8")
+        (tmp_path / "second.py").unlink()
+        changed = {tmp_path / "third.py", tmp_path / "second.py"}
+        prospector.update(changed, prospector.find_files())
+        assert _codes(prospector) == [("third.py", "F401")]
+
+
+def test_update_forgets_previous_messages(tmp_path: Path) -> None:
+    (tmp_path / "module.py").write_text("import os;assert os\n", encoding="utf-8")
+
+    with patch_execution("-s", "veryhigh", "-t", "pycodestyle", "-t", "bandit", str(tmp_path), set_cwd=tmp_path):
+        prospector = Prospector(ProspectorConfig())
+        prospector.execute()
+        codes = _codes(prospector)
+        assert ("module.py", "E702") in codes
+        assert ("module.py", "B101") in codes
+
+        (tmp_path / "module.py").write_text("import os\n\nprint(os)\n", encoding="utf-8")
+        prospector.update({tmp_path / "module.py"}, prospector.find_files())
+        assert _codes(prospector) == []
+
+
+def test_update_rechecks_importers_of_deleted_modules(tmp_path: Path) -> None:
+    (tmp_path / "wch_user.py").write_text('"""User."""\nimport wch_used\n\nwch_used.func()\n', encoding="utf-8")
+    (tmp_path / "wch_used.py").write_text('"""Used."""\n\n\ndef func():\n    """Func."""\n', encoding="utf-8")
+    # files changed just before a check are not trusted to stay cached, so make them older
+    for path in tmp_path.iterdir():
+        os.utime(path, (time.time() - 60, time.time() - 60))
+
+    with patch_execution("--tool", "pylint", str(tmp_path), set_cwd=tmp_path):
+        astroid_cache = AstroidCache()
+        started_ns = time.time_ns()
+        prospector = Prospector(ProspectorConfig())
+        prospector.execute()
+        astroid_cache.record(started_ns)
+        assert _codes(prospector) == []
+
+        (tmp_path / "wch_used.py").unlink()
+        astroid_cache.refresh()
+        prospector.update({tmp_path / "wch_used.py"}, prospector.find_files())
+        assert _codes(prospector) == [("wch_user.py", "import-error")]
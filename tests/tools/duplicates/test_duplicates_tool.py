@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from unittest.mock import patch
+
+from prospector.config import ProspectorConfig
+from prospector.finder import FileFinder
+from prospector.message import Message
+from prospector.tools.duplicates import DuplicatesTool
+from prospector.tools.duplicates.clones import fingerprints, new_vocabulary, tokenise
+
+ORIGINAL = '''\
+import os
+
+
+def load_settings(path, defaults):
+    """Read the settings, falling back on the defaults."""
+    settings = dict(defaults)
+    if not os.path.exists(path):
+        return settings
+    with open(path) as handle:
+        for number, line in enumerate(handle):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, _, value = line.partition("=")
+            if not value:
+                raise ValueError(f"Line {number} of {path} has no value")
+            settings[key.strip()] = value.strip()
+    return settings
+'''
+
+# the same function, with other names, comments and strings
+RENAMED = '''\
+import os
+from pathlib import Path
+
+VERSION = 2
+
+
+def read_config(filename, fallback):
+    """Load the configuration, or use the fallback."""
+    config = dict(fallback)
+    if not os.path.exists(filename):
+        return config
+    with open(filename) as stream:
+        for index, row in enumerate(stream):
+            row = row.strip()
+            # skip the blank lines and comments
+            if not row or row.startswith(";"):
+                continue
+            name, _, content = row.partition(":")
+            if not content:
+                raise KeyError(f"Row {index} of {filename} is empty")
+            config[name.strip()] = content.strip()
+    return config
+'''
+
+
+def _make_config(workdir: Path, profile: str = "") -> ProspectorConfig:
+    (workdir / ".prospector.yaml").write_text(profile)
+    with patch("sys.argv", [""]):
+        return ProspectorConfig(workdir=workdir)
+
+
+def _run(workdir: Path, profile: str = "", checked: list[str] | None = None) -> list[Message]:
+    tool = DuplicatesTool()
+    found_files = FileFinder(workdir)
+    tool.configure(_make_config(workdir, profile), found_files)
+    if checked is not None:
+        found_files = found_files.restricted_to(workdir / name for name in checked)
+    return tool.run(found_files)
+
+
+def test_renamed_copy_found(tmp_path: Path) -> None:
+    (tmp_path / "settings.py").write_text(ORIGINAL)
+    (tmp_path / "config.py").write_text(RENAMED)
+    (tmp_path / "other.py").write_text("def other():\n    return 1\n")
+
+    messages = _run(tmp_path, "duplicates:\n  options:\n    min-tokens: 60\n")
+    assert len(messages) == 1
+    message = messages[0]
+    assert (message.source, message.code) == ("duplicates", "duplicate-code")
+    # reported on the module sorting last, against the one sorting first
+    assert message.location.path == (tmp_path / "settings.py").absolute()
+    assert (message.location.line, message.location.line_end) == (4, 18)
+    assert message.message == "Lines 4-18 duplicate lines 7-22 of config.py"
+
+
+def test_copy_of_module_not_checked_found(tmp_path: Path) -> None:
+    (tmp_path / "settings.py").write_text(ORIGINAL)
+    (tmp_path / "config.py").write_text(RENAMED)
+    (tmp_path / "other.py").write_text("def other():\n    return 1\n")
+    profile = "duplicates:\n  options:\n    min-tokens: 60\n"
+
+    # as with --changed-since, only some of the modules are checked
+    full = _run(tmp_path, profile)
+    assert [message.message for message in _run(tmp_path, profile, ["config.py"])] == [
+        message.message for message in full
+    ]
+    assert [message.message for message in _run(tmp_path, profile, ["settings.py"])] == [
+        message.message for message in full
+    ]
+    assert _run(tmp_path, profile, ["other.py"]) == []
+
+
+def test_names_can_matter(tmp_path: Path) -> None:
+    (tmp_path / "settings.py").write_text(ORIGINAL)
+    (tmp_path / "config.py").write_text(RENAMED)
+    assert _run(tmp_path, "duplicates:\n  options:\n    min-tokens: 60\n    ignore-identifiers: false\n") == []
+
+
+def test_short_blocks_not_reported(tmp_path: Path) -> None:
+    (tmp_path / "settings.py").write_text(ORIGINAL)
+    (tmp_path / "config.py").write_text(RENAMED)
+    assert _run(tmp_path, "duplicates:\n  options:\n    min-tokens: 200\n") == []
+
+
+def test_copy_within_module(tmp_path: Path) -> None:
+    (tmp_path / "both.py").write_text(ORIGINAL + "\n\n" + RENAMED.replace("import", "# import"))
+    messages = _run(tmp_path, "duplicates:\n  options:\n    min-tokens: 60\n")
+    assert [message.message for message in messages] == ["Lines 27-42 duplicate lines 4-18 of both.py"]
+
+
+def test_tables_of_data_not_reported(tmp_path: Path) -> None:
+    rows = "".join(f'    ("name{number}", {number}, "value{number}"),\n' for number in range(300))
+    (tmp_path / "first.py").write_text(f"FIRST = [\n{rows}]\n")
+    (tmp_path / "second.py").write_text(f"SECOND = [\n{rows}]\n\nTHIRD = [\n{rows}]\n")
+    assert _run(tmp_path, "duplicates:\n  options:\n    min-tokens: 20\n") == []
+
+
+def test_unparsable_modules_skipped(tmp_path: Path) -> None:
+    (tmp_path / "settings.py").write_text(ORIGINAL)
+    (tmp_path / "config.py").write_text(RENAMED)
+    (tmp_path / "broken.py").write_text("def broken(:\n    return (\n")
+    messages = _run(tmp_path, "duplicates:\n  options:\n    min-tokens: 60\n")
+    assert [message.location.path.name for message in messages if message.location.path] == ["settings.py"]
+
+
+def test_imports_and_comments_left_out() -> None:
+    vocabulary = new_vocabulary()
+    with_imports, _ = tokenise("import os\nfrom a import (\n    b,\n)\n# comment\nx = 1\n", vocabulary)
+    without, _ = tokenise("x = 2\n", vocabulary)
+    assert with_imports == without
+
+
+def test_shared_runs_share_a_fingerprint() -> None:
+    generator = random.Random(0)  # noqa: S311 - only to make up tokens
+    kgram, window = 5, 20
+    for _ in range(50):
+        shared = [generator.randrange(30) for _ in range(kgram + window - 1)]
+        first = [generator.randrange(30) for _ in range(generator.randrange(100))] + shared
+        second = shared + [generator.randrange(30) for _ in range(generator.randrange(100))]
+        first_hashes = {value for value, _ in fingerprints(first, kgram, window)}
+        second_hashes = {value for value, _ in fingerprints(second, kgram, window)}
+        assert first_hashes & second_hashes
@@ -38,7 +38,7 @@ class TestPycodestyleTool(TestCase):
     def test_pycodestyle_space_and_tabs(self) -> None:
         workdir = Path(__file__).parent / "testpath"
         self._configure("testpath/test_space_tab.py", "--full-pep8", workdir=workdir)
-        messages = self._tool.run([])
+        messages = self._tool.run(FileFinder(workdir / "test_space_tab.py"))
         assert all(message.source == "pycodestyle" for message in messages)
         assert {"E101", "E111", "W191"} <= {m.code for m in messages}
 
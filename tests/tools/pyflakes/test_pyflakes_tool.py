@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from prospector.config import ProspectorConfig
+from prospector.finder import FileFinder
+from prospector.tools.pyflakes import PyFlakesTool
+
+
+def test_unreadable_file_reported(tmp_path: Path) -> None:
+    (tmp_path / "fine.py").write_text("import os\n")
+    (tmp_path / "gone.py").write_text("")
+    with patch("sys.argv", [""]):
+        config = ProspectorConfig(workdir=tmp_path)
+    found_files = FileFinder(tmp_path)
+    tool = PyFlakesTool()
+    tool.configure(config, found_files)
+    # found, but no longer there to be read
+    assert found_files.python_modules
+    (tmp_path / "gone.py").unlink()
+
+    messages = tool.run(found_files)
+    assert sorted((message.location.path.name, message.code) for message in messages) == [  # type: ignore[union-attr]
+        ("fine.py", "F401"),
+        ("gone.py", "F999"),
+    ]
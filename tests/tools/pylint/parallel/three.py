@@ -0,0 +1,5 @@
+from . import two
+
+
+def use_two() -> object:
+    return two.use_three
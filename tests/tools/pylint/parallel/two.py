@@ -0,0 +1,5 @@
+from . import three
+
+
+def use_three() -> object:
+    return three.use_two
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import astroid.context
+import pytest
+from astroid import MANAGER
+from astroid.exceptions import AstroidBuildingError
+from astroid.interpreter._import import spec
+
+from prospector.tools.pylint.astroid_cache import AstroidCache
+
+
+def _write(path: Path, source: str, age: int) -> None:
+    # files changed just before a check are not trusted to stay cached, so make them older
+    path.write_text(source, encoding="utf-8")
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+
+
+def _cached_files() -> set[str]:
+    return {module.file for module in MANAGER.astroid_cache.values() if module.file}
+
+
+def test_astroid_cache_drops_changed_modules_and_importers(tmp_path: Path) -> None:
+    base, importer, unrelated = tmp_path / "dmn_base.py", tmp_path / "dmn_importer.py", tmp_path / "dmn_unrelated.py"
+    _write(base, "def func():\n    return 1\n", age=60)
+    _write(importer, "from dmn_base import func\n", age=60)
+    _write(unrelated, "VALUE = 1\n", age=60)
+
+    cache = AstroidCache()
+    started = time.time_ns()
+    for path in (base, importer, unrelated):
+        MANAGER.ast_from_file(str(path), path.stem, source=True)
+    cache.record(started)
+
+    cache.refresh()
+    assert {str(base), str(importer), str(unrelated)} <= _cached_files()
+
+    _write(base, "def func(arg):\n    return arg\n", age=30)
+    cache.refresh()
+    cached = _cached_files()
+    assert str(base) not in cached
+    assert str(importer) not in cached
+    assert str(unrelated) in cached
+
+
+def test_astroid_cache_does_not_trust_recent_files(tmp_path: Path) -> None:
+    module = tmp_path / "dmn_recent.py"
+    module.write_text("VALUE = 1\n", encoding="utf-8")
+
+    started = time.time_ns()
+    MANAGER.ast_from_file(str(module), module.stem, source=True)
+    AstroidCache().record(started)
+    assert str(module) not in _cached_files()
+
+
+def test_astroid_cache_without_private_caches(tmp_path: Path) -> None:
+    # the private caches of astroid may be gone from other versions of it
+    module = tmp_path / "dmn_private.py"
+    _write(module, "VALUE = 1\n", age=60)
+    cache = AstroidCache()
+    started = time.time_ns()
+    MANAGER.ast_from_file(str(module), module.stem, source=True)
+    cache.record(started)
+
+    _write(module, "VALUE = 2\n", age=30)
+    with (
+        patch.object(astroid.context, "_invalidate_cache", None),
+        patch.object(spec, "_SPEC_FINDERS", None),
+        patch.object(MANAGER, "_mod_file_cache", None),
+    ):
+        del astroid.context._invalidate_cache, spec._SPEC_FINDERS, MANAGER._mod_file_cache
+        cache.refresh()
+    assert str(module) not in _cached_files()
+
+
+def test_astroid_cache_forgets_failed_imports(tmp_path: Path) -> None:
+    importer = tmp_path / "dmn_importer.py"
+    _write(importer, "import dmn_later\n", age=60)
+    cache = AstroidCache()
+    with patch("sys.path", [str(tmp_path), *sys.path]):
+        with pytest.raises(AstroidBuildingError):
+            MANAGER.ast_from_module_name("dmn_later", str(importer))
+        cache.record(time.time_ns())
+
+        _write(tmp_path / "dmn_later.py", "VALUE = 1\n", age=30)
+        cache.refresh()
+        assert MANAGER.ast_from_module_name("dmn_later", str(importer)).file == str(tmp_path / "dmn_later.py")
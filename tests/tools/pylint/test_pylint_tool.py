@@ -1,14 +1,20 @@
 import os
+import shutil
+import tempfile
 from collections.abc import Iterable
 from pathlib import Path, PosixPath
 from typing import Callable, Optional, Union
 from unittest import TestCase
 from unittest.mock import patch
 
+from astroid import MANAGER
+from pylint.lint import PyLinter
+
 from prospector.config import ProspectorConfig
 from prospector.finder import FileFinder
 from prospector.message import Message
 from prospector.tools.pylint import PylintTool
+from prospector.tools.pylint.linter import ProspectorLinter
 
 THIS_DIR = Path(__file__).parent
 
@@ -121,6 +127,132 @@ class TestPylintTool(TestCase):
 
         messages = pylint_tool.run(found_files)
         assert "line-too-long" in [msg.code for msg in messages if msg.source == "pylint"]
+        # only reported once the results of every module are merged
+        assert "cyclic-import" in [msg.code for msg in messages if msg.source == "pylint"]
+
+        # the same as checking the modules one after the other
+        pylint_tool._linter.config.jobs = 1  # pylint: disable=protected-access
+        serial = pylint_tool.run(found_files)
+        assert [(msg.sort_key, msg.message) for msg in messages] == [(msg.sort_key, msg.message) for msg in serial]
+
+    def test_cached_modules_replayed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "parallel"
+            shutil.copytree(THIS_DIR / "parallel", root, ignore=shutil.ignore_patterns("__pycache__"))
+            cache_dir = Path(tmp) / "cache"
+
+            def run() -> tuple[list[Message], int, int]:
+                with patch("pathlib.Path.cwd", return_value=root):
+                    pylint_tool, config = _get_pylint_tool_and_prospector_config(["", "--cache-dir", str(cache_dir)])
+                found_files = FileFinder(root, exclusion_filters=[config.make_exclusion_filter()])
+                pylint_tool.configure(config, found_files)
+                messages = pylint_tool.run(found_files)
+                assert pylint_tool._linter is not None  # pylint: disable=protected-access
+                module_cache = pylint_tool._linter._module_cache  # pylint: disable=protected-access
+                assert module_cache is not None
+                return messages, module_cache.hits, module_cache.misses
+
+            first, hits, misses = run()
+            assert (hits, misses) == (0, 4)
+            second, hits, misses = run()
+            assert (hits, misses) == (4, 0)
+            # the cyclic import is still found among the replayed modules
+            assert "cyclic-import" in [msg.code for msg in second]
+            assert [(msg.sort_key, msg.message) for msg in first] == [(msg.sort_key, msg.message) for msg in second]
+
+            # the changed module is checked again, along with the module importing it
+            (root / "three.py").write_text((root / "three.py").read_text() + "\n\nUNUSED = 1\n")
+            _, hits, misses = run()
+            assert (hits, misses) == (2, 2)
+
+    def test_cached_module_depends_on_modules_not_checked(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "project"
+            root.mkdir()
+            (root / "a.py").write_text('"""A."""\nfrom b import func\n\nfunc(1)\n')
+            (root / "b.py").write_text('"""B."""\n\n\ndef func(first):\n    """Func."""\n    return first\n')
+            cache_dir = Path(tmp) / "cache"
+
+            def run(*checked: str) -> list[str]:
+                MANAGER.clear_cache()
+                with patch("pathlib.Path.cwd", return_value=root):
+                    pylint_tool, config = _get_pylint_tool_and_prospector_config(["", "--cache-dir", str(cache_dir)])
+                found_files = FileFinder(root, exclusion_filters=[config.make_exclusion_filter()])
+                pylint_tool.configure(config, found_files)
+                messages = pylint_tool.run(found_files.restricted_to(root / name for name in checked))
+                return [msg.code for msg in messages if msg.location.path == root / "a.py"]
+
+            assert "no-value-for-parameter" not in run("a.py")
+            (root / "b.py").write_text(
+                '"""B."""\n\n\ndef func(first, second):\n    """Func."""\n    return first + second\n'
+            )
+            # as with --changed-since, only the module importing the changed one is checked
+            assert "no-value-for-parameter" in run("a.py")
+
+    def test_checkers_without_enabled_messages_skipped(self) -> None:
+        root = THIS_DIR / "parallel"
+        stock_prepare_checkers = PyLinter.prepare_checkers
+
+        def run(cache_dir: Path, planned: bool) -> tuple[list[Message], int, bool]:
+            with patch("pathlib.Path.cwd", return_value=root.absolute()):
+                pylint_tool, config = _get_pylint_tool_and_prospector_config(["", "--cache-dir", str(cache_dir)])
+            found_files = _get_test_files(root, exclusion_filters=[config.make_exclusion_filter()])
+            pylint_tool.configure(config, found_files)
+            linter = pylint_tool._linter  # pylint: disable=protected-access
+            assert linter is not None
+            (imports,) = [checker for checker in linter.get_checkers() if checker.name == "imports"]
+            for msgid in imports.msgs:
+                linter.disable(msgid)
+
+            MANAGER.clear_cache()
+            # without the plan, the linter prepares its checkers as stock pylint does
+            initialize = ProspectorLinter.initialize if planned else PyLinter.initialize
+            linter._checker_plan = None  # pylint: disable=protected-access
+            # in this process, so that the checkers prepared by the workers are counted
+            linter.config.jobs = 1
+            with (
+                patch.object(ProspectorLinter, "initialize", initialize),
+                patch.object(
+                    PyLinter, "prepare_checkers", autospec=True, side_effect=stock_prepare_checkers
+                ) as prepare,
+                patch.object(imports, "open") as opened,
+            ):
+                messages = pylint_tool.run(found_files)
+            plan = linter._checker_plan  # pylint: disable=protected-access
+            events = [] if plan is None else [*plan.visit_events.values(), *plan.leave_events.values()]
+            walked = any(
+                getattr(callback, "__self__", None) is imports for callbacks in events for callback in callbacks
+            )
+            return messages, prepare.call_count, opened.called or walked
+
+        with tempfile.TemporaryDirectory() as tmp:
+            # with a cache, the modules are checked one at a time
+            messages, prepared, imports_run = run(Path(tmp) / "planned", planned=True)
+            stock_messages, stock_prepared, _ = run(Path(tmp) / "stock", planned=False)
+
+        # the checkers are prepared once for the run, rather than for every module
+        assert prepared == 1
+        assert stock_prepared > 1
+        assert not imports_run
+        assert "line-too-long" in [msg.code for msg in messages]
+        assert "cyclic-import" not in [msg.code for msg in messages]
+        assert [(msg.sort_key, msg.message) for msg in messages] == [
+            (msg.sort_key, msg.message) for msg in stock_messages
+        ]
+
+    def test_run_again_on_fewer_files(self) -> None:
+        root = THIS_DIR / "pylint_configs" / "pylintrc"
+
+        with patch("pathlib.Path.cwd", return_value=root.absolute()):
+            pylint_tool, config = _get_pylint_tool_and_prospector_config()
+
+        found_files = _get_test_files(root)
+        pylint_tool.configure(config, found_files)
+        messages = pylint_tool.run(found_files)
+        assert messages
+
+        # running again must not repeat the messages of the previous run
+        assert pylint_tool.run(found_files.restricted_to([])) == []
 
     def test_ignore_code(self) -> None:
         pylint_tool, _ = _get_pylint_tool_and_prospector_config()